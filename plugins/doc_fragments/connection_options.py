@@ -49,4 +49,117 @@ class ModuleDocFragment(object):
             type: int
             default: 30
             description: BMC REST API request timeout.
+          keep_alive:
+            type: bool
+            default: True
+            description:
+              - Reuse HTTP(S) connections to the BMC between requests instead of
+                connecting and passing TLS handshake for each of them.
+              - Connections are not reused if the BMC is accessed through a proxy.
+          collection_workers:
+            type: int
+            default: 4
+            description:
+              - Maximum number of collection members (DIMMs, processors, firmware images, etc.)
+                requested from the BMC at the same time.
+              - Set to 1 to read collections sequentially.
+          session_auth:
+            type: bool
+            default: True
+            description:
+              - If I(username) and I(password) are set, log in with a Redfish session and
+                authenticate following requests with its token instead of credentials.
+              - Session is closed when module finishes, unless I(session_cache) is enabled.
+              - Expired session is re-created automatically.
+          session_cache:
+            type: bool
+            default: False
+            description:
+              - Keep session token on the control node, so following tasks for the same BMC
+                and credentials reuse the session instead of creating a new one.
+          session_cache_ttl:
+            type: int
+            default: 300
+            description:
+              - Seconds the cached session token is reused for.
+              - Should be less than the BMC session timeout.
+          session_cache_dir:
+            type: path
+            default: ~/.ansible/yadro_obmc/sessions
+            description: Directory for cached session tokens. Created with owner-only permissions.
+          discovery_cache:
+            type: bool
+            default: False
+            description:
+              - Keep service root of the BMC, with supported protocol features, on the control node,
+                so following tasks don't request it.
+              - Schema versions of resources read from the BMC are saved with it, so implementations of these versions are selected up front by following tasks.
+          discovery_cache_ttl:
+            type: int
+            default: 3600
+            description:
+              - Seconds the cached service root is used for.
+              - Should be reduced if BMC firmware may be updated by other tools.
+          discovery_cache_dir:
+            type: path
+            default: ~/.ansible/yadro_obmc/discovery
+            description: Directory for cached service roots. Created with owner-only permissions.
+          retry_attempts:
+            type: int
+            default: 3
+            description:
+              - Number of attempts to send a request which failed to connect, timed out or was
+                answered with 429, 502, 503 or 504, e.g. while BMC web server restarts.
+              - Set to 1 to disable retries.
+          retry_backoff:
+            type: float
+            default: 1.0
+            description:
+              - Base delay in seconds between attempts. Delay is doubled after each attempt and
+                randomized, delay requested by the BMC with Retry-After header is honored.
+          retry_methods:
+            type: list
+            elements: str
+            default: [GET, HEAD, OPTIONS, PUT, DELETE]
+            description:
+              - HTTP methods of requests which are retried.
+              - Only idempotent methods are retried by default, as repeated POST or PATCH
+                may be applied twice.
+          retry_budget:
+            type: int
+            default: 10
+            description: Maximum number of retries to the BMC during the task.
+          max_in_flight:
+            type: int
+            default: 0
+            description:
+              - Maximum number of requests sent to the BMC at the same time, by all tasks and
+                processes on the control node which use the same I(limit_dir).
+              - BMC web servers handle few connections, so this limit allows to raise
+                I(collection_workers) and the number of forks safely.
+              - Zero disables the limit.
+          rate_limit:
+            type: float
+            default: 0
+            description:
+              - Maximum average number of requests per second sent to the BMC, shared the same
+                way as I(max_in_flight). Bursts of up to one second of requests are allowed.
+              - Zero disables the limit.
+          limit_dir:
+            type: path
+            default: ~/.ansible/yadro_obmc/limits
+            description: Directory for lock files which share request limits between processes.
+          trace:
+            type: bool
+            default: False
+            description:
+              - Record method, path, status, sizes, retries and durations (DNS resolve, connect,
+                TLS handshake, first byte and total) of each request to the BMC.
+              - Records are returned in C(redfish_trace).
+              - Connection setup is measured only if I(keep_alive) is enabled.
+          trace_file:
+            type: path
+            description:
+              - Append request records to the file as JSON lines, e.g. to profile many runs.
+              - Records hold BMC hostname and are written even if I(trace) is disabled.
 """
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r"""
+    options:
+      connections:
+        required: True
+        type: list
+        elements: dict
+        description:
+          - List of BMC connection configurations, one for each server.
+          - Each of them takes the same options as I(connection) of other modules of the collection.
+        suboptions:
+          hostname:
+            required: True
+            type: str
+            description: BMC server IP address or hostname.
+          username:
+            type: str
+            description: BMC username to login.
+          password:
+            type: str
+            description: BMC user password.
+          session_key:
+            type: str
+            description: BMC session key.
+          port:
+            type: int
+            default: 443
+            description: BMC REST API port.
+          validate_certs:
+            type: bool
+            default: True
+            description: Responsible for SSL certificates validation.
+          timeout:
+            type: int
+            default: 30
+            description: BMC REST API request timeout.
+          keep_alive:
+            type: bool
+            default: True
+            description: Reuse HTTP(S) connections to the BMC between requests.
+          collection_workers:
+            type: int
+            default: 4
+            description: Maximum number of collection members requested from the BMC at the same time.
+          session_auth:
+            type: bool
+            default: True
+            description: Authenticate requests with a Redfish session token instead of credentials.
+          session_cache:
+            type: bool
+            default: False
+            description: Keep session token on the control node for following tasks.
+          session_cache_ttl:
+            type: int
+            default: 300
+            description: Seconds the cached session token is reused for.
+          session_cache_dir:
+            type: path
+            default: ~/.ansible/yadro_obmc/sessions
+            description: Directory for cached session tokens.
+          discovery_cache:
+            type: bool
+            default: False
+            description: Keep service root of the BMC on the control node for following tasks.
+          discovery_cache_ttl:
+            type: int
+            default: 3600
+            description: Seconds the cached service root is used for.
+          discovery_cache_dir:
+            type: path
+            default: ~/.ansible/yadro_obmc/discovery
+            description: Directory for cached service roots.
+          retry_attempts:
+            type: int
+            default: 3
+            description: Number of attempts to send a request which failed with a transient error.
+          retry_backoff:
+            type: float
+            default: 1.0
+            description: Base delay in seconds between attempts, doubled after each attempt.
+          retry_methods:
+            type: list
+            elements: str
+            default: [GET, HEAD, OPTIONS, PUT, DELETE]
+            description: HTTP methods of requests which are retried.
+          retry_budget:
+            type: int
+            default: 10
+            description: Maximum number of retries to the BMC during the task.
+          max_in_flight:
+            type: int
+            default: 0
+            description: Maximum number of requests sent to the BMC at the same time. Zero disables the limit.
+          rate_limit:
+            type: float
+            default: 0
+            description: Maximum average number of requests per second sent to the BMC. Zero disables the limit.
+          limit_dir:
+            type: path
+            default: ~/.ansible/yadro_obmc/limits
+            description: Directory for lock files which share request limits between processes.
+          trace:
+            type: bool
+            default: False
+            description:
+              - Record method, path, status, sizes, retries and durations of each request to the BMC.
+              - Records are returned in C(redfish_trace) of the server result.
+          trace_file:
+            type: path
+            description: Append request records to the file as JSON lines.
+"""
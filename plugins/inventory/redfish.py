@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: redfish
+short_description: OpenBmc inventory source.
+version_added: "1.2.0"
+description:
+  - Builds inventory of servers from their BMCs. Servers are requested concurrently.
+  - Host variables and groups are built from manufacturer, model, power state,
+    BMC firmware version and health of the server.
+  - With inventory cache enabled, server data is requested again only after I(refresh_ttl)
+    and is revalidated with ETags, so unchanged resources are not transferred.
+  - Inventory is built after I(max_wait) seconds at most. Servers which didn't respond by then
+    keep cached data or are added to C(obmc_unreachable) group.
+  - The inventory file name must end with C(redfish.yml) or C(redfish.yaml).
+author: "Radmir Safin (@radmirsafin)"
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    required: True
+    type: str
+    choices: ["yadro.obmc.redfish"]
+    description: Token that ensures this is a source file for the plugin.
+  hosts:
+    required: True
+    type: list
+    elements: raw
+    description:
+      - BMCs to build inventory from.
+      - Element is either BMC hostname or dictionary with I(hostname) key and optional
+        I(name) of the inventory host and I(port).
+  username:
+    type: str
+    description: BMC username to login.
+    env:
+      - name: OBMC_USERNAME
+  password:
+    type: str
+    description: BMC user password.
+    env:
+      - name: OBMC_PASSWORD
+  port:
+    type: int
+    default: 443
+    description: BMC REST API port.
+  validate_certs:
+    type: bool
+    default: True
+    description: Responsible for SSL certificates validation.
+  timeout:
+    type: int
+    default: 30
+    description: BMC REST API request timeout.
+  max_concurrency:
+    type: int
+    default: 32
+    description: Maximum number of BMCs requested at the same time.
+  max_wait:
+    type: int
+    default: 60
+    description: Seconds to wait for BMCs before building the inventory.
+  refresh_ttl:
+    type: int
+    default: 300
+    description:
+      - Seconds cached server data is used without requesting the BMC.
+      - Actual only with inventory cache enabled.
+  group_by_facts:
+    type: bool
+    default: True
+    description:
+      - Add hosts to groups by manufacturer, model, power state, BMC firmware version and health,
+        e.g. C(obmc_power_state_on).
+"""
+
+EXAMPLES = r"""
+---
+# redfish.yml
+plugin: yadro.obmc.redfish
+hosts:
+  - bmc01.example.com
+  - name: node02
+    hostname: 10.0.0.2
+username: root
+password: "{{ lookup('env', 'BMC_PASSWORD') }}"
+cache: True
+cache_plugin: jsonfile
+cache_connection: ~/.ansible/inventory_cache
+refresh_ttl: 600
+keyed_groups:
+  - key: obmc_bios_version
+    prefix: bios
+"""
+
+import time
+from ansible.errors import AnsibleParserError
+from ansible.module_utils.six import string_types
+from ansible.plugins.inventory import BaseInventoryPlugin, Constructable, Cacheable
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.cache import get_etag
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.concurrency import map_with_deadline
+
+# Resources read from each BMC with properties kept in the inventory cache.
+RESOURCES = {
+    "system": ("/redfish/v1/Systems/system", ["Manufacturer", "Model", "SerialNumber", "PowerState", "BiosVersion", "Status"]),
+    "manager": ("/redfish/v1/Managers/bmc", ["FirmwareVersion", "Status"]),
+}
+
+# Host variables hosts are grouped by, with group name prefixes.
+FACT_GROUPS = [
+    ("obmc_manufacturer", "obmc_manufacturer"),
+    ("obmc_model", "obmc_model"),
+    ("obmc_power_state", "obmc_power_state"),
+    ("obmc_firmware_version", "obmc_firmware"),
+    ("obmc_health", "obmc_health"),
+]
+
+
+def get_host_facts(entry):
+    system = entry["resources"]["system"]["data"]
+    manager = entry["resources"]["manager"]["data"]
+    system_status = system.get("Status") or {}
+    return {
+        "obmc_manufacturer": system.get("Manufacturer"),
+        "obmc_model": system.get("Model"),
+        "obmc_serial_number": system.get("SerialNumber"),
+        "obmc_power_state": system.get("PowerState"),
+        "obmc_bios_version": system.get("BiosVersion"),
+        "obmc_health": system_status.get("HealthRollup") or system_status.get("Health"),
+        "obmc_firmware_version": manager.get("FirmwareVersion"),
+        "obmc_bmc_health": (manager.get("Status") or {}).get("Health"),
+    }
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = "yadro.obmc.redfish"
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("redfish.yml", "redfish.yaml"))
+        return False
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache")
+        entries = {}
+        if use_cache and cache:
+            try:
+                entries = self._cache[cache_key]
+            except KeyError:
+                pass
+
+        hosts = self._get_hosts()
+        entries = self._refresh(hosts, entries)
+        if use_cache:
+            self._cache[cache_key] = entries
+        self._populate(hosts, entries)
+
+    def _get_hosts(self):
+        hosts = []
+        for host in self.get_option("hosts"):
+            if isinstance(host, string_types):
+                host = {"hostname": host}
+            if not isinstance(host, dict) or not host.get("hostname"):
+                raise AnsibleParserError("Invalid host in inventory: {0}".format(host))
+            hosts.append({
+                "name": host.get("name") or host["hostname"],
+                "hostname": host["hostname"],
+                "port": host.get("port") or self.get_option("port"),
+            })
+        return hosts
+
+    def _refresh(self, hosts, entries):
+        """Requests BMCs of hosts whose data is older than refresh_ttl. Returns new entries by host name."""
+        now = time.time()
+        outdated = [host for host in hosts if now - entries.get(host["name"], {}).get("checked", 0) >= self.get_option("refresh_ttl")]
+        results = map_with_deadline(
+            lambda host: self._refresh_host(host, entries.get(host["name"])),
+            outdated,
+            self.get_option("max_concurrency"),
+            self.get_option("max_wait"),
+        )
+
+        new_entries = dict((host["name"], entries[host["name"]]) for host in hosts if host["name"] in entries)
+        for index, host in enumerate(outdated):
+            if index in results:
+                new_entries[host["name"]] = results[index]
+            else:
+                entry = dict(new_entries.get(host["name"], {}))
+                entry["error"] = "BMC didn't respond in {0} seconds".format(self.get_option("max_wait"))
+                new_entries[host["name"]] = entry
+        return new_entries
+
+    def _refresh_host(self, host, entry):
+        """Reads resources of a host. Resources are revalidated with ETags if they were read before."""
+        try:
+            client = RESTClient(
+                hostname=host["hostname"],
+                port=host["port"],
+                validate_certs=self.get_option("validate_certs"),
+                timeout=self.get_option("timeout"),
+                auth=BasicAuth(self.get_option("username"), self.get_option("password")),
+                keep_alive=True,
+            )
+            resources = {}
+            for key, (path, properties) in RESOURCES.items():
+                cached = ((entry or {}).get("resources") or {}).get(key)
+                if cached and cached.get("etag"):
+                    response = client.get_if_modified(path, cached["etag"])
+                    if response is None:
+                        resources[key] = cached
+                        continue
+                else:
+                    response = client.get(path)
+                data = response.json
+                resources[key] = {
+                    "etag": get_etag(response),
+                    "data": dict((name, data[name]) for name in properties if name in data),
+                }
+            return {"checked": time.time(), "resources": resources}
+        except Exception as e:
+            # Previous data is kept and is requested again on the next run.
+            new_entry = dict(entry or {})
+            new_entry["error"] = str(e)
+            return new_entry
+
+    def _populate(self, hosts, entries):
+        strict = self.get_option("strict")
+        for host in hosts:
+            name = host["name"]
+            entry = entries.get(name, {})
+            self.inventory.add_host(name)
+
+            hostvars = {"obmc_hostname": host["hostname"]}
+            if entry.get("resources"):
+                hostvars.update(get_host_facts(entry))
+            else:
+                self.inventory.add_group("obmc_unreachable")
+                self.inventory.add_child("obmc_unreachable", name)
+            if entry.get("error"):
+                hostvars["obmc_error"] = entry["error"]
+            for var_name, value in hostvars.items():
+                self.inventory.set_variable(name, var_name, value)
+
+            if self.get_option("group_by_facts"):
+                for var_name, prefix in FACT_GROUPS:
+                    if hostvars.get(var_name):
+                        group = self._sanitize_group_name("{0}_{1}".format(prefix, hostvars[var_name]))
+                        self.inventory.add_group(group)
+                        self.inventory.add_child(group, name)
+
+            self._set_composite_vars(self.get_option("compose"), hostvars, name, strict=strict)
+            self._add_host_to_composed_groups(self.get_option("groups"), hostvars, name, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option("keyed_groups"), hostvars, name, strict=strict)
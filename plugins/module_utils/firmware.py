@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Callable, Optional, Set, Any, Dict, List, Tuple, Iterator
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Callable = Optional = Set = Any = Dict = List = Tuple = Iterator = None
+
+import os
+import math
+import threading
+import shutil
+import tempfile
+from io import open
+from contextlib import contextmanager
+from ansible.module_utils.urls import open_url
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.yadro.obmc.plugins.module_utils.image_cache import ImageCache, ImageChecksumError, verify_checksum
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.redfish import RedfishAPI
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishError, RedfishTimeoutError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.concurrency import map_concurrently
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.tracking import EventListener, wait_until
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.task.task import Task
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.update.service import UpdateService
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.update.software_inventory import SoftwareInventory
+
+BMC_ACTIVE_ID = 'bmc_active'
+BIOS_ACTIVE_ID = 'bios_active'
+BMC_IMAGE_DESC = 'BMC image'
+BIOS_IMAGE_DESC = 'Host image'
+ACTIVATION_ACTIVE = 'xyz.openbmc_project.Software.Activation.Activations.Active'
+
+
+class FirmwareUpdateError(RedfishError):
+    """Update step failure, reported by modules with fail_json arguments."""
+
+    def __init__(self, msg, error, changed):  # type: (str, str, bool) -> None
+        super(FirmwareUpdateError, self).__init__(msg)
+        self.msg = msg
+        self.error = error
+        self.changed = changed
+
+
+def is_remote_image(image_path):  # type: (str) -> bool
+    return image_path.startswith(('http://', 'https://'))
+
+
+def open_remote_image(image_path, validate_certs):  # type: (str, bool) -> Any
+    try:
+        return open_url(
+            url=image_path,
+            method='GET',
+            validate_certs=validate_certs,
+            timeout=60,
+        )
+    except HTTPError as e:
+        error = str(e)
+        msg = 'Error while getting image from {0}'.format(image_path)
+    except URLError as e:
+        error = str(e.reason)
+        msg = 'Error while getting image from {0}'.format(image_path)
+    except Exception as e:
+        error = str(e)
+        msg = 'Unexpected error while getting image from {0}'.format(image_path)
+    raise FirmwareUpdateError(msg=msg, error=error, changed=False)
+
+
+def head_remote_image(image_path, validate_certs):  # type: (str, bool) -> Any
+    """Returns current response headers of remote image, None if they can't be received."""
+    try:
+        return open_url(
+            url=image_path,
+            method='HEAD',
+            validate_certs=validate_certs,
+            timeout=60,
+        ).info()
+    except Exception:
+        return None
+
+
+def download_image(image_path, validate_certs, directory=None):  # type: (str, bool, Optional[str]) -> str
+    """Saves remote image to a temporary file, so it can be uploaded to many servers. Caller removes the file."""
+    response = open_remote_image(image_path, validate_certs)
+    try:
+        fd, local_path = tempfile.mkstemp(dir=directory, suffix='.image')
+        try:
+            with os.fdopen(fd, 'wb') as image:
+                shutil.copyfileobj(response, image)
+        except Exception:
+            os.remove(local_path)
+            raise
+    except (IOError, OSError) as e:
+        raise FirmwareUpdateError(msg='Error while saving image {0}'.format(image_path), error=str(e), changed=False)
+    return local_path
+
+
+@contextmanager
+def prepare_image(image_path, validate_certs, checksum=None, cache=None, download=False):
+    # type: (str, bool, Optional[str], Optional[ImageCache], bool) -> Iterator[str]
+    """Yields path to upload the image from.
+
+    Remote image is taken from the cache, if given, and kept there until the block exits.
+    Otherwise it's downloaded to a temporary file, removed on exit, when checksum is verified
+    or download is set, so the image is requested once for many servers.
+    """
+    lease = None
+    temporary_path = None
+    try:
+        try:
+            if is_remote_image(image_path):
+                if cache is not None:
+                    lease = cache.lease(
+                        image_path,
+                        lambda: open_remote_image(image_path, validate_certs),
+                        checksum=checksum,
+                        head=lambda: head_remote_image(image_path, validate_certs),
+                    )
+                    image_path = lease.__enter__()
+                elif checksum or download:
+                    image_path = temporary_path = download_image(image_path, validate_certs)
+                    if checksum:
+                        verify_checksum(temporary_path, checksum)
+
+            elif checksum:
+                if image_path.startswith('tftp://'):
+                    raise FirmwareUpdateError(
+                        error='Checksum of tftp image can not be verified',
+                        msg='Image is downloaded from tftp server by BMC, checksum is supported for other locations only',
+                        changed=False,
+                    )
+                if os.path.isfile(image_path):
+                    verify_checksum(image_path, checksum)
+
+        except ImageChecksumError as e:
+            raise FirmwareUpdateError(msg='Image checksum verification failed', error=str(e), changed=False)
+        except ValueError as e:
+            raise FirmwareUpdateError(msg='Invalid checksum', error=str(e), changed=False)
+        except (IOError, OSError) as e:
+            raise FirmwareUpdateError(msg='Error while saving image {0}'.format(image_path), error=str(e), changed=False)
+
+        yield image_path
+    finally:
+        if lease is not None:
+            lease.__exit__(None, None, None)
+        if temporary_path is not None:
+            os.remove(temporary_path)
+
+
+def upload_image(update_service, image_path, validate_certs):
+    # type: (UpdateService, str, bool) -> Optional[Task]
+    """Uploads image from local path, http(s) or tftp server. Returns task tracking the update, if any."""
+    if os.path.exists(image_path):
+        if not os.path.isfile(image_path):
+            raise FirmwareUpdateError(
+                error='Wrong local path was given',
+                msg='{0} is not a file. Path to image file is required'.format(image_path),
+                changed=False,
+            )
+
+        # Image is streamed from file in chunks instead of being read into memory
+        with open(image_path, 'rb') as file:
+            return update_service.upload_image(file)
+
+    elif is_remote_image(image_path):
+        response = open_remote_image(image_path, validate_certs)
+        length = response.headers.get('Content-Length')
+        if length is not None:
+            # Image is piped from the source to the BMC without buffering
+            return update_service.upload_image(response, length=int(length))
+        # Upload requires image size, so image of unknown size is spooled to disk
+        with tempfile.TemporaryFile() as image:
+            shutil.copyfileobj(response, image)
+            image.seek(0)
+            return update_service.upload_image(image)
+
+    elif image_path.startswith('tftp://'):
+        return update_service.simple_update(image_path)
+
+    raise FirmwareUpdateError(
+        error='Unknown image location {0}'.format(image_path),
+        msg='Only http, https, tftp ot local system location are supported',
+        changed=False,
+    )
+
+
+class FirmwareUpdater:
+    """Updates firmware of a single server: uploads image, waits for its activation and
+    restarts updated device. Failures are raised as FirmwareUpdateError.
+
+    Progress is reported to on_stage callback with stage names: uploading, waiting_image,
+    activating, rebooting.
+    """
+
+    def __init__(self, redfish, upload_timeout, activate_timeout, on_stage=None):
+        # type: (RedfishAPI, int, int, Optional[Callable[[str], None]]) -> None
+        self.redfish = redfish
+        self.upload_timeout = upload_timeout
+        self.activate_timeout = activate_timeout
+        self._on_stage = on_stage
+
+    def _set_stage(self, stage):  # type: (str) -> None
+        if self._on_stage is not None:
+            self._on_stage(stage)
+
+    def check_host_powered_off(self):  # type: () -> None
+        system = self.redfish.get_system('system')
+        if system.get_power_state() != 'Off':
+            raise FirmwareUpdateError(
+                error='Host is not powered off',
+                msg='Host must be powered off for updating firmware',
+                changed=False,
+            )
+
+    def update(self, image_path, validate_certs=True):  # type: (str, bool) -> SoftwareInventory
+        """Runs the whole update and returns the new image."""
+        # Save initial images identifiers for
+        # determine new uploaded image
+        init_img_ids = set(self.redfish.get_update_service().get_firmware_inventory_ids())
+
+        # Events only speed up polling, update is tracked without them too
+        listener = self.redfish.listen_events()
+        try:
+            self._set_stage('uploading')
+            task = upload_image(self.redfish.get_update_service(), image_path, validate_certs)
+            if task is not None:
+                self._wait_task(task, listener)
+
+            self._set_stage('waiting_image')
+            new_image = self._determine_new_image(init_img_ids, listener)
+
+            self._set_stage('activating')
+            self._wait_image_activation(new_image, listener)
+        finally:
+            if listener is not None:
+                listener.close()
+
+        self._set_stage('rebooting')
+        self._reboot_updated_device(new_image)
+        return new_image
+
+    def _wait_task(self, task, listener):  # type: (Task, Optional[EventListener]) -> None
+        # Update task is finished by the BMC when the image is activated,
+        # so only the task is polled until then.
+        def is_finished():
+            try:
+                task.reload()
+            except ValueError:
+                # Empty body, e.g. 204 No Content while the task is being created
+                return False
+            return task.is_finished()
+
+        try:
+            wait_until(is_finished, self.upload_timeout + self.activate_timeout, listener=listener)
+        except RedfishTimeoutError:
+            # Task may be lost on BMC side, image is looked for anyway
+            return
+
+        if task.is_failed():
+            raise FirmwareUpdateError(
+                error='Update task failed',
+                msg='Firmware update failed: {messages}'.format(
+                    messages='; '.join(m.get('Message', '') for m in task.get_messages())),
+                changed=True,
+            )
+
+    def _determine_new_image(self, init_img_ids, listener):
+        # type: (Set[str], Optional[EventListener]) -> SoftwareInventory
+        # We have to wait until image will be uploaded. Generally, it is
+        # actual for tftp download, which is really long and processing
+        # on the server's side. This is the reason for a big timeout.
+        # Only inventory collection is read until new image appears.
+        upd_service = self.redfish.get_update_service()
+
+        def find_new_image():
+            current_img_ids = set(upd_service.get_firmware_inventory_ids())
+            new_img_ids = current_img_ids - init_img_ids - {BMC_ACTIVE_ID, BIOS_ACTIVE_ID}
+            for image_id in sorted(new_img_ids):
+                return upd_service.get_firmware_inventory(image_id)
+            return None
+
+        try:
+            return wait_until(find_new_image, self.upload_timeout, listener=listener)
+        except RedfishTimeoutError:
+            raise FirmwareUpdateError(
+                error='Timeout error',
+                msg='New image was not found or was not '
+                    'upload for {timeout} seconds'.format(timeout=self.upload_timeout),
+                changed=True,
+            )
+
+    def _wait_image_activation(self, image, listener):
+        # type: (SoftwareInventory, Optional[EventListener]) -> None
+        try:
+            wait_until(
+                lambda: image.get_activation() == ACTIVATION_ACTIVE,
+                self.activate_timeout,
+                listener=listener,
+            )
+        except RedfishTimeoutError:
+            raise FirmwareUpdateError(
+                error='Timeout error',
+                msg='Image {id} was not found in Active status'.format(id=image.get_id()),
+                changed=True,
+            )
+
+    def _reboot_updated_device(self, image):  # type: (SoftwareInventory) -> None
+        description = image.get_description()
+
+        if description == BMC_IMAGE_DESC:
+            manager = self.redfish.get_manager('bmc')
+            manager.reset_graceful()
+
+        elif description == BIOS_IMAGE_DESC:
+            system = self.redfish.get_system('system')
+            system.power_on_graceful()
+
+        else:
+            raise FirmwareUpdateError(
+                error='Could not recognize image description',
+                msg='New image description is {new_desc}. '
+                    'Expected: {exp_desc}. '
+                    'Host and BMC were not restarted'.format(
+                        new_desc=description,
+                        exp_desc=(BMC_IMAGE_DESC, BIOS_IMAGE_DESC)),
+                changed=True,  # Image was uploaded without restart
+            )
+
+
+def plan_batches(hosts_count, canary_count=0, batch_percentage=100):  # type: (int, int, int) -> List[int]
+    """Splits hosts into batch sizes: canary batch first, then batches of batch_percentage of the rest."""
+    batches = []
+    canary_count = min(max(canary_count, 0), hosts_count)
+    if canary_count:
+        batches.append(canary_count)
+
+    remaining = hosts_count - canary_count
+    batch_size = max(1, int(math.ceil(remaining * min(max(batch_percentage, 1), 100) / 100.0)))
+    while remaining > 0:
+        batches.append(min(batch_size, remaining))
+        remaining -= batches[-1]
+    return batches
+
+
+class FirmwareRollout:
+    """Updates firmware of many servers from a single process.
+
+    Servers are updated in batches, up to max_concurrency of them at the same time. Failed canary
+    batch or more than max_fail_percentage of failed servers stop the rollout, servers of the
+    following batches are reported as skipped.
+
+    State of each server is kept in a dict with keys: hostname, state (pending, updating, updated,
+    failed, skipped), stage, changed, image_id, msg and error.
+    """
+
+    def __init__(self, connect, hostnames, upload_timeout, activate_timeout, max_concurrency=8,
+                 canary_count=0, batch_percentage=100, max_fail_percentage=0):
+        # type: (Callable[[int], RedfishAPI], List[str], int, int, int, int, int, int) -> None
+        self._connect = connect
+        self.upload_timeout = upload_timeout
+        self.activate_timeout = activate_timeout
+        self.max_concurrency = max_concurrency
+        self.canary_count = canary_count
+        self.batch_percentage = batch_percentage
+        self.max_fail_percentage = max_fail_percentage
+        self.hosts = [{
+            "hostname": hostname,
+            "state": "pending",
+            "stage": None,
+            "changed": False,
+            "image_id": None,
+            "msg": None,
+            "error": None,
+        } for hostname in hostnames]  # type: List[Dict[str, Any]]
+        self._lock = threading.Lock()
+
+    def get_failed_count(self):  # type: () -> int
+        return len([host for host in self.hosts if host["state"] == "failed"])
+
+    def run(self, image_path, validate_certs=True):  # type: (str, bool) -> List[Dict[str, Any]]
+        """Updates all servers with local or tftp image and returns their states."""
+        start = 0
+        for index, batch_size in enumerate(plan_batches(len(self.hosts), self.canary_count, self.batch_percentage)):
+            indexes = range(start, start + batch_size)
+            start += batch_size
+            map_concurrently(lambda i: self._update_host(i, image_path, validate_certs), indexes, self.max_concurrency)
+
+            failed_count = self.get_failed_count()
+            canary_failed = index == 0 and self.canary_count > 0 and failed_count > 0
+            if canary_failed or failed_count * 100 > self.max_fail_percentage * len(self.hosts):
+                break
+
+        for host in self.hosts[start:]:
+            host.update(state="skipped", msg="Rollout was stopped because of failed updates")
+        return self.hosts
+
+    def _set_host(self, index, **kwargs):  # type: (int, Any) -> None
+        with self._lock:
+            self.hosts[index].update(kwargs)
+
+    def _update_host(self, index, image_path, validate_certs):  # type: (int, str, bool) -> None
+        # Errors are kept in host state, so other servers are updated anyway.
+        self._set_host(index, state="updating", stage="connecting")
+        try:
+            redfish = self._connect(index)
+            try:
+                updater = FirmwareUpdater(
+                    redfish,
+                    upload_timeout=self.upload_timeout,
+                    activate_timeout=self.activate_timeout,
+                    on_stage=lambda stage: self._set_host(index, stage=stage),
+                )
+                updater.check_host_powered_off()
+                new_image = updater.update(image_path, validate_certs=validate_certs)
+            finally:
+                redfish.logout()
+        except FirmwareUpdateError as e:
+            self._set_host(index, state="failed", changed=e.changed, msg=e.msg, error=e.error)
+        except Exception as e:
+            changed = self.hosts[index]["stage"] not in ("connecting", None)
+            self._set_host(index, state="failed", changed=changed, msg="Operation failed.", error=str(e))
+        else:
+            self._set_host(index, state="updated", changed=True, image_id=new_image.get_id(), msg="Operation successful.")
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Callable, Optional, IO, Dict, Iterator, Tuple, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Callable = Optional = IO = Dict = Iterator = Tuple = Any = None
+
+import os
+import json
+import errno
+import fcntl
+import hashlib
+import tempfile
+from contextlib import contextmanager
+
+DEFAULT_IMAGE_CACHE_DIR = "~/.ansible/yadro_obmc/images"
+DEFAULT_IMAGE_CACHE_SIZE = 4096  # megabytes
+
+_CHUNK_SIZE = 1024 * 1024
+
+# Response headers identifying version of remote image.
+_VALIDATOR_HEADERS = ("ETag", "Last-Modified", "Content-Length")
+
+
+class ImageChecksumError(Exception):
+
+    def __init__(self, expected, actual):  # type: (str, str) -> None
+        super(ImageChecksumError, self).__init__(
+            "Image checksum mismatch: expected sha256 {0}, got {1}".format(expected, actual))
+        self.expected = expected
+        self.actual = actual
+
+
+def parse_checksum(checksum):  # type: (str) -> str
+    """Returns hex digest from 'sha256:<hex>' or '<hex>' string."""
+    algorithm, _, digest = checksum.strip().rpartition(":")
+    if algorithm not in ("", "sha256"):
+        raise ValueError("Unsupported checksum algorithm: {0}. Only sha256 is supported".format(algorithm))
+    digest = digest.lower()
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise ValueError("Invalid sha256 checksum: {0}".format(checksum))
+    return digest
+
+
+def file_sha256(path):  # type: (str) -> str
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def verify_checksum(path, checksum):  # type: (str, str) -> None
+    expected = parse_checksum(checksum)
+    actual = file_sha256(path)
+    if actual != expected:
+        raise ImageChecksumError(expected, actual)
+
+
+def get_image_validators(headers):  # type: (Any) -> Dict[str, str]
+    """Returns ETag, Last-Modified and Content-Length of remote image from response headers.
+
+    Empty dict is returned if there is neither ETag nor Last-Modified, as image can't be revalidated then.
+    """
+    if headers is None:
+        return {}
+    validators = dict((name, headers.get(name)) for name in _VALIDATOR_HEADERS if headers.get(name))
+    if "ETag" not in validators and "Last-Modified" not in validators:
+        return {}
+    return validators
+
+
+class ImageCache:
+    """Keeps downloaded firmware images on the control node, so every image is fetched once
+    and then uploaded to any number of servers from disk.
+
+    Images are stored by content digest, URLs refer to digests of their images. Checksum pins
+    the expected image. Without it, image cached for a URL is reused only while the server
+    reports the same ETag, Last-Modified and Content-Length as when it was fetched, so image
+    republished at the same URL is fetched again. Least recently used images are removed
+    when the cache exceeds max_size bytes, except images leased by running tasks.
+
+    Downloads of the same image are serialized with its own file lock, so parallel tasks wait
+    for the first download instead of fetching it again, while other images are fetched in
+    parallel. Cache-wide lock is taken only to update the cache and evict images.
+    """
+
+    def __init__(self, directory=DEFAULT_IMAGE_CACHE_DIR, max_size=DEFAULT_IMAGE_CACHE_SIZE * 1024 * 1024):
+        # type: (str, int) -> None
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self._objects_dir = os.path.join(self.directory, "objects")
+        self._urls_dir = os.path.join(self.directory, "urls")
+        self._locks_dir = os.path.join(self.directory, "locks")
+
+    def get(self, url, fetch, checksum=None, head=None):
+        # type: (str, Callable[[], IO[bytes]], Optional[str], Optional[Callable[[], Any]]) -> str
+        """Returns path to cached image of the URL, fetching it if needed.
+
+        Returned image may be evicted by other tasks, use lease to keep it while it's read.
+        """
+        with self.lease(url, fetch, checksum=checksum, head=head) as path:
+            return path
+
+    @contextmanager
+    def lease(self, url, fetch, checksum=None, head=None):
+        # type: (str, Callable[[], IO[bytes]], Optional[str], Optional[Callable[[], Any]]) -> Iterator[str]
+        """Yields path to cached image of the URL, fetching it if needed. Image isn't evicted until the block exits.
+
+        fetch is called on cache miss and must return readable image stream. head returns current
+        response headers of the URL, used to revalidate image cached without checksum.
+        """
+        expected = parse_checksum(checksum) if checksum else None
+        for directory in (self._objects_dir, self._urls_dir, self._locks_dir):
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+
+        with self._locked(self._get_lock_path(expected or url)):
+            entry = self._get_url_entry(url)
+            validators = None
+            if not expected and entry and entry["validators"] and head is not None:
+                validators = get_image_validators(head())
+            with self._locked(os.path.join(self.directory, ".lock")):
+                image = self._find(url, entry, expected, validators)
+
+            if image is None:
+                digest, new_validators, part = self._download(fetch, expected)
+                with self._locked(os.path.join(self.directory, ".lock")):
+                    path = self._get_object_path(digest)
+                    with part:
+                        os.rename(part.name, path)
+                    self._set_url_entry(url, digest, new_validators)
+                    self._evict(keep=digest)
+                    image = self._open_leased(path)
+
+        try:
+            yield image.name
+        finally:
+            image.close()
+
+    @staticmethod
+    @contextmanager
+    def _locked(path):  # type: (str) -> Iterator[None]
+        with open(path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _open_leased(path):  # type: (str) -> IO[bytes]
+        # Shared lock of the image keeps it from eviction by other tasks.
+        image = open(path, "rb")
+        fcntl.flock(image, fcntl.LOCK_SH)
+        return image
+
+    def _find(self, url, entry, expected, validators):
+        # type: (str, Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, str]]) -> Optional[IO[bytes]]
+        if expected:
+            digest = expected
+        elif entry and entry["validators"] and validators == entry["validators"]:
+            digest = entry["digest"]
+        else:
+            return None
+
+        path = self._get_object_path(digest)
+        if not os.path.isfile(path):
+            return None
+        os.utime(path, None)
+        if not entry or entry["digest"] != digest:
+            # Image found by checksum, it's not known which version the URL serves now.
+            self._set_url_entry(url, digest, {})
+        return self._open_leased(path)
+
+    def _get_object_path(self, digest):  # type: (str) -> str
+        return os.path.join(self._objects_dir, digest)
+
+    def _get_lock_path(self, key):  # type: (str) -> str
+        return os.path.join(self._locks_dir, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def _get_url_entry_path(self, url):  # type: (str) -> str
+        return os.path.join(self._urls_dir, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def _get_url_entry(self, url):  # type: (str) -> Optional[Dict[str, Any]]
+        try:
+            with open(self._get_url_entry_path(url)) as f:
+                entry = json.load(f)
+            return {"digest": entry["digest"], "validators": entry["validators"]}
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _set_url_entry(self, url, digest, validators):  # type: (str, str, Dict[str, str]) -> None
+        # Entry is replaced at once, as it's read without cache lock.
+        fd, tmp_path = tempfile.mkstemp(dir=self._urls_dir)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"digest": digest, "validators": validators}, f)
+        os.rename(tmp_path, self._get_url_entry_path(url))
+
+    def _download(self, fetch, expected):
+        # type: (Callable[[], IO[bytes]], Optional[str]) -> Tuple[str, Dict[str, str], IO[bytes]]
+        """Fetches image into partial file, which is returned open and locked, so it isn't swept until renamed."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        os.close(fd)
+        part = open(tmp_path, "wb")
+        try:
+            fcntl.flock(part, fcntl.LOCK_EX)
+            source = fetch()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                part.write(chunk)
+            part.flush()
+            actual = digest.hexdigest()
+            if expected is not None and actual != expected:
+                raise ImageChecksumError(expected, actual)
+            return actual, get_image_validators(source.info() if hasattr(source, "info") else None), part
+        except Exception:
+            part.close()
+            os.remove(tmp_path)
+            raise
+
+    def _evict(self, keep):  # type: (str) -> None
+        # Partial files left by interrupted downloads aren't locked by any task.
+        for name in os.listdir(self.directory):
+            if name.endswith(".part"):
+                self._remove_unleased(os.path.join(self.directory, name))
+
+        entries = []
+        for name in os.listdir(self._objects_dir):
+            stat = os.stat(os.path.join(self._objects_dir, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if name != keep and self._remove_unleased(os.path.join(self._objects_dir, name)):
+                total_size -= size
+
+    @staticmethod
+    def _remove_unleased(path):  # type: (str) -> bool
+        try:
+            image = open(path, "rb")
+        except (IOError, OSError) as e:
+            if e.errno == errno.ENOENT:
+                return False
+            raise
+        with image:
+            try:
+                fcntl.flock(image, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except (IOError, OSError) as e:
+                if e.errno in (errno.EAGAIN, errno.EACCES):
+                    return False
+                raise
+            os.remove(path)
+        return True
@@ -10,16 +10,124 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Callable, Tuple, Any, Dict, List
+    from typing import Callable, Tuple, Any, Dict, List, Optional
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Callable = Tuple = Any = Dict = List = None
+    Callable = Tuple = Any = Dict = List = Optional = None
 
 import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.redfish import RedfishAPI
-from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth, SessionAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import AuthMethod, BasicAuth, SessionAuth
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.trace import RequestTracer
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.retry import (
+    RetryPolicy,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_BUDGET,
+    IDEMPOTENT_METHODS,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.limiter import get_limiter, DEFAULT_LIMIT_DIR
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.discovery import (
+    DiscoveryCache,
+    DEFAULT_DISCOVERY_CACHE_DIR,
+    DEFAULT_DISCOVERY_CACHE_TTL,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.token_cache import (
+    SessionTokenCache,
+    DEFAULT_TOKEN_CACHE_DIR,
+    DEFAULT_TOKEN_CACHE_TTL,
+)
+
+
+CONNECTION_OPTIONS = {
+    "hostname": {"required": True, "type": "str"},
+    "username": {"required": False, "type": "str"},
+    "password": {"required": False, "type": "str", "no_log": True},
+    "session_key": {"required": False, "type": "str", "no_log": True},
+    "port": {"required": False, "type": "int", "default": 443},
+    "timeout": {"required": False, "type": "int", "default": 30},
+    "validate_certs": {"required": False, "type": "bool", "default": True},
+    "keep_alive": {"required": False, "type": "bool", "default": True},
+    "collection_workers": {"required": False, "type": "int", "default": 4},
+    "session_auth": {"required": False, "type": "bool", "default": True},
+    "session_cache": {"required": False, "type": "bool", "default": False},
+    "session_cache_ttl": {"required": False, "type": "int", "default": DEFAULT_TOKEN_CACHE_TTL},
+    "session_cache_dir": {"required": False, "type": "path", "default": DEFAULT_TOKEN_CACHE_DIR},
+    "discovery_cache": {"required": False, "type": "bool", "default": False},
+    "discovery_cache_ttl": {"required": False, "type": "int", "default": DEFAULT_DISCOVERY_CACHE_TTL},
+    "discovery_cache_dir": {"required": False, "type": "path", "default": DEFAULT_DISCOVERY_CACHE_DIR},
+    "retry_attempts": {"required": False, "type": "int", "default": DEFAULT_RETRY_ATTEMPTS},
+    "retry_backoff": {"required": False, "type": "float", "default": DEFAULT_RETRY_BACKOFF},
+    "retry_methods": {"required": False, "type": "list", "elements": "str", "default": list(IDEMPOTENT_METHODS)},
+    "retry_budget": {"required": False, "type": "int", "default": DEFAULT_RETRY_BUDGET},
+    "max_in_flight": {"required": False, "type": "int", "default": 0},
+    "rate_limit": {"required": False, "type": "float", "default": 0},
+    "limit_dir": {"required": False, "type": "path", "default": DEFAULT_LIMIT_DIR},
+    "trace": {"required": False, "type": "bool", "default": False},
+    "trace_file": {"required": False, "type": "path"},
+}
+
+
+def get_auth(connection):  # type: (Dict) -> Optional[AuthMethod]
+    if connection["session_key"]:
+        return SessionAuth(connection["session_key"])
+    elif connection["username"] and connection["password"]:
+        return BasicAuth(connection["username"], connection["password"])
+    return None
+
+
+def connect(connection):  # type: (Dict) -> RedfishAPI
+    """Creates RedfishAPI for connection options. Caller must logout when done."""
+    auth = get_auth(connection)
+    if auth is None:
+        raise RedfishError("Cannot define authentication method.")
+
+    tracer = None
+    if connection["trace"] or connection["trace_file"]:
+        tracer = RequestTracer(path=connection["trace_file"])
+
+    limiter = None
+    if connection["max_in_flight"] or connection["rate_limit"]:
+        limiter = get_limiter(
+            "{0}:{1}".format(connection["hostname"], connection["port"]),
+            max_in_flight=connection["max_in_flight"],
+            rate=connection["rate_limit"],
+            directory=connection["limit_dir"],
+        )
+
+    discovery_cache = None
+    if connection["discovery_cache"]:
+        discovery_cache = DiscoveryCache(connection["discovery_cache_dir"], connection["discovery_cache_ttl"])
+
+    redfish = RedfishAPI(
+        hostname=connection["hostname"],
+        base_prefix="/redfish/v1",
+        port=connection["port"],
+        validate_certs=connection["validate_certs"],
+        timeout=connection["timeout"],
+        auth=auth,
+        keep_alive=connection["keep_alive"],
+        collection_workers=connection["collection_workers"],
+        tracer=tracer,
+        retry_policy=RetryPolicy(
+            max_attempts=connection["retry_attempts"],
+            backoff=connection["retry_backoff"],
+            methods=connection["retry_methods"],
+            budget=connection["retry_budget"],
+        ),
+        limiter=limiter,
+        discovery_cache=discovery_cache,
+    )
+
+    # Session token is checked much faster than credentials, which pass PAM on each request.
+    if isinstance(auth, BasicAuth) and connection["session_auth"]:
+        token_cache = None
+        if connection["session_cache"]:
+            token_cache = SessionTokenCache(connection["session_cache_dir"], connection["session_cache_ttl"])
+        redfish.login(connection["username"], connection["password"], token_cache=token_cache)
+    return redfish
 
 
 class OpenBmcModule(AnsibleModule):
@@ -30,15 +138,7 @@ class OpenBmcModule(AnsibleModule):
             "connection": {
                 "required": True,
                 "type": "dict",
-                "options": {
-                    "hostname": {"required": True, "type": "str"},
-                    "username": {"required": False, "type": "str"},
-                    "password": {"required": False, "type": "str", "no_log": True},
-                    "session_key": {"required": False, "type": "str", "no_log": True},
-                    "port": {"required": False, "type": "int", "default": 443},
-                    "timeout": {"required": False, "type": "int", "default": 30},
-                    "validate_certs": {"required": False, "type": "bool", "default": True},
-                }
+                "options": CONNECTION_OPTIONS,
             },
         }
         if argument_spec and isinstance(argument_spec, dict):
@@ -55,25 +155,28 @@ class OpenBmcModule(AnsibleModule):
     def run(self):  # type: () -> None
         try:
             connection = self.params["connection"]
-            if connection["session_key"]:
-                auth = SessionAuth(connection["session_key"])
-            elif connection["username"] and connection["password"]:
-                auth = BasicAuth(connection["username"], connection["password"])
-            else:
+            if get_auth(connection) is None:
                 self.fail_json(msg="Cannot define authentication method.")
 
-            self.redfish = RedfishAPI(
-                hostname=connection["hostname"],
-                base_prefix="/redfish/v1",
-                port=connection["port"],
-                validate_certs=connection["validate_certs"],
-                timeout=connection["timeout"],
-                auth=auth,
-            )
-
-            self._run()
+            self.redfish = connect(connection)
+            try:
+                self._run()
+            finally:
+                self.redfish.logout()
         except RedfishError as e:
             self.fail_json(msg="Operation failed.", error=str(e))
 
+    def exit_json(self, **kwargs):
+        self._add_trace(kwargs)
+        super(OpenBmcModule, self).exit_json(**kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        self._add_trace(kwargs)
+        super(OpenBmcModule, self).fail_json(msg, **kwargs)
+
+    def _add_trace(self, result):  # type: (Dict) -> None
+        if self.redfish is not None and self.params["connection"]["trace"]:
+            result["redfish_trace"] = self.redfish.get_trace()
+
     def _run(self):  # type: () -> None
         raise NotImplementedError("Method not implemented!")
@@ -10,21 +10,17 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar
+    from typing import Dict
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = None
+    Dict = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class Account(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Account]]
-        if version == "#ManagerAccount.v1_4_0.ManagerAccount":
-            return Account_v1_4_0
-
     def get_username(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
@@ -47,11 +43,18 @@ class Account(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#ManagerAccount.v1_4_0.ManagerAccount")
 class Account_v1_4_0(Account):
 
     def __init__(self, *args, **kwargs):
         super(Account_v1_4_0, self).__init__(*args, **kwargs)
 
+    def _patch(self, body):  # type: (Dict) -> None
+        super(Account_v1_4_0, self)._patch(body)
+        if "Password" in body and self._pending_changes is None:
+            # Password is never returned by service, sent one isn't kept either.
+            self._data["Password"] = None
+
     def get_username(self):  # type: () -> str
         return self._get_field("UserName")
 
@@ -67,16 +70,14 @@ class Account_v1_4_0(Account):
     def set_password(self, password):  # type: (str) -> None
         if not isinstance(password, str):
             raise TypeError("Password must be string. Received: {0}".format(type(password)))
-        self._client.patch(self._path, body={"Password": password})
+        self._patch({"Password": password})
 
     def set_role_id(self, role_id):  # type: (str) -> None
         if not isinstance(role_id, str):
             raise TypeError("Role id must be string. Received: {0}".format(type(role_id)))
-        self._client.patch(self._path, body={"RoleId": role_id})
-        self.reload()
+        self._patch({"RoleId": role_id})
 
     def set_enabled(self, enabled):  # type: (bool) -> None
         if not isinstance(enabled, bool):
             raise TypeError("Enabled must be boolean. Received: {0}".format(type(enabled)))
-        self._client.patch(self._path, body={"Enabled": enabled})
-        self.reload()
+        self._patch({"Enabled": enabled})
@@ -9,23 +9,15 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-try:
-    from typing import Optional, ClassVar
-except ImportError:
-    # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = None
-
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class Role(RedfishAPIObject):
-
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Role]]
-        if version == "#Role.v1_2_2.Role":
-            return Role_v1_2_2
+    pass
 
 
+@register_version("#Role.v1_2_2.Role")
 class Role_v1_2_2(Role):
 
     def __init__(self, *args, **kwargs):
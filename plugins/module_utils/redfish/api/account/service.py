@@ -10,12 +10,14 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List, Dict, Any
+    from typing import Optional, List, Dict, Any, Iterator
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = Dict = Any = None
+    Optional = List = Dict = Any = Iterator = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_collection, iter_collection
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientNotFoundError
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.account.account import Account
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.account.role import Role
@@ -23,13 +25,6 @@ from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.account.rol
 
 class AccountService(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[AccountService]]
-        if version == "#AccountService.v1_5_0.AccountService":
-            return AccountService_v1_5_0
-        elif version == "#AccountService.v1_5_0.AccountService.Mockup":
-            return AccountServiceMockup_v1_5_0
-
     def create_account(self, username, password, role_id, enabled):  # type: (str, str, str, bool) -> None
         raise NotImplementedError("Method not implemented")
 
@@ -62,9 +57,15 @@ class AccountService(RedfishAPIObject):
     def get_account_collection(self):  # type: () -> List[Account]
         raise NotImplementedError("Method not implemented")
 
+    def iter_account_collection(self):  # type: () -> Iterator[Account]
+        raise NotImplementedError("Method not implemented")
+
     def get_role_collection(self):  # type: () -> List[Role]
         raise NotImplementedError("Method not implemented")
 
+    def iter_role_collection(self):  # type: () -> Iterator[Role]
+        raise NotImplementedError("Method not implemented")
+
     def get_account(self, account_id):  # type: (str) -> Optional[Account]
         raise NotImplementedError("Method not implemented")
 
@@ -75,6 +76,7 @@ class AccountService(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#AccountService.v1_5_0.AccountService")
 class AccountService_v1_5_0(AccountService):
 
     def __init__(self, *args, **kwargs):
@@ -96,7 +98,6 @@ class AccountService_v1_5_0(AccountService):
             "RoleId": role_id,
             "Enabled": enabled
         })
-        self.reload()
 
     def config_ldap(self, service_type, **kwargs):
         # type: (str, ...) -> Dict[str, Any]
@@ -156,19 +157,19 @@ class AccountService_v1_5_0(AccountService):
                        and self._data['LDAP']['ServiceEnabled']
 
         if service_type == 'LDAP' and ad_enabled:
-            self._client.patch(
-                self._path,
-                body={'ActiveDirectory': {'ServiceEnabled': False}},
-            )
+            self._patch({'ActiveDirectory': {'ServiceEnabled': False}})
         elif service_type == 'ActiveDirectory' and ldap_enabled:
-            self._client.patch(
-                self._path,
-                body={'LDAP': {'ServiceEnabled': False}},
-            )
+            self._patch({'LDAP': {'ServiceEnabled': False}})
 
-        payload = {service_type: data}
-        self._client.patch(self._path, payload)
-        self.reload()
+        self._patch({service_type: data})
+
+        # Merged changes are brought to the form service reports them in:
+        # null entries remove role groups, password is never returned.
+        config = self._data[service_type]
+        if 'RemoteRoleMapping' in data:
+            config['RemoteRoleMapping'] = [group for group in config['RemoteRoleMapping'] if group is not None]
+        if 'password' in kwargs:
+            config['Authentication']['Password'] = None
 
         return self.get_ldap_config(service_type)
 
@@ -199,20 +200,16 @@ class AccountService_v1_5_0(AccountService):
         return rv
 
     def get_account_collection(self):  # type: () -> List[Account]
-        accounts = []
-        accounts_collection = self._client.get("{0}/Accounts".format(self._path)).json
-        for member in accounts_collection["Members"]:
-            account_data = self._client.get(member["@odata.id"]).json
-            accounts.append(Account.from_json(self._client, account_data))
-        return accounts
+        return load_collection(self._client, "{0}/Accounts".format(self._path), Account)
+
+    def iter_account_collection(self):  # type: () -> Iterator[Account]
+        return iter_collection(self._client, "{0}/Accounts".format(self._path), Account)
 
     def get_role_collection(self):  # type: () -> List[Role]
-        roles = []
-        roles_collection = self._client.get("{0}/Roles".format(self._path)).json
-        for member in roles_collection["Members"]:
-            role_data = self._client.get(member["@odata.id"]).json
-            roles.append(Role.from_json(self._client, role_data))
-        return roles
+        return load_collection(self._client, "{0}/Roles".format(self._path), Role)
+
+    def iter_role_collection(self):  # type: () -> Iterator[Role]
+        return iter_collection(self._client, "{0}/Roles".format(self._path), Role)
 
     def get_account(self, account_id):  # type: (str) -> Optional[Account]
         if not isinstance(account_id, str):
@@ -240,9 +237,9 @@ class AccountService_v1_5_0(AccountService):
         if not isinstance(account_id, str):
             raise TypeError("Account id must be string. Received: {0}".format(type(account_id)))
         self._client.delete("{0}/Accounts/{1}".format(self._path, account_id))
-        self.reload()
 
 
+@register_version("#AccountService.v1_5_0.AccountService.Mockup")
 class AccountServiceMockup_v1_5_0(AccountService_v1_5_0):
 
     def __init__(self, *args, **kwargs):
@@ -280,4 +277,3 @@ class AccountServiceMockup_v1_5_0(AccountService_v1_5_0):
             "Password": None,
             "PasswordChangeRequired": False,
         })
-        self.reload()
@@ -10,25 +10,122 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import ClassVar, Optional, Dict
+    from typing import ClassVar, Optional, Dict, List, Callable, Any, Tuple, Iterable
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    ClassVar = Optional = Dict = None
+    ClassVar = Optional = Dict = List = Callable = Any = Tuple = Iterable = None
 
+from contextlib import contextmanager
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import find_version, find_registered
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.response import HTTPClientResponse
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.cache import get_etag
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import (
     RedfishFieldNotFoundError,
     RedfishModelVersionError,
     RedfishModelLoadError,
 )
 
+# Implementation class selected for each base class and version, filled on first use or by preload_dispatch.
+_dispatch_table = {}  # type: Dict[Tuple[type, str], Any]
+
+# Fields kept by compact data of every resource.
+COMMON_FIELDS = ("@odata.id", "@odata.type", "@odata.etag", "Id", "Name")
+
+
+def deep_merge(target, changes):  # type: (Dict, Dict) -> Dict
+    """Merges changes into target in place. Nested objects are merged, other values are replaced."""
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            deep_merge(target[key], value)
+        elif isinstance(value, dict):
+            target[key] = deep_merge({}, value)
+        else:
+            target[key] = value
+    return target
+
+
+class CompactData:
+    """Read-only mapping holding only the declared fields of resource data.
+
+    Subclasses are generated by get_compact_data_class, each field is kept in its own slot,
+    so data of thousands of collection members doesn't keep dictionaries of all their properties.
+    """
+
+    __slots__ = ()
+    # Slot name of each declared field.
+    _slot_names = {}  # type: Dict[str, str]
+
+    def __init__(self, data):  # type: (Dict) -> None
+        for name, slot_name in self._slot_names.items():
+            if name in data:
+                setattr(self, slot_name, data[name])
+
+    def __getitem__(self, name):  # type: (str) -> Any
+        try:
+            return getattr(self, self._slot_names[name])
+        except (KeyError, AttributeError):
+            raise KeyError(name)
+
+    def __contains__(self, name):  # type: (str) -> bool
+        return hasattr(self, self._slot_names.get(name, "__missing__"))
+
+    def get(self, name, default=None):  # type: (str, Any) -> Any
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def to_dict(self):  # type: () -> Dict[str, Any]
+        return dict((name, self[name]) for name in self._slot_names if name in self)
+
+
+_compact_data_classes = {}  # type: Dict[type, Any]
+
+
+def get_compact_data_class(cls):  # type: (Any) -> Any
+    """Returns CompactData subclass for fields declared by FIELDS of the resource class, created on first use."""
+    if cls not in _compact_data_classes:
+        fields = COMMON_FIELDS + tuple(field for field in cls.FIELDS if field not in COMMON_FIELDS)
+        slot_names = dict((field, "_field{0}".format(i)) for i, field in enumerate(fields))
+        _compact_data_classes[cls] = type(cls.__name__ + "Data", (CompactData,), {
+            "__slots__": tuple(slot_names.values()),
+            "_slot_names": slot_names,
+        })
+    return _compact_data_classes[cls]
+
+
+def preload_dispatch(versions):  # type: (Iterable[str]) -> None
+    """Fills dispatch table for @odata.type values known in advance, e.g. seen by previous runs,
+    so objects of these versions are created without looking up registered implementations.
+    """
+    for version in versions:
+        for impl in find_registered(version):
+            for cls in impl.__mro__:
+                if issubclass(cls, RedfishAPIObject) and (cls, version) not in _dispatch_table:
+                    _dispatch_table[(cls, version)] = cls.select_version(version)
+
 
 class RedfishAPIObject:
 
+    __slots__ = ("_client", "_path", "_data", "_select", "_subresources", "_pending_changes", "_etag")
+
+    # Top-level properties read by the implementation. Objects loaded with compact=True keep only
+    # these fields. Empty for resources without compact representation, they always keep all data.
+    FIELDS = ()  # type: Tuple[str, ...]
+
     def __init__(self, client, path, data):  # type: (RESTClient, str, Dict) -> None
         self._client = client
         self._path = path.rstrip("/")
         self._data = data
+        # Properties requested with $select. Object is reloaded with the same projection.
+        self._select = None  # type: Optional[List[str]]
+        # Subresources loaded on first access, e.g. Bios of System. Dropped on reload.
+        self._subresources = None  # type: Optional[Dict[Any, Any]]
+        # Request body collected by setters between begin_changes and commit_changes.
+        self._pending_changes = None  # type: Optional[Dict]
+        # Version of data, sent with If-Match so writes don't override concurrent changes.
+        self._etag = data.get("@odata.etag")  # type: Optional[str]
 
     def _get_field(self, name):  # type: (str) -> Any
         try:
@@ -37,7 +134,91 @@ class RedfishAPIObject:
             raise RedfishFieldNotFoundError(name)
 
     def reload(self):  # type: () -> None
-        self._data = self._client.get(self._path).json
+        """Reads object again. Compact object gets all of its data back."""
+        self._set_response(self._client.get(self._path, select=self._select))
+        self._subresources = None
+
+    def _set_response(self, response):  # type: (HTTPClientResponse) -> None
+        self._data = response.json
+        self._etag = get_etag(response) or self._data.get("@odata.etag")
+
+    def _get_subresource(self, key, load):  # type: (Any, Callable[[], Any]) -> Any
+        """Returns subresource, it is loaded with load on first access and reused until reload."""
+        if self._subresources is None:
+            self._subresources = {}
+        if key not in self._subresources:
+            self._subresources[key] = load()
+        return self._subresources[key]
+
+    def _patch(self, body):  # type: (Dict) -> None
+        """Updates properties of object, or defers the update if changes are collected.
+
+        Write is conditional on the version of data, if service reported it. Data is refreshed from
+        the response when service returns the updated resource, otherwise sent properties are merged
+        into it, instead of reading object again.
+        """
+        if isinstance(self._data, CompactData):
+            raise TypeError("Compact object {0} can't be changed, it must be reloaded first.".format(self._path))
+        if self._pending_changes is not None:
+            deep_merge(self._pending_changes, body)
+            return
+
+        headers = None
+        # ETag of $select projection doesn't identify the whole resource, weak ETag never matches.
+        if self._etag and not self._select and not self._etag.startswith("W/"):
+            headers = {"If-Match": self._etag}
+        response = self._client.patch(self._path, body=body, headers=headers)
+
+        try:
+            data = response.json if response.status_code == 200 else None
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and "@odata.id" in data and "@odata.type" in data:
+            self._set_response(response)
+        else:
+            # Response holds only messages, if anything.
+            deep_merge(self._data, body)
+            self._data.pop("@odata.etag", None)
+            self._etag = get_etag(response)
+        self._subresources = None
+
+    def begin_changes(self):  # type: () -> None
+        """Starts collecting changes made by setters, they are sent with commit_changes as one PATCH request."""
+        if self._pending_changes is None:
+            self._pending_changes = {}
+
+    def has_pending_changes(self):  # type: () -> bool
+        return bool(self._pending_changes)
+
+    def commit_changes(self):  # type: () -> None
+        """Sends collected changes, if any, as one request. Following setters apply immediately."""
+        changes, self._pending_changes = self._pending_changes, None
+        if changes:
+            self._patch(changes)
+
+    def discard_changes(self):  # type: () -> None
+        self._pending_changes = None
+
+    @contextmanager
+    def changes(self):
+        """Collects changes made within the block and commits them on exit, unless exception is raised.
+
+        Example::
+
+            with network_protocol.changes():
+                network_protocol.set_ntp_enabled(True)
+                network_protocol.set_ntp_servers(["192.168.1.100"])
+        """
+        self.begin_changes()
+        try:
+            yield self
+        except BaseException:
+            self.discard_changes()
+            raise
+        self.commit_changes()
+
+    def get_path(self):  # type: () -> str
+        return self._path
 
     def get_id(self):  # type: () -> str
         return self._get_field("Id")
@@ -46,7 +227,21 @@ class RedfishAPIObject:
         return self._get_field("Name")
 
     @classmethod
-    def from_json(cls, client, data):  # type: (RESTClient, Dict) -> RedfishAPIObject
+    def load(cls, client, path, select=None):
+        # type: (RESTClient, str, Optional[List[str]]) -> RedfishAPIObject
+        """Reads object from path. With select set, object holds only listed properties if service supports $select."""
+        response = client.get(path, select=select)
+        obj = cls.from_json(client, response.json)
+        obj._etag = get_etag(response) or obj._etag
+        obj._select = select
+        return obj
+
+    @classmethod
+    def from_json(cls, client, data, compact=False):  # type: (RESTClient, Dict, bool) -> RedfishAPIObject
+        """Creates object of implementation for the version of data.
+
+        With compact set, object keeps only fields declared by FIELDS of the implementation and can't be changed.
+        """
         if not isinstance(client, RESTClient):
             raise TypeError("Client must be RESTClient object. Received: {0}".format(type(client)))
         if not isinstance(data, dict):
@@ -62,14 +257,24 @@ class RedfishAPIObject:
             version = "{0}.Mockup".format(data["@odata.type"])
         else:
             version = data["@odata.type"]
-        impl = cls.select_version(version)
+        key = (cls, version)
+        if key not in _dispatch_table:
+            _dispatch_table[key] = cls.select_version(version)
+        impl = _dispatch_table[key]
+        client.schema_versions.add(data["@odata.type"])
         if impl is None:
             raise RedfishModelVersionError(version)
+        if compact and impl.FIELDS:
+            data = get_compact_data_class(impl)(data)
         return impl(client, data["@odata.id"], data)
 
     @classmethod
     def select_version(cls, version):  # type: (str) -> Optional[ClassVar[RedfishAPIObject]]
-        raise NotImplementedError("Method not implemented")
+        """Returns implementation of the resource for @odata.type value, registered with register_version.
+
+        Resources which don't have versions override it.
+        """
+        return find_version(cls, version)
 
     def __repr__(self):  # type: () -> str
         return "{0}({1})".format(self.__class__.__name__, self._path)
@@ -9,27 +9,18 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-try:
-    from typing import Optional, ClassVar
-except ImportError:
-    # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = None
-
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base \
     import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class Certificate(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Certificate_v1_0_0]]
-        if version == "#Certificate.v1_0_0.Certificate":
-            return Certificate_v1_0_0
-
     def delete(self):
         raise NotImplementedError('Method not implemented')
 
 
+@register_version("#Certificate.v1_0_0.Certificate")
 class Certificate_v1_0_0(Certificate):
 
     def __init__(self, client, path, data):
@@ -10,12 +10,14 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List, Tuple
+    from typing import Optional, List, Iterator
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = Tuple = None
+    Optional = List = Iterator = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_members, iter_members
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.certificate.certificate import Certificate
 
 
@@ -28,13 +30,6 @@ CERTIFICATE_LOCATIONS = {
 
 class CertificateService(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[CertificateService]]
-        if version == "#CertificateService.v1_0_0.CertificateService":
-            return CertificateService_v1_0_0
-        elif version == "#CertificateService.v1_0_0.CertificateService.Mockup":
-            return CertificateServiceMockup_v1_0_0
-
     def add_https_certificate(self, content):  # type: (str) -> Certificate
         raise NotImplementedError("Method not implemented")
 
@@ -71,6 +66,9 @@ class CertificateService(RedfishAPIObject):
     def get_all_certificates(self):  # type: () -> List[Certificate]
         raise NotImplementedError("Method not implemented")
 
+    def iter_all_certificates(self):  # type: () -> Iterator[Certificate]
+        raise NotImplementedError("Method not implemented")
+
     def get_https_certificate(self):  # type: () -> Certificate
         raise NotImplementedError("Method not implemented")
 
@@ -93,6 +91,7 @@ class CertificateService(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#CertificateService.v1_0_0.CertificateService")
 class CertificateService_v1_0_0(CertificateService):
 
     def add_https_certificate(self, content):  # type: (str) -> Certificate
@@ -184,14 +183,18 @@ class CertificateService_v1_0_0(CertificateService):
         if response['Links']['Certificates@odata.count'] > 0:
             paths = [d['@odata.id'] for d
                      in response['Links']['Certificates']]
-
-            for path in paths:
-                crt_data = self._client.get(path).json
-                crt = Certificate.from_json(self._client, crt_data)
-                crt_collection.append(crt)
+            crt_collection = load_members(self._client, paths, Certificate)
 
         return crt_collection
 
+    def iter_all_certificates(self):  # type: () -> Iterator[Certificate]
+        response = self._client.get(
+            self._path + '/CertificateLocations').json
+
+        paths = [d['@odata.id'] for d
+                 in response['Links'].get('Certificates', [])]
+        return iter_members(self._client, paths, Certificate)
+
     def get_https_certificate(self):  # type: () -> Certificate
         location = self._get_crt_location('HTTPS')
         return self.get_certificate(location)
@@ -250,6 +253,7 @@ class CertificateService_v1_0_0(CertificateService):
         )
 
 
+@register_version("#CertificateService.v1_0_0.CertificateService.Mockup")
 class CertificateServiceMockup_v1_0_0(CertificateService_v1_0_0):
 
     def add_certificate(self, location, content):  # type: (str, str) -> Certificate
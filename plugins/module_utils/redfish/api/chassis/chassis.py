@@ -10,23 +10,19 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, Dict
+    from typing import Dict
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = Dict = None
+    Dict = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.chassis.thermal import Thermal
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.chassis.power import Power
 
 
 class Chassis(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Chassis]]
-        if version == "#Chassis.v1_14_0.Chassis":
-            return Chassis_v1_14_0
-
     def get_model(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
@@ -55,6 +51,7 @@ class Chassis(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Chassis.v1_14_0.Chassis")
 class Chassis_v1_14_0(Chassis):
 
     def __init__(self, *args, **kwargs):
@@ -82,9 +79,7 @@ class Chassis_v1_14_0(Chassis):
         return self._get_field("PartNumber")
 
     def get_thermal(self):  # type: () -> Thermal
-        thermal_data = self._client.get("{0}/Thermal".format(self._path)).json
-        return Thermal.from_json(self._client, thermal_data)
+        return self._get_subresource("Thermal", lambda: Thermal.load(self._client, "{0}/Thermal".format(self._path)))
 
     def get_power(self):  # type: () -> Power
-        power_data = self._client.get("{0}/Power".format(self._path)).json
-        return Power.from_json(self._client, power_data)
+        return self._get_subresource("Power", lambda: Power.load(self._client, "{0}/Power".format(self._path)))
@@ -10,26 +10,23 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List
+    from typing import List
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = None
+    List = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.chassis.power_supply import PowerSupply
 
 
 class Power(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Power]]
-        if version == "#Power.v1_5_2.Power":
-            return Power_v1_5_2
-
     def get_power_supply_collection(self):  # type: () -> List[PowerSupply]
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Power.v1_5_2.Power")
 class Power_v1_5_2(Power):
 
     def __init__(self, *args, **kwargs):
@@ -10,26 +10,23 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List
+    from typing import List
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = None
+    List = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.chassis.thermal_fan import ThermalFan
 
 
 class Thermal(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Thermal]]
-        if version == "#Thermal.v1_4_0.Thermal":
-            return Thermal_v1_4_0
-
     def get_fan_collection(self):  # type: () -> List[ThermalFan]
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Thermal.v1_4_0.Thermal")
 class Thermal_v1_4_0(Thermal):
 
     def __init__(self, *args, **kwargs):
@@ -10,22 +10,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, Dict
+    from typing import Dict
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = Dict = None
+    Dict = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import RedfishFieldNotFoundError
 
 
 class ThermalFan(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[ThermalFan]]
-        if version == "#Thermal.v1_4_1.Fan":
-            return ThermalFan_v1_4_1
-
     def get_id(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
@@ -45,6 +41,7 @@ class ThermalFan(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Thermal.v1_4_1.Fan")
 class ThermalFan_v1_4_1(ThermalFan):
 
     def __init__(self, *args, **kwargs):
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import ClassVar, List, Dict, Iterator, Tuple, Any, Optional
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    ClassVar = List = Dict = Iterator = Tuple = Any = Optional = None
+
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, parse_qsl
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientRequestError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.concurrency import map_concurrently, iter_concurrently
+
+
+def get_expand_query(client):  # type: (RESTClient) -> Optional[Dict[str, str]]
+    """Builds $expand query inlining collection members, if service supports it."""
+    expand = client.get_protocol_features().get("ExpandQuery") or {}
+    if expand.get("NoLinks"):
+        value = "."
+    elif expand.get("ExpandAll"):
+        value = "*"
+    else:
+        return None
+    if expand.get("Levels"):
+        value += "($levels=1)"
+    return {"$expand": value}
+
+
+def load_collection(client, path, member_cls, compact=False):
+    # type: (RESTClient, str, ClassVar, bool) -> List[Any]
+    """Reads Redfish collection and loads all of its members as member_cls objects.
+
+    Members are read with a single expanded request when service supports $expand.
+    Members not inlined by the service are fetched separately. With compact set,
+    members keep only fields read by their implementation.
+    """
+    return list(iter_collection(client, path, member_cls, compact))
+
+
+def iter_collection(client, path, member_cls, compact=False, query_params=None):
+    # type: (RESTClient, str, ClassVar, bool, Optional[Dict[str, Any]]) -> Iterator[Any]
+    """Yields members of Redfish collection as member_cls objects, in order, as soon as they are read.
+
+    Pages of the collection linked by Members@odata.nextLink are requested when members
+    of the previous page are consumed, so large collections aren't held in memory whole.
+    query_params, like $top, are sent with every page, $skip only with the first one.
+    """
+    page_query = dict(query_params or {})
+    page_query.pop("$skip", None)
+    expand_query = get_expand_query(client)
+    page_data = None  # type: Optional[Dict[str, Any]]
+    if expand_query:
+        try:
+            page_data = client.get(path, query_params=dict(query_params or {}, **expand_query)).json
+            page_query.update(expand_query)
+        except RESTClientRequestError as e:
+            # Service advertises $expand but doesn't support it, so don't try it again.
+            # Other errors aren't related to the query and are raised.
+            if not e.is_query_unsupported():
+                raise
+            client.disable_protocol_feature("ExpandQuery")
+    if page_data is None:
+        page_data = client.get(path, query_params=query_params or None).json
+
+    while True:
+        members = page_data["Members"]
+        if all("@odata.type" in member for member in members):
+            members_data = iter(members)
+        else:
+            members_data = iter_concurrently(
+                lambda member: member if "@odata.type" in member else client.get(member["@odata.id"]).json,
+                members,
+                client.collection_workers,
+            )
+        for member_data in members_data:
+            yield member_cls.from_json(client, member_data, compact)
+
+        next_link = page_data.get("Members@odata.nextLink")
+        if not next_link:
+            return
+        next_path, link_query = split_link(next_link)
+        page_data = client.get(next_path, query_params=dict(page_query, **link_query) or None).json
+
+
+def split_link(link):  # type: (str) -> Tuple[str, Dict[str, str]]
+    """Splits link to path and query parameters, which are encoded again by the client."""
+    parts = urlsplit(link)
+    return parts.path, dict(parse_qsl(parts.query))
+
+
+def load_members(client, member_paths, member_cls, compact=False):
+    # type: (RESTClient, List[str], ClassVar, bool) -> List[Any]
+    """Loads objects by their paths. Objects are returned in the order of member_paths."""
+    return [
+        member_cls.from_json(client, member_data, compact)
+        for member_data in fetch_members(client, member_paths)
+    ]
+
+
+def iter_members(client, member_paths, member_cls, compact=False):
+    # type: (RESTClient, List[str], ClassVar, bool) -> Iterator[Any]
+    """Yields objects by their paths in the order of member_paths, as soon as they are read."""
+    members_data = iter_concurrently(
+        lambda member_path: client.get(member_path).json,
+        member_paths,
+        client.collection_workers,
+    )
+    for member_data in members_data:
+        yield member_cls.from_json(client, member_data, compact)
+
+
+def fetch_members(client, member_paths):
+    # type: (RESTClient, List[str]) -> List[Dict[str, Any]]
+    """Fetches members data concurrently, up to client.collection_workers requests at once."""
+    return map_concurrently(
+        lambda member_path: client.get(member_path).json,
+        member_paths,
+        client.collection_workers,
+    )
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = None
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+
+
+class EventService(RedfishAPIObject):
+
+    def get_service_enabled(self):  # type: () -> bool
+        raise NotImplementedError("Method not implemented")
+
+    def get_server_sent_event_uri(self):  # type: () -> Optional[str]
+        raise NotImplementedError("Method not implemented")
+
+
+@register_version("#EventService.v1_5_0.EventService")
+class EventService_v1_5_0(EventService):
+
+    def __init__(self, *args, **kwargs):
+        super(EventService_v1_5_0, self).__init__(*args, **kwargs)
+
+    def get_service_enabled(self):  # type: () -> bool
+        return self._get_field("ServiceEnabled")
+
+    def get_server_sent_event_uri(self):  # type: () -> Optional[str]
+        return self._data.get("ServerSentEventUri")
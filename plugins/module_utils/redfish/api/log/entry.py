@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import List, Optional
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    List = Optional = None
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+
+
+class LogEntry(RedfishAPIObject):
+
+    __slots__ = ()
+
+    def get_created(self):  # type: () -> Optional[str]
+        raise NotImplementedError("Method not implemented")
+
+    def get_entry_type(self):  # type: () -> str
+        raise NotImplementedError("Method not implemented")
+
+    def get_severity(self):  # type: () -> Optional[str]
+        raise NotImplementedError("Method not implemented")
+
+    def get_message(self):  # type: () -> str
+        raise NotImplementedError("Method not implemented")
+
+    def get_message_id(self):  # type: () -> Optional[str]
+        raise NotImplementedError("Method not implemented")
+
+    def get_message_args(self):  # type: () -> List[str]
+        raise NotImplementedError("Method not implemented")
+
+
+@register_version("#LogEntry.v1_4_0.LogEntry")
+class LogEntry_v1_4_0(LogEntry):
+
+    __slots__ = ()
+
+    FIELDS = (
+        "Created",
+        "EntryType",
+        "Severity",
+        "Message",
+        "MessageId",
+        "MessageArgs",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super(LogEntry_v1_4_0, self).__init__(*args, **kwargs)
+
+    def get_created(self):  # type: () -> Optional[str]
+        return self._data.get("Created")
+
+    def get_entry_type(self):  # type: () -> str
+        return self._get_field("EntryType")
+
+    def get_severity(self):  # type: () -> Optional[str]
+        # Journal entries of BMC don't have severity.
+        return self._data.get("Severity")
+
+    def get_message(self):  # type: () -> str
+        return self._get_field("Message")
+
+    def get_message_id(self):  # type: () -> Optional[str]
+        return self._data.get("MessageId")
+
+    def get_message_args(self):  # type: () -> List[str]
+        return self._data.get("MessageArgs", [])
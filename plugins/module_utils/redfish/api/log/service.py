@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional, Dict, Iterator, Tuple, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = Dict = Iterator = Tuple = Any = None
+
+import re
+import time
+import calendar
+import itertools
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import iter_collection
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.log.entry import LogEntry
+
+# Largest $top accepted by bmcweb.
+DEFAULT_LOG_PAGE_SIZE = 1000
+
+_TIMESTAMP_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d+)?(Z|[+-]\d{2}:\d{2})?$")
+
+
+def parse_timestamp(value):  # type: (str) -> float
+    """Converts ISO 8601 timestamp, like Created of log entry, to seconds since epoch."""
+    match = _TIMESTAMP_PATTERN.match(value)
+    if match is None:
+        raise ValueError("Unsupported timestamp: {0}".format(value))
+    date, fraction, zone = match.groups()
+    seconds = calendar.timegm(time.strptime(date, "%Y-%m-%dT%H:%M:%S")) + float(fraction or 0)
+    if zone and zone != "Z":
+        offset = int(zone[1:3]) * 3600 + int(zone[4:6]) * 60
+        seconds -= offset if zone[0] == "+" else -offset
+    return seconds
+
+
+def get_entry_timestamp(entry):  # type: (LogEntry) -> Optional[float]
+    """Returns Created of the entry as seconds since epoch, None if it's missing or not recognized."""
+    created = entry.get_created()
+    if not created:
+        return None
+    try:
+        return parse_timestamp(created)
+    except ValueError:
+        return None
+
+
+def make_log_cursor(entry, position):  # type: (LogEntry, int) -> Dict[str, Any]
+    """Builds cursor pointing to the entry, position is its number in the log starting from one."""
+    return {"Id": entry.get_id(), "Created": entry.get_created(), "Position": position}
+
+
+class LogService(RedfishAPIObject):
+
+    def get_service_enabled(self):  # type: () -> bool
+        raise NotImplementedError("Method not implemented")
+
+    def get_max_number_of_records(self):  # type: () -> Optional[int]
+        raise NotImplementedError("Method not implemented")
+
+    def get_overwrite_policy(self):  # type: () -> str
+        raise NotImplementedError("Method not implemented")
+
+    def iter_entries(self, skip=0, page_size=DEFAULT_LOG_PAGE_SIZE, compact=False):
+        # type: (int, int, bool) -> Iterator[LogEntry]
+        raise NotImplementedError("Method not implemented")
+
+    def iter_entries_since(self, cursor=None, page_size=DEFAULT_LOG_PAGE_SIZE, compact=False):
+        # type: (Optional[Dict[str, Any]], int, bool) -> Iterator[Tuple[LogEntry, Dict[str, Any]]]
+        raise NotImplementedError("Method not implemented")
+
+
+@register_version("#LogService.v1_1_0.LogService")
+class LogService_v1_1_0(LogService):
+
+    def __init__(self, *args, **kwargs):
+        super(LogService_v1_1_0, self).__init__(*args, **kwargs)
+
+    def get_service_enabled(self):  # type: () -> bool
+        return self._get_field("ServiceEnabled")
+
+    def get_max_number_of_records(self):  # type: () -> Optional[int]
+        return self._data.get("MaxNumberOfRecords")
+
+    def get_overwrite_policy(self):  # type: () -> str
+        return self._get_field("OverWritePolicy")
+
+    def iter_entries(self, skip=0, page_size=DEFAULT_LOG_PAGE_SIZE, compact=False):
+        # type: (int, int, bool) -> Iterator[LogEntry]
+        """Yields entries page by page, starting from entry number skip. Pages hold page_size entries if service supports $top."""
+        query_params = None
+        if self._client.get_protocol_features().get("TopSkipQuery"):
+            query_params = {"$top": page_size}
+            if skip:
+                query_params["$skip"] = skip
+            skip = 0
+        entries = iter_collection(
+            self._client, "{0}/Entries".format(self._path), LogEntry, compact=compact, query_params=query_params,
+        )
+        # Entries are read from the start, if service can't skip them.
+        return itertools.islice(entries, skip, None)
+
+    def iter_entries_since(self, cursor=None, page_size=DEFAULT_LOG_PAGE_SIZE, compact=False):
+        # type: (Optional[Dict[str, Any]], int, bool) -> Iterator[Tuple[LogEntry, Dict[str, Any]]]
+        """Yields entries added after the one cursor points to, each with the cursor pointing to it.
+
+        Entries are expected in the order they were added, as bmcweb returns them. If the cursor entry
+        is still at its position, entries before it are skipped by the service. Otherwise the log was
+        cleared or rotated: the whole log is read and entries created since the cursor entry are yielded.
+        Timestamps have one second resolution, so entries of the same second are yielded too, except
+        the cursor entry itself. Entries without recognized Created are skipped then.
+        """
+        if not cursor:
+            for position, entry in enumerate(self.iter_entries(page_size=page_size, compact=compact), 1):
+                yield entry, make_log_cursor(entry, position)
+            return
+
+        entries = self.iter_entries(skip=cursor["Position"] - 1, page_size=page_size, compact=compact)
+        cursor_entry = next(entries, None)
+        if cursor_entry is not None and cursor_entry.get_id() == cursor["Id"]:
+            for position, entry in enumerate(entries, cursor["Position"] + 1):
+                yield entry, make_log_cursor(entry, position)
+            return
+
+        try:
+            created = parse_timestamp(cursor["Created"])
+        except (ValueError, TypeError):
+            # Cursor entry time is unknown, so the whole log is new.
+            created = None
+        for position, entry in enumerate(self.iter_entries(page_size=page_size, compact=compact), 1):
+            if created is not None:
+                timestamp = get_entry_timestamp(entry)
+                if timestamp is None or timestamp < created or entry.get_id() == cursor["Id"]:
+                    continue
+            yield entry, make_log_cursor(entry, position)
@@ -10,24 +10,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List, Dict
+    from typing import List, Dict
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = Dict = None
+    List = Dict = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import RedfishFieldNotFoundError
 
 
 class EthernetInterface(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[EthernetInterface]]
-        if version == "#EthernetInterface.v1_4_1.EthernetInterface":
-            return EthernetInterface_v1_4_1
-        elif version == "#EthernetInterface.v1_4_1.EthernetInterface.Mockup":
-            return EthernetInterfaceMockup_v1_4_1
-
     def get_dhcpv4_enabled(self):  # type: () -> bool
         raise NotImplementedError("Method not implemented")
 
@@ -47,6 +41,7 @@ class EthernetInterface(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#EthernetInterface.v1_4_1.EthernetInterface")
 class EthernetInterface_v1_4_1(EthernetInterface):
 
     def __init__(self, *args, **kwargs):
@@ -71,8 +66,7 @@ class EthernetInterface_v1_4_1(EthernetInterface):
     def set_dhcpv4_enabled(self, enabled):  # type: (bool) -> None
         if not isinstance(enabled, bool):
             raise TypeError("Enabled must be boolean. Received: {0}".format(type(enabled)))
-        self._client.patch(self._path, body={"DHCPv4": {"DHCPEnabled": enabled}})
-        self.reload()
+        self._patch({"DHCPv4": {"DHCPEnabled": enabled}})
 
     def set_ipv4_addresses(self, addresses):  # type: (List[Dict]) -> None
         if not isinstance(addresses, list):
@@ -88,8 +82,7 @@ class EthernetInterface_v1_4_1(EthernetInterface):
             if len(conf.keys()) > len(required_keys):
                 raise ValueError("Address configuration has extra keys. Only {0} allowed and required".format(required_keys))
 
-        self._client.patch(self._path, body={"IPv4StaticAddresses": addresses})
-        self.reload()
+        self._patch({"IPv4StaticAddresses": addresses})
 
     def set_static_nameservers(self, static_nameservers):  # type: (List[str]) -> None
         if not isinstance(static_nameservers, list):
@@ -99,10 +92,10 @@ class EthernetInterface_v1_4_1(EthernetInterface):
             if not isinstance(server, str):
                 raise TypeError("Nameserver must be string. Received: {0}".format(type(server)))
 
-        self._client.patch(self._path, body={"StaticNameServers": static_nameservers})
-        self.reload()
+        self._patch({"StaticNameServers": static_nameservers})
 
 
+@register_version("#EthernetInterface.v1_4_1.EthernetInterface.Mockup")
 class EthernetInterfaceMockup_v1_4_1(EthernetInterface_v1_4_1):
 
     def __init__(self, *args, **kwargs):
@@ -10,25 +10,23 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List, Dict
+    from typing import Optional, List, Dict, Iterator
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = Dict = None
+    Optional = List = Dict = Iterator = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_collection, iter_collection
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientNotFoundError
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.network_protocol import ManagerNetworkProtocol
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.ethernet_interface import EthernetInterface
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.virtual_media import VirtualMedia
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.log.service import LogService
 
 
 class Manager(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Manager]]
-        if version == "#Manager.v1_9_0.Manager":
-            return Manager_v1_9_0
-
     def get_firmware_version(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
@@ -50,21 +48,30 @@ class Manager(RedfishAPIObject):
     def get_serial_console(self):  # type: () -> Dict
         raise NotImplementedError("Method not implemented")
 
-    def get_network_protocol(self):  # type: () -> ManagerNetworkProtocol
+    def get_network_protocol(self, select=None):  # type: (Optional[List[str]]) -> ManagerNetworkProtocol
         raise NotImplementedError("Method not implemented")
 
     def get_ethernet_interface_collection(self):  # type: () -> List[EthernetInterface]
         raise NotImplementedError("Method not implemented")
 
+    def iter_ethernet_interface_collection(self):  # type: () -> Iterator[EthernetInterface]
+        raise NotImplementedError("Method not implemented")
+
     def get_ethernet_interface(self, interface_id):  # type: () -> Optional[EthernetInterface]
         raise NotImplementedError("Method not implemented")
 
     def get_virtual_media_collection(self):  # type: () -> List[VirtualMedia]
         raise NotImplementedError("Method not implemented")
 
+    def iter_virtual_media_collection(self):  # type: () -> Iterator[VirtualMedia]
+        raise NotImplementedError("Method not implemented")
+
     def get_virtual_media(self, vm_id):    # type: (str) -> Optional[VirtualMedia]
         raise NotImplementedError("Method not implemented")
 
+    def get_log_service(self, service_id):  # type: (str) -> Optional[LogService]
+        raise NotImplementedError("Method not implemented")
+
     def reset_graceful(self):  # type: () -> None
         raise NotImplementedError("Method not implemented")
 
@@ -75,6 +82,7 @@ class Manager(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Manager.v1_9_0.Manager")
 class Manager_v1_9_0(Manager):
 
     def __init__(self, *args, **kwargs):
@@ -101,17 +109,20 @@ class Manager_v1_9_0(Manager):
     def get_serial_console(self):  # type: () -> Dict
         return self._get_field("SerialConsole")
 
-    def get_network_protocol(self):  # type: () -> ManagerNetworkProtocol
-        network_protocol_data = self._client.get("{0}/NetworkProtocol".format(self._path)).json
-        return ManagerNetworkProtocol.from_json(self._client, network_protocol_data)
+    def get_network_protocol(self, select=None):  # type: (Optional[List[str]]) -> ManagerNetworkProtocol
+        return self._get_subresource(
+            ("NetworkProtocol", tuple(select or ())),
+            lambda: ManagerNetworkProtocol.load(self._client, "{0}/NetworkProtocol".format(self._path), select=select),
+        )
 
     def get_ethernet_interface_collection(self):  # type: () -> List[EthernetInterface]
-        interfaces = []
-        interface_collection = self._client.get("{0}/EthernetInterfaces".format(self._path)).json
-        for member in interface_collection["Members"]:
-            interface_data = self._client.get(member["@odata.id"]).json
-            interfaces.append(EthernetInterface.from_json(self._client, interface_data))
-        return interfaces
+        return self._get_subresource(
+            "EthernetInterfaces",
+            lambda: load_collection(self._client, "{0}/EthernetInterfaces".format(self._path), EthernetInterface),
+        )
+
+    def iter_ethernet_interface_collection(self):  # type: () -> Iterator[EthernetInterface]
+        return iter_collection(self._client, "{0}/EthernetInterfaces".format(self._path), EthernetInterface)
 
     def get_ethernet_interface(self, interface_id):  # type: (str) -> Optional[EthernetInterface]
         if not isinstance(interface_id, str):
@@ -125,12 +136,16 @@ class Manager_v1_9_0(Manager):
         return EthernetInterface.from_json(self._client, interface_data)
 
     def get_virtual_media_collection(self):  # type: () -> List[VirtualMedia]
-        result = []
-        collection = self._client.get("{0}/VirtualMedia".format(self._path)).json
-        for member in collection['Members']:
-            media_data = self._client.get(member["@odata.id"]).json
-            result.append(VirtualMedia.from_json(self._client, media_data))
-        return result
+        return load_collection(self._client, "{0}/VirtualMedia".format(self._path), VirtualMedia)
+
+    def iter_virtual_media_collection(self):  # type: () -> Iterator[VirtualMedia]
+        return iter_collection(self._client, "{0}/VirtualMedia".format(self._path), VirtualMedia)
+
+    def get_log_service(self, service_id):  # type: (str) -> Optional[LogService]
+        try:
+            return LogService.load(self._client, "{0}/LogServices/{1}".format(self._path, service_id))
+        except RESTClientNotFoundError:
+            return None
 
     def get_virtual_media(self, vm_id):  # type: (str) -> Optional[VirtualMedia]
         if not isinstance(vm_id, str):
@@ -10,22 +10,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List
+    from typing import List
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = None
+    List = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import RedfishFieldNotFoundError
 
 
 class ManagerNetworkProtocol(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[ManagerNetworkProtocol]]
-        if version == "#ManagerNetworkProtocol.v1_5_0.ManagerNetworkProtocol":
-            return ManagerNetworkProtocol_v1_5_0
-
     def get_hostname(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
@@ -57,6 +53,7 @@ class ManagerNetworkProtocol(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#ManagerNetworkProtocol.v1_5_0.ManagerNetworkProtocol")
 class ManagerNetworkProtocol_v1_5_0(ManagerNetworkProtocol):
 
     def __init__(self, *args, **kwargs):
@@ -92,20 +89,17 @@ class ManagerNetworkProtocol_v1_5_0(ManagerNetworkProtocol):
     def set_hostname(self, hostname):  # type: (str) -> None
         if not isinstance(hostname, str):
             raise TypeError("HostName must be string. Received: {0}".format(type(hostname)))
-        self._client.patch(self._path, body={"HostName": hostname})
-        self.reload()
+        self._patch({"HostName": hostname})
 
     def set_ipmi_enabled(self, enabled):  # type: (bool) -> None
         if not isinstance(enabled, bool):
             raise TypeError("Enabled must be boolean. Received: {0}".format(type(enabled)))
-        self._client.patch(self._path, body={"IPMI": {"ProtocolEnabled": enabled}})
-        self.reload()
+        self._patch({"IPMI": {"ProtocolEnabled": enabled}})
 
     def set_ntp_enabled(self, enabled):  # type: (bool) -> None
         if not isinstance(enabled, bool):
             raise TypeError("Enabled must be boolean. Received: {0}".format(type(enabled)))
-        self._client.patch(self._path, body={"NTP": {"ProtocolEnabled": enabled}})
-        self.reload()
+        self._patch({"NTP": {"ProtocolEnabled": enabled}})
 
     def set_ntp_servers(self, ntp_servers):  # type: (List[str]) -> None
         if not isinstance(ntp_servers, list):
@@ -113,11 +107,9 @@ class ManagerNetworkProtocol_v1_5_0(ManagerNetworkProtocol):
         for server in ntp_servers:
             if not isinstance(server, str):
                 raise TypeError("NTP server must be string. Received: {0}".format(type(server)))
-        self._client.patch(self._path, body={"NTP": {"NTPServers": ntp_servers}})
-        self.reload()
+        self._patch({"NTP": {"NTPServers": ntp_servers}})
 
     def set_ssh_enabled(self, enabled):  # type: (bool) -> None
         if not isinstance(enabled, bool):
             raise TypeError("Enabled must be boolean. Received: {0}".format(type(enabled)))
-        self._client.patch(self._path, body={"SSH": {"ProtocolEnabled": enabled}})
-        self.reload()
+        self._patch({"SSH": {"ProtocolEnabled": enabled}})
@@ -9,23 +9,13 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-try:
-    from typing import Optional, ClassVar, List
-except ImportError:
-    # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = None
-
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import RedfishFieldNotFoundError
 
 
 class VirtualMedia(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[VirtualMedia_v1_3_0]]
-        if version == "#VirtualMedia.v1_3_0.VirtualMedia":
-            return VirtualMedia_v1_3_0
-
     def insert(
         self,
         image_path,  # type: str
@@ -42,6 +32,7 @@ class VirtualMedia(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#VirtualMedia.v1_3_0.VirtualMedia")
 class VirtualMedia_v1_3_0(VirtualMedia):
 
     def insert(
@@ -10,26 +10,26 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List
+    from typing import Optional, List, Iterator
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = None
+    Optional = List = Iterator = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_collection, iter_collection
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientNotFoundError
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.session.session import Session
 
 
 class SessionService(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[SessionService]]
-        if version == "#SessionService.v1_0_2.SessionService":
-            return SessionService_v1_0_2
-
     def get_session_collection(self):  # type: () -> List[Session]
         raise NotImplementedError("Method not implemented")
 
+    def iter_session_collection(self):  # type: () -> Iterator[Session]
+        raise NotImplementedError("Method not implemented")
+
     def get_session(self, session_id):  # type: (str) -> Optional[Session]
         raise NotImplementedError("Method not implemented")
 
@@ -37,18 +37,17 @@ class SessionService(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#SessionService.v1_0_2.SessionService")
 class SessionService_v1_0_2(SessionService):
 
     def __init__(self, *args, **kwargs):
         super(SessionService_v1_0_2, self).__init__(*args, **kwargs)
 
     def get_session_collection(self):  # type: () -> List[Session]
-        sessions = []
-        sessions_collection = self._client.get("{0}/Sessions".format(self._path)).json
-        for member in sessions_collection["Members"]:
-            session_data = self._client.get(member["@odata.id"]).json
-            sessions.append(Session.from_json(self._client, session_data))
-        return sessions
+        return load_collection(self._client, "{0}/Sessions".format(self._path), Session)
+
+    def iter_session_collection(self):  # type: () -> Iterator[Session]
+        return iter_collection(self._client, "{0}/Sessions".format(self._path), Session)
 
     def get_session(self, session_id):  # type: (str) -> Optional[Session]
         if not isinstance(session_id, str):
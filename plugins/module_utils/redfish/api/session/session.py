@@ -9,22 +9,12 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-try:
-    from typing import Optional, ClassVar
-except ImportError:
-    # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = None
-
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class Session(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Session]]
-        if version == "#Session.v1_3_0.Session":
-            return Session_v1_3_0
-
     def get_username(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
@@ -32,6 +22,7 @@ class Session(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Session.v1_3_0.Session")
 class Session_v1_3_0(Session):
 
     def __init__(self, *args, **kwargs):
@@ -9,26 +9,17 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-try:
-    from typing import Optional, ClassVar, Dict
-except ImportError:
-    # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = Dict = None
-
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class Bios(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Bios]]
-        if version == "#Bios.v1_1_0.Bios":
-            return Bios_v1_1_0
-
     def reset(self):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Bios.v1_1_0.Bios")
 class Bios_v1_1_0(Bios):
 
     def reset(self):
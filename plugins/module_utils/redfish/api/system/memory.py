@@ -10,20 +10,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, Dict
+    from typing import Dict
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = Dict = None
+    Dict = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class Memory(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Memory]]
-        if version == "#Memory.v1_7_0.Memory":
-            return Memory_v1_7_0
+    __slots__ = ()
 
     def get_part_number(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
@@ -56,8 +54,24 @@ class Memory(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Memory.v1_7_0.Memory")
 class Memory_v1_7_0(Memory):
 
+    __slots__ = ()
+
+    FIELDS = (
+        "PartNumber",
+        "SerialNumber",
+        "MemoryDeviceType",
+        "Status",
+        "Manufacturer",
+        "DeviceLocator",
+        "CapacityMiB",
+        "OperatingSpeedMhz",
+        "DataWidthBits",
+        "SpareDeviceCount",
+    )
+
     def __init__(self, *args, **kwargs):
         super(Memory_v1_7_0, self).__init__(*args, **kwargs)
 
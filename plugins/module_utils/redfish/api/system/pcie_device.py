@@ -10,21 +10,20 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List
+    from typing import List, Iterator
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = None
+    List = Iterator = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_collection, iter_collection
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.system.pcie_function import PCIeFunction
 
 
 class PCIeDevice(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[PCIeDevice]]
-        if version == "#PCIeDevice.v1_4_0.PCIeDevice":
-            return PCIeDevice_v1_4_0
+    __slots__ = ()
 
     def get_address(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
@@ -35,12 +34,23 @@ class PCIeDevice(RedfishAPIObject):
     def get_manufacturer(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
-    def get_function_collection(self):  # type: () -> List[PCIeFunction]
+    def get_function_collection(self, compact=False):  # type: (bool) -> List[PCIeFunction]
+        raise NotImplementedError("Method not implemented")
+
+    def iter_function_collection(self, compact=False):  # type: (bool) -> Iterator[PCIeFunction]
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#PCIeDevice.v1_4_0.PCIeDevice")
 class PCIeDevice_v1_4_0(PCIeDevice):
 
+    __slots__ = ()
+
+    FIELDS = (
+        "Model",
+        "Manufacturer",
+    )
+
     def __init__(self, *args, **kwargs):
         super(PCIeDevice_v1_4_0, self).__init__(*args, **kwargs)
 
@@ -66,10 +76,10 @@ class PCIeDevice_v1_4_0(PCIeDevice):
     def get_manufacturer(self):  # type: () -> str
         return self._get_field("Manufacturer")
 
-    def get_function_collection(self):  # type: () -> List[PCIeFunction]
-        functions = []
-        functions_collection = self._client.get("{0}/PCIeFunctions".format(self._path)).json
-        for member in functions_collection["Members"]:
-            function_data = self._client.get(member["@odata.id"]).json
-            functions.append(PCIeFunction.from_json(self._client, function_data))
-        return functions
+    def get_function_collection(self, compact=False):  # type: (bool) -> List[PCIeFunction]
+        return self._get_subresource(
+            ("PCIeFunctions", compact),
+            lambda: load_collection(self._client, "{0}/PCIeFunctions".format(self._path), PCIeFunction, compact=compact))
+
+    def iter_function_collection(self, compact=False):  # type: (bool) -> Iterator[PCIeFunction]
+        return iter_collection(self._client, "{0}/PCIeFunctions".format(self._path), PCIeFunction, compact=compact)
@@ -9,21 +9,13 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-try:
-    from typing import Optional, ClassVar
-except ImportError:
-    # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = None
-
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class PCIeFunction(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[PCIeFunction]]
-        if version == "#PCIeFunction.v1_2_0.PCIeFunction":
-            return PCIeFunction_v1_2_0
+    __slots__ = ()
 
     def get_device_class(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
@@ -47,8 +39,21 @@ class PCIeFunction(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#PCIeFunction.v1_2_0.PCIeFunction")
 class PCIeFunction_v1_2_0(PCIeFunction):
 
+    __slots__ = ()
+
+    FIELDS = (
+        "DeviceClass",
+        "ClassCode",
+        "RevisionId",
+        "VendorId",
+        "DeviceId",
+        "SubsystemVendorId",
+        "SubsystemId",
+    )
+
     def __init__(self, *args, **kwargs):
         super(PCIeFunction_v1_2_0, self).__init__(*args, **kwargs)
 
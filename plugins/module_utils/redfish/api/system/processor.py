@@ -10,20 +10,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, Dict
+    from typing import Dict
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = Dict = None
+    Dict = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
 
 
 class Processor(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[Processor]]
-        if version == "#Processor.v1_9_0.Processor":
-            return Processor_v1_9_0
+    __slots__ = ()
 
     def get_model(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
@@ -50,8 +48,22 @@ class Processor(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#Processor.v1_9_0.Processor")
 class Processor_v1_9_0(Processor):
 
+    __slots__ = ()
+
+    FIELDS = (
+        "Model",
+        "Socket",
+        "InstructionSet",
+        "Manufacturer",
+        "ProcessorArchitecture",
+        "ProcessorType",
+        "TotalCores",
+        "Status",
+    )
+
     def __init__(self, *args, **kwargs):
         super(Processor_v1_9_0, self).__init__(*args, **kwargs)
 
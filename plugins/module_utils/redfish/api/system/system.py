@@ -10,25 +10,24 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, Dict, List
+    from typing import Dict, List, Iterator, Optional
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = Dict = List = None
+    Dict = List = Iterator = Optional = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_collection, iter_collection
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientNotFoundError
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.system.processor import Processor
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.system.pcie_device import PCIeDevice
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.system.memory import Memory
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.system.bios import Bios
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.log.service import LogService
 
 
 class System(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[System]]
-        if version == "#ComputerSystem.v1_13_0.ComputerSystem":
-            return System_v1_13_0
-
     def get_bios(self):  # type: () -> Bios
         raise NotImplementedError("Method not implemented")
 
@@ -47,13 +46,22 @@ class System(RedfishAPIObject):
     def get_manufacturer(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
-    def get_processor_collection(self):  # type: () -> List[Processor]
+    def get_processor_collection(self, compact=False):  # type: (bool) -> List[Processor]
+        raise NotImplementedError("Method not implemented")
+
+    def iter_processor_collection(self, compact=False):  # type: (bool) -> Iterator[Processor]
+        raise NotImplementedError("Method not implemented")
+
+    def get_pcie_device_collection(self, compact=False):  # type: (bool) -> List[PCIeDevice]
+        raise NotImplementedError("Method not implemented")
+
+    def iter_pcie_device_collection(self, compact=False):  # type: (bool) -> Iterator[PCIeDevice]
         raise NotImplementedError("Method not implemented")
 
-    def get_pcie_device_collection(self):  # type: () -> List[PCIeDevice]
+    def get_memory_collection(self, compact=False):  # type: (bool) -> List[Memory]
         raise NotImplementedError("Method not implemented")
 
-    def get_memory_collection(self):  # type: () -> List[Memory]
+    def iter_memory_collection(self, compact=False):  # type: (bool) -> Iterator[Memory]
         raise NotImplementedError("Method not implemented")
 
     def get_boot_source_override(self):  # type: () -> Dict
@@ -62,6 +70,9 @@ class System(RedfishAPIObject):
     def set_boot_source_override(self, config):  # type: (Dict) -> None
         raise NotImplementedError("Method not implemented")
 
+    def get_log_service(self, service_id):  # type: (str) -> Optional[LogService]
+        raise NotImplementedError("Method not implemented")
+
     def get_power_state(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
 
@@ -84,14 +95,14 @@ class System(RedfishAPIObject):
         raise NotImplementedError("Method not implemented")
 
 
+@register_version("#ComputerSystem.v1_13_0.ComputerSystem")
 class System_v1_13_0(System):
 
     def __init__(self, *args, **kwargs):
         super(System_v1_13_0, self).__init__(*args, **kwargs)
 
     def get_bios(self):  # type: () -> Bios
-        bios_data = self._client.get("{0}/Bios".format(self._path)).json
-        return Bios.from_json(self._client, bios_data)
+        return self._get_subresource("Bios", lambda: Bios.load(self._client, "{0}/Bios".format(self._path)))
 
     def get_model(self):  # type: () -> str
         return self._get_field("Model")
@@ -108,29 +119,29 @@ class System_v1_13_0(System):
     def get_manufacturer(self):  # type: () -> str
         return self._get_field("Manufacturer")
 
-    def get_processor_collection(self):  # type: () -> List[Processor]
-        processors = []
-        processors_collection = self._client.get("{0}/Processors".format(self._path)).json
-        for member in processors_collection["Members"]:
-            processor_data = self._client.get(member["@odata.id"]).json
-            processors.append(Processor.from_json(self._client, processor_data))
-        return processors
-
-    def get_pcie_device_collection(self):  # type: () -> List[PCIeDevice]
-        pcie_devices = []
-        pcie_devices_collection = self._client.get("{0}/PCIeDevices".format(self._path)).json
-        for member in pcie_devices_collection["Members"]:
-            pcie_device_data = self._client.get(member["@odata.id"]).json
-            pcie_devices.append(PCIeDevice.from_json(self._client, pcie_device_data))
-        return pcie_devices
-
-    def get_memory_collection(self):  # type: () -> List[Memory]
-        memory = []
-        memory_collection = self._client.get("{0}/Memory".format(self._path)).json
-        for member in memory_collection["Members"]:
-            memory_data = self._client.get(member["@odata.id"]).json
-            memory.append(Memory.from_json(self._client, memory_data))
-        return memory
+    def get_processor_collection(self, compact=False):  # type: (bool) -> List[Processor]
+        return self._get_subresource(
+            ("Processors", compact),
+            lambda: load_collection(self._client, "{0}/Processors".format(self._path), Processor, compact=compact))
+
+    def iter_processor_collection(self, compact=False):  # type: (bool) -> Iterator[Processor]
+        return iter_collection(self._client, "{0}/Processors".format(self._path), Processor, compact=compact)
+
+    def get_pcie_device_collection(self, compact=False):  # type: (bool) -> List[PCIeDevice]
+        return self._get_subresource(
+            ("PCIeDevices", compact),
+            lambda: load_collection(self._client, "{0}/PCIeDevices".format(self._path), PCIeDevice, compact=compact))
+
+    def iter_pcie_device_collection(self, compact=False):  # type: (bool) -> Iterator[PCIeDevice]
+        return iter_collection(self._client, "{0}/PCIeDevices".format(self._path), PCIeDevice, compact=compact)
+
+    def get_memory_collection(self, compact=False):  # type: (bool) -> List[Memory]
+        return self._get_subresource(
+            ("Memory", compact),
+            lambda: load_collection(self._client, "{0}/Memory".format(self._path), Memory, compact=compact))
+
+    def iter_memory_collection(self, compact=False):  # type: (bool) -> Iterator[Memory]
+        return iter_collection(self._client, "{0}/Memory".format(self._path), Memory, compact=compact)
 
     def get_boot_source_override(self):  # type: () -> Dict
         return self._get_field("Boot")
@@ -144,8 +155,13 @@ class System_v1_13_0(System):
             if k not in known_keys:
                 raise ValueError("Unknown key: {0}".format(k))
 
-        self._client.patch(self._path, body={"Boot": config})
-        self.reload()
+        self._patch({"Boot": config})
+
+    def get_log_service(self, service_id):  # type: (str) -> Optional[LogService]
+        try:
+            return LogService.load(self._client, "{0}/LogServices/{1}".format(self._path, service_id))
+        except RESTClientNotFoundError:
+            return None
 
     def get_power_state(self):  # type: () -> str
         return self._get_field("PowerState")
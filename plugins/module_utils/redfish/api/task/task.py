@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional, List, Dict
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = List = Dict = None
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+
+TASK_FINISHED_STATES = ("Completed", "Exception", "Killed", "Cancelled")
+TASK_FAILED_STATES = ("Exception", "Killed", "Cancelled")
+
+
+class Task(RedfishAPIObject):
+
+    def get_task_state(self):  # type: () -> str
+        raise NotImplementedError("Method not implemented")
+
+    def get_task_status(self):  # type: () -> str
+        raise NotImplementedError("Method not implemented")
+
+    def get_percent_complete(self):  # type: () -> Optional[int]
+        raise NotImplementedError("Method not implemented")
+
+    def get_messages(self):  # type: () -> List[Dict]
+        raise NotImplementedError("Method not implemented")
+
+    def is_finished(self):  # type: () -> bool
+        return self.get_task_state() in TASK_FINISHED_STATES
+
+    def is_failed(self):  # type: () -> bool
+        return self.get_task_state() in TASK_FAILED_STATES
+
+
+@register_version("#Task.v1_4_3.Task")
+class Task_v1_4_3(Task):
+
+    def __init__(self, *args, **kwargs):
+        super(Task_v1_4_3, self).__init__(*args, **kwargs)
+
+    def get_task_state(self):  # type: () -> str
+        return self._get_field("TaskState")
+
+    def get_task_status(self):  # type: () -> str
+        return self._get_field("TaskStatus")
+
+    def get_percent_complete(self):  # type: () -> Optional[int]
+        return self._data.get("PercentComplete")
+
+    def get_messages(self):  # type: () -> List[Dict]
+        return self._data.get("Messages", [])
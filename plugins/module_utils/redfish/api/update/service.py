@@ -11,65 +11,103 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, List
+    from typing import Optional, List, Union, IO, Iterator
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = List = None
+    Optional = List = Union = IO = Iterator = None
+
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_collection, iter_collection
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientNotFoundError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.response import HTTPClientResponse
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishError
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.update.software_inventory import SoftwareInventory
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.task.task import Task
 
 
 class UpdateService(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[UpdateService]]
-        if version == "#UpdateService.v1_4_0.UpdateService":
-            return UpdateService_v1_4_0
+    def get_firmware_inventory_collection(self, compact=False):  # type: (bool) -> List[SoftwareInventory]
+        raise NotImplementedError("Method not implemented")
 
-    def get_firmware_inventory_collection(self):  # type: () -> List[SoftwareInventory]
+    def iter_firmware_inventory_collection(self, compact=False):  # type: (bool) -> Iterator[SoftwareInventory]
         raise NotImplementedError("Method not implemented")
 
-    def get_firmware_inventory(self, inventory_id):  # type: (str) -> Optional[SoftwareInventory]
+    def get_firmware_inventory(self, inventory_id, select=None):
+        # type: (str, Optional[List[str]]) -> Optional[SoftwareInventory]
         raise NotImplementedError("Method not implemented")
 
-    def upload_image(self, image):  # type: (bytes) -> None
+    def get_firmware_inventory_ids(self):  # type: () -> List[str]
         raise NotImplementedError("Method not implemented")
 
-    def simple_update(self, image_uri):  # type: (str) -> None
+    def upload_image(self, image, length=None):  # type: (Union[bytes, IO[bytes]], Optional[int]) -> Optional[Task]
         raise NotImplementedError("Method not implemented")
 
+    def simple_update(self, image_uri):  # type: (str) -> Optional[Task]
+        raise NotImplementedError("Method not implemented")
 
+
+@register_version("#UpdateService.v1_4_0.UpdateService")
 class UpdateService_v1_4_0(UpdateService):
 
     def __init__(self, *args, **kwargs):
         super(UpdateService_v1_4_0, self).__init__(*args, **kwargs)
 
-    def get_firmware_inventory_collection(self):  # type: () -> List[SoftwareInventory]
-        inventories = []
-        inventories_collection = self._client.get("{0}/FirmwareInventory".format(self._path)).json
-        for member in inventories_collection["Members"]:
-            inventory_data = self._client.get(member["@odata.id"]).json
-            inventories.append(SoftwareInventory.from_json(self._client, inventory_data))
-        return inventories
+    def get_firmware_inventory_collection(self, compact=False):  # type: (bool) -> List[SoftwareInventory]
+        return load_collection(
+            self._client, "{0}/FirmwareInventory".format(self._path), SoftwareInventory, compact=compact)
+
+    def iter_firmware_inventory_collection(self, compact=False):  # type: (bool) -> Iterator[SoftwareInventory]
+        return iter_collection(
+            self._client, "{0}/FirmwareInventory".format(self._path), SoftwareInventory, compact=compact)
 
-    def get_firmware_inventory(self, inventory_id):  # type: (str) -> Optional[SoftwareInventory]
+    def get_firmware_inventory(self, inventory_id, select=None):
+        # type: (str, Optional[List[str]]) -> Optional[SoftwareInventory]
         if not isinstance(inventory_id, str):
             raise TypeError("Inventory id must be string. Received: {0}".format(type(inventory_id)))
 
         inventory_path = "{0}/FirmwareInventory/{1}".format(self._path, inventory_id)
         try:
-            inventory_data = self._client.get(inventory_path).json
+            return SoftwareInventory.load(self._client, inventory_path, select=select)
         except RESTClientNotFoundError:
             return None
-        return SoftwareInventory.from_json(self._client, inventory_data)
 
-    def simple_update(self, image_uri):  # type: (str) -> None
-        self._client.post(
+    def get_firmware_inventory_ids(self):  # type: () -> List[str]
+        """Lists inventory ids reading only the collection, without its members."""
+        collection_data = self._client.get("{0}/FirmwareInventory".format(self._path)).json
+        return [member["@odata.id"].rstrip("/").rsplit("/", 1)[-1] for member in collection_data["Members"]]
+
+    def simple_update(self, image_uri):  # type: (str) -> Optional[Task]
+        response = self._client.post(
             self._path + '/Actions/UpdateService.SimpleUpdate',
             body={'ImageURI': image_uri},
         )
+        return self._get_task(response)
+
+    def upload_image(self, image, length=None):  # type: (Union[bytes, IO[bytes]], Optional[int]) -> Optional[Task]
+        """Uploads image. File-like image is streamed, length is required if it can't be measured, e.g. for sockets."""
+        headers = {"Content-Length": str(length)} if length is not None else None
+        response = self._client.post(self._path, body=image, headers=headers)
+        return self._get_task(response)
 
-    def upload_image(self, image):  # type: (bytes) -> None
-        self._client.post(self._path, body=image)
+    def _get_task(self, response):  # type: (HTTPClientResponse) -> Optional[Task]
+        """Returns task created by service to track the request, if any."""
+        try:
+            data = response.json
+        except ValueError:
+            data = None
+        try:
+            if isinstance(data, dict) and data.get("@odata.type", "").startswith("#Task."):
+                return Task.from_json(self._client, data)
+            location = dict((name.lower(), value) for name, value in response.headers.items()).get("location")
+            if location:
+                # Task monitor returns the task while it runs, task is reloaded by its own path then.
+                return Task.load(self._client, urlsplit(location).path)
+        except (RedfishError, ValueError):
+            # Unknown task version or task monitor not returning task, e.g. 204 with empty body.
+            # Caller falls back to polling.
+            pass
+        return None
@@ -10,20 +10,19 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, ClassVar, Dict
+    from typing import Dict
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = ClassVar = Dict = None
+    Dict = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import register_version
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import RedfishFieldNotFoundError
 
 
 class SoftwareInventory(RedfishAPIObject):
 
-    @classmethod
-    def select_version(cls, version):  # type: (str) -> Optional[ClassVar[SoftwareInventory]]
-        if version == "#SoftwareInventory.v1_1_0.SoftwareInventory":
-            return SoftwareInventory_v1_1_0
+    __slots__ = ()
 
     def get_description(self):  # type: () -> str
         raise NotImplementedError("Method not implemented")
@@ -37,9 +36,22 @@ class SoftwareInventory(RedfishAPIObject):
     def get_status(self):  # type: () -> Dict
         raise NotImplementedError("Method not implemented")
 
+    def get_activation(self):  # type: () -> str
+        raise NotImplementedError("Method not implemented")
+
 
+@register_version("#SoftwareInventory.v1_1_0.SoftwareInventory")
 class SoftwareInventory_v1_1_0(SoftwareInventory):
 
+    __slots__ = ()
+
+    FIELDS = (
+        "Description",
+        "Updateable",
+        "Version",
+        "Status",
+    )
+
     def __init__(self, *args, **kwargs):
         super(SoftwareInventory_v1_1_0, self).__init__(*args, **kwargs)
 
@@ -54,3 +66,11 @@ class SoftwareInventory_v1_1_0(SoftwareInventory):
 
     def get_status(self):  # type: () -> Dict
         return self._get_field("Status")
+
+    def get_activation(self):  # type: () -> str
+        """Returns D-Bus activation state of the image, which isn't exposed with Redfish."""
+        activation_data = self._client.get("/xyz/openbmc_project/software/{0}".format(self.get_id())).json
+        try:
+            return activation_data["data"]["Activation"]
+        except KeyError:
+            raise RedfishFieldNotFoundError("['data']['Activation']")
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional, Dict, List, Tuple, Callable, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = Dict = List = Tuple = Callable = Any = None
+
+import re
+
+# Matches versioned @odata.type, like #Manager.v1_9_0.Manager, with suffix added for mockup systems.
+_ODATA_TYPE_PATTERN = re.compile(r"^#(\w+)\.v(\d+)_(\d+)_(\d+)\.(\w+)(\.Mockup)?$")
+
+# Parsed @odata.type values: (namespace, type, mockup) and version, None if type isn't versioned.
+_parsed_types = {}  # type: Dict[str, Optional[Tuple[Tuple[str, str, bool], Tuple[int, int, int]]]]
+
+# Implementations registered for each resource type: since and until versions and class.
+_registry = {}  # type: Dict[Tuple[str, str, bool], List[Tuple[Tuple[int, int, int], Tuple[int, int, int], Any]]]
+
+
+def parse_odata_type(odata_type):
+    # type: (str) -> Optional[Tuple[Tuple[str, str, bool], Tuple[int, int, int]]]
+    """Splits @odata.type into resource type key and version.
+
+    Example::
+
+        parse_odata_type("#Thermal.v1_4_1.Fan") == (("Thermal", "Fan", False), (1, 4, 1))
+    """
+    if odata_type not in _parsed_types:
+        match = _ODATA_TYPE_PATTERN.match(odata_type)
+        if match is None:
+            _parsed_types[odata_type] = None
+        else:
+            namespace, major, minor, errata, type_name, mockup = match.groups()
+            _parsed_types[odata_type] = (
+                (namespace, type_name, bool(mockup)),
+                (int(major), int(minor), int(errata)),
+            )
+    return _parsed_types[odata_type]
+
+
+def register_version(since, until=None):  # type: (str, Optional[str]) -> Callable[[Any], Any]
+    """Class decorator registering implementation of resource for schema versions from since up to until.
+
+    Versions are given as @odata.type values, until is excluded. By default, implementation
+    covers all following versions with the same major number, as they are backward compatible.
+    Implementations for mockup systems are registered with .Mockup suffix of the type.
+
+    Example::
+
+        @register_version("#Manager.v1_9_0.Manager")
+        class Manager_v1_9_0(Manager):
+            ...
+    """
+    parsed_since = parse_odata_type(since)
+    if parsed_since is None:
+        raise ValueError("Versioned @odata.type expected. Received: {0}".format(since))
+    key, since_version = parsed_since
+    if until is None:
+        until_version = (since_version[0] + 1, 0, 0)
+    else:
+        parsed_until = parse_odata_type(until)
+        if parsed_until is None or parsed_until[0] != key:
+            raise ValueError("Version of {0} expected. Received: {1}".format(since, until))
+        until_version = parsed_until[1]
+
+    def decorator(impl):
+        _registry.setdefault(key, []).append((since_version, until_version, impl))
+        return impl
+
+    return decorator
+
+
+def find_version(base, odata_type):  # type: (Any, str) -> Optional[Any]
+    """Returns subclass of base registered for the @odata.type value, latest one if ranges overlap."""
+    parsed = parse_odata_type(odata_type)
+    if parsed is None:
+        return None
+    key, version = parsed
+    found = None
+    found_since = None
+    for since_version, until_version, impl in _registry.get(key, ()):
+        if since_version <= version < until_version and issubclass(impl, base):
+            if found_since is None or since_version >= found_since:
+                found, found_since = impl, since_version
+    return found
+
+
+def find_registered(odata_type):  # type: (str) -> List[Any]
+    """Returns all implementations registered for versions including the @odata.type value."""
+    parsed = parse_odata_type(odata_type)
+    if parsed is None:
+        return []
+    key, version = parsed
+    return [impl for since_version, until_version, impl in _registry.get(key, ()) if since_version <= version < until_version]
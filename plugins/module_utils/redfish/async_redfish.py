@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Python 3 only: module uses asyncio and async syntax.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional, List, Dict, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = List = Dict = Any = None
+
+import asyncio
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import AuthMethod, NoAuth, SessionAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.async_rest import (
+    AsyncRESTClient,
+    DEFAULT_MAX_CONNECTIONS,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
+    RESTClientNotFoundError,
+    RESTClientRequestError,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.token_cache import SessionTokenCache
+
+
+class AsyncRedfishAPI:
+    """Asynchronous counterpart of RedfishAPI, so one event loop can drive many BMCs at once.
+
+    Resources are returned as JSON documents: API objects issue blocking requests when they
+    are used and can't be bound to the asynchronous client.
+
+    Example::
+
+        async with AsyncRedfishAPI(hostname) as redfish:
+            await redfish.login(username, password)
+            system = await redfish.get_system("system")
+    """
+
+    def __init__(self, hostname, base_prefix="/redfish/v1", port=443, validate_certs=True, timeout=30, auth=NoAuth(),
+                 max_connections=DEFAULT_MAX_CONNECTIONS):
+        # type: (str, str, int, bool, int, AuthMethod, int) -> None
+        self._client = AsyncRESTClient(
+            auth=auth,
+            hostname=hostname,
+            port=port,
+            validate_certs=validate_certs,
+            timeout=timeout,
+            max_connections=max_connections,
+            service_root_path=base_prefix,
+        )
+        self._base_prefix = base_prefix
+        self._session_path = None  # type: Optional[str]
+        self._token_cache = None  # type: Optional[SessionTokenCache]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.logout()
+        await self._client.close()
+
+    async def login(self, username, password, token_cache=None):
+        # type: (str, str, Optional[SessionTokenCache]) -> None
+        """Switches following requests to session authentication, same as RedfishAPI.login."""
+        server = self._client.get_base_url()
+        self._token_cache = token_cache
+        cached = token_cache.get(server, username, password) if token_cache else None
+        if cached:
+            token, self._session_path = cached
+        else:
+            try:
+                token = await self._open_session(username, password)
+            except RESTClientNotFoundError:
+                return
+            except RESTClientRequestError as e:
+                if e.status_code != 405:
+                    raise
+                return
+
+        async def reauthenticate():
+            return SessionAuth(await self._open_session(username, password))
+
+        self._client.set_auth(SessionAuth(token), reauthenticate=reauthenticate)
+
+    async def _open_session(self, username, password):  # type: (str, str) -> str
+        session = await self.create_session(username, password)
+        self._session_path = "{0}/SessionService/Sessions/{1}".format(self._base_prefix, session["Id"])
+        if self._token_cache:
+            self._token_cache.put(self._client.get_base_url(), username, password, session["Token"], self._session_path)
+        return session["Token"]
+
+    async def logout(self):  # type: () -> None
+        if self._session_path and not self._token_cache:
+            try:
+                await self._client.delete(self._session_path)
+            except RedfishError:
+                # Session expires on the server anyway
+                pass
+        self._session_path = None
+
+    async def create_session(self, username, password):  # type: (str, str) -> Dict[str, Any]
+        if not isinstance(username, str):
+            raise TypeError("Username must be string. Received: {0}".format(type(username)))
+        if not isinstance(password, str):
+            raise TypeError("Password must be string. Received: {0}".format(type(password)))
+
+        sessions_path = "{0}/SessionService/Sessions".format(self._base_prefix)
+        response = await self._client.post(sessions_path, body={
+            "UserName": username,
+            "Password": password,
+        })
+        session_data = response.json
+        session_data["Token"] = response.headers.get("X-Auth-Token")
+        return session_data
+
+    async def get_resource(self, path, select=None):  # type: (str, Optional[List[str]]) -> Dict[str, Any]
+        return (await self._client.get(path, select=select)).json
+
+    async def get_collection(self, path):  # type: (str) -> List[Dict[str, Any]]
+        """Reads collection members, inlined with $expand if service supports it, or concurrently."""
+        expand = (await self._client.get_protocol_features()).get("ExpandQuery") or {}
+        query = None
+        if expand.get("NoLinks") or expand.get("ExpandAll"):
+            query = {"$expand": ("." if expand.get("NoLinks") else "*") + ("($levels=1)" if expand.get("Levels") else "")}
+        try:
+            collection_data = (await self._client.get(path, query_params=query)).json
+        except RESTClientRequestError as e:
+            if query is None or not e.is_query_unsupported():
+                raise
+            await self._client.disable_protocol_feature("ExpandQuery")
+            collection_data = (await self._client.get(path)).json
+
+        members = list(collection_data["Members"])
+        missing = [i for i, member in enumerate(members) if "@odata.type" not in member]
+        missing_data = await asyncio.gather(*[self.get_resource(members[i]["@odata.id"]) for i in missing])
+        for i, member_data in zip(missing, missing_data):
+            members[i] = member_data
+        return members
+
+    async def _get_member(self, collection, member_id):  # type: (str, str) -> Optional[Dict[str, Any]]
+        if not isinstance(member_id, str):
+            raise TypeError("Member id must be string. Received: {0}".format(type(member_id)))
+        try:
+            return await self.get_resource("{0}/{1}/{2}".format(self._base_prefix, collection, member_id))
+        except RESTClientNotFoundError:
+            return None
+
+    async def get_update_service(self):  # type: () -> Dict[str, Any]
+        return await self.get_resource("{0}/UpdateService".format(self._base_prefix))
+
+    async def get_firmware_inventory_collection(self):  # type: () -> List[Dict[str, Any]]
+        return await self.get_collection("{0}/UpdateService/FirmwareInventory".format(self._base_prefix))
+
+    async def get_manager_collection(self):  # type: () -> List[Dict[str, Any]]
+        return await self.get_collection("{0}/Managers".format(self._base_prefix))
+
+    async def get_manager(self, manager_id):  # type: (str) -> Optional[Dict[str, Any]]
+        return await self._get_member("Managers", manager_id)
+
+    async def get_system_collection(self):  # type: () -> List[Dict[str, Any]]
+        return await self.get_collection("{0}/Systems".format(self._base_prefix))
+
+    async def get_system(self, system_id):  # type: (str) -> Optional[Dict[str, Any]]
+        return await self._get_member("Systems", system_id)
+
+    async def get_chassis_collection(self):  # type: () -> List[Dict[str, Any]]
+        return await self.get_collection("{0}/Chassis".format(self._base_prefix))
+
+    async def get_chassis(self, chassis_id):  # type: (str) -> Optional[Dict[str, Any]]
+        return await self._get_member("Chassis", chassis_id)
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Python 3 only: module uses asyncio and async syntax.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable, Union
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Dict = Any = Optional = List = Tuple = Callable = Awaitable = Union = None
+
+import json
+import asyncio
+from io import BytesIO
+from ansible.module_utils.urls import basic_auth_header
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.http import build_url
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.pool import ConnectionPool, PooledResponse
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.retry import IDEMPOTENT_METHODS
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.response import HTTPClientResponse
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
+    HTTPClientError,
+    RESTClientUnauthorized,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import (
+    DEFAULT_SERVICE_ROOT_PATH,
+    map_request_error,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import AuthMethod, NoAuth, BasicAuth, SessionAuth
+
+DEFAULT_MAX_CONNECTIONS = 4
+
+
+class _StaleConnectionError(Exception):
+    """Kept-alive connection was closed by the server before the response was started."""
+
+
+class AsyncHTTPClient:
+    """HTTP/1.1 client on asyncio streams, so a single event loop can talk to many servers.
+
+    Up to max_connections requests are sent at the same time, idle connections are kept alive
+    and reused. Errors are raised as HTTPError and URLError, as by open_url.
+    Proxies and redirects are not supported.
+    """
+
+    def __init__(self, hostname, port, validate_certs, timeout, auth, max_connections=DEFAULT_MAX_CONNECTIONS):
+        # type: (str, int, bool, int, AuthMethod, int) -> None
+        if "://" in hostname:
+            self._protocol, self._hostname = hostname.split("://")
+        else:
+            self._protocol = "https"
+            self._hostname = hostname
+
+        self._port = port
+        self._base_url = "{0}://{1}:{2}".format(self._protocol, self._hostname, self._port)
+        self._auth = auth
+
+        self.validate_certs = validate_certs
+        self.timeout = timeout
+        self.max_connections = max_connections
+
+        self._ssl_context = None
+        if self._protocol == "https":
+            self._ssl_context = ConnectionPool._create_ssl_context(validate_certs)
+        self._idle = []  # type: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+        # Created on first request to be bound to the running loop.
+        self._semaphore = None  # type: Optional[asyncio.Semaphore]
+
+    def get_base_url(self):  # type: () -> str
+        return self._base_url
+
+    async def close(self):  # type: () -> None
+        idle, self._idle = self._idle, []
+        for reader, writer in idle:
+            writer.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def make_request(self, path, method, query_params=None, body=None, headers=None):
+        # type: (str, str, Dict, Union[Dict, bytes], Dict) -> HTTPClientResponse
+        return await self._make_request(path, method, query_params, body, headers)
+
+    async def _make_request(self, path, method, query_params, body, headers):
+        # type: (str, str, Dict, Union[Dict, bytes], Dict) -> HTTPClientResponse
+        request_headers = {}  # type: Dict[str, str]
+        if body:
+            if isinstance(body, dict) or isinstance(body, list):
+                request_headers["Content-Type"] = "application/json"
+                request_body = json.dumps(body).encode("utf-8")
+            elif isinstance(body, bytes):
+                request_headers["Content-Type"] = "application/octet-stream"
+                request_body = body
+            else:
+                raise HTTPClientError("Unsupported body type: {0}".format(type(body)))
+        else:
+            request_body = b""
+
+        if isinstance(self._auth, NoAuth):
+            pass
+        elif isinstance(self._auth, BasicAuth):
+            request_headers["Authorization"] = basic_auth_header(self._auth.username, self._auth.password)
+        elif isinstance(self._auth, SessionAuth):
+            request_headers["X-Auth-Token"] = self._auth.token
+        else:
+            raise HTTPClientError("Unsupported auth type: {0}".format(type(self._auth)))
+
+        if headers:
+            request_headers.update(headers)
+
+        url = build_url(self._base_url, path, query_params=query_params)
+        target = url[len(self._base_url):] or "/"
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        try:
+            async with self._semaphore:
+                response = await asyncio.wait_for(
+                    self._send(method, target, request_body, request_headers), self.timeout,
+                )
+        except asyncio.TimeoutError:
+            raise URLError("Request timed out: {0}".format(url))
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            raise URLError(e)
+
+        response.url = url
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, BytesIO(response.read()))
+        return HTTPClientResponse(response)
+
+    async def _connect(self):  # type: () -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        server_hostname = self._hostname if self._ssl_context else None
+        return await asyncio.open_connection(
+            self._hostname, self._port, ssl=self._ssl_context, server_hostname=server_hostname,
+        )
+
+    async def _send(self, method, target, body, headers):
+        # type: (str, str, bytes, Dict[str, str]) -> PooledResponse
+        while self._idle:
+            connection = self._idle.pop()
+            if connection[0].at_eof():
+                # Server closed the idle connection, nothing was sent on it yet.
+                connection[1].close()
+                continue
+            try:
+                return await self._exchange(connection, method, target, body, headers)
+            except (_StaleConnectionError, ConnectionResetError, BrokenPipeError) as e:
+                # Server dropped the idle connection. It may have processed the request before,
+                # so only idempotent request is repeated once on a fresh connection.
+                if method not in IDEMPOTENT_METHODS:
+                    raise URLError(e)
+            break
+        connection = await self._connect()
+        try:
+            return await self._exchange(connection, method, target, body, headers)
+        except _StaleConnectionError as e:
+            raise URLError(e)
+
+    async def _exchange(self, connection, method, target, body, headers):
+        # type: (Tuple[asyncio.StreamReader, asyncio.StreamWriter], str, str, bytes, Dict[str, str]) -> PooledResponse
+        reader, writer = connection
+        try:
+            head = ["{0} {1} HTTP/1.1".format(method, target), "Host: {0}:{1}".format(self._hostname, self._port)]
+            head.extend("{0}: {1}".format(name, value) for name, value in headers.items())
+            if body or method in ("POST", "PATCH", "PUT"):
+                head.append("Content-Length: {0}".format(len(body)))
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            if not status_line:
+                raise _StaleConnectionError("Connection closed by server")
+            status_parts = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+            status = int(status_parts[1])
+            reason = status_parts[2] if len(status_parts) > 2 else ""
+
+            response_headers = []  # type: List[Tuple[str, str]]
+            while True:
+                line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                response_headers.append((name.strip(), value.strip()))
+            fields = dict((name.lower(), value) for name, value in response_headers)
+
+            will_close = fields.get("connection", "").lower() == "close"
+            if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+                response_body = b""
+            elif fields.get("transfer-encoding", "").lower() == "chunked":
+                response_body = await self._read_chunked(reader)
+            elif "content-length" in fields:
+                response_body = await reader.readexactly(int(fields["content-length"]))
+            else:
+                response_body = await reader.read()
+                will_close = True
+        except BaseException:
+            writer.close()
+            raise
+
+        if will_close or len(self._idle) >= self.max_connections:
+            writer.close()
+        else:
+            self._idle.append(connection)
+        return PooledResponse(target, status, reason, response_headers, response_body)
+
+    @staticmethod
+    async def _read_chunked(reader):  # type: (asyncio.StreamReader) -> bytes
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Skip trailers
+                while (await reader.readline()).strip():
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    async def get(self, path, query_params=None, headers=None):  # type: (str, Dict, Dict) -> HTTPClientResponse
+        return await self.make_request(path, method="GET", query_params=query_params, headers=headers)
+
+    async def post(self, path, body=None, headers=None):  # type: (str, Union[Dict, bytes], Dict) -> HTTPClientResponse
+        return await self.make_request(path, method="POST", body=body, headers=headers)
+
+    async def delete(self, path, headers=None):  # type: (str, Dict) -> HTTPClientResponse
+        return await self.make_request(path, method="DELETE", headers=headers)
+
+    async def patch(self, path, body=None, headers=None):  # type: (str, Dict, Dict) -> HTTPClientResponse
+        return await self.make_request(path, method="PATCH", body=body, headers=headers)
+
+
+class AsyncRESTClient(AsyncHTTPClient):
+    """Asynchronous counterpart of RESTClient with the same request methods and exceptions."""
+
+    def __init__(self, *args, **kwargs):
+        self.service_root_path = kwargs.pop("service_root_path", DEFAULT_SERVICE_ROOT_PATH)
+        super(AsyncRESTClient, self).__init__(*args, **kwargs)
+        self._service_root = None  # type: Optional[Dict[str, Any]]
+        self._reauthenticate = None  # type: Optional[Callable[[], Awaitable[AuthMethod]]]
+        self._auth_lock = None  # type: Optional[asyncio.Lock]
+
+    def set_auth(self, auth, reauthenticate=None):
+        # type: (AuthMethod, Optional[Callable[[], Awaitable[AuthMethod]]]) -> None
+        """Changes authentication method of following requests.
+
+        If reauthenticate is set, it's awaited to get new authentication method when server
+        rejects current one. Rejected request is retried once.
+        """
+        self._auth = auth
+        self._reauthenticate = reauthenticate
+
+    async def get_service_root(self):  # type: () -> Dict[str, Any]
+        """Returns service root document. It is requested once per client."""
+        if self._service_root is None:
+            self._service_root = (await self.get(self.service_root_path)).json
+        return self._service_root
+
+    async def get_protocol_features(self):  # type: () -> Dict[str, Any]
+        return (await self.get_service_root()).get("ProtocolFeaturesSupported", {})
+
+    async def disable_protocol_feature(self, feature):  # type: (str) -> None
+        features = (await self.get_service_root()).setdefault("ProtocolFeaturesSupported", {})
+        features[feature] = False
+
+    async def get(self, path, query_params=None, headers=None, select=None):
+        # type: (str, Dict, Dict, Optional[List[str]]) -> HTTPClientResponse
+        if select and (await self.get_protocol_features()).get("SelectQuery"):
+            query_params = dict(query_params or {})
+            query_params["$select"] = ",".join(select)
+        return await super(AsyncRESTClient, self).get(path, query_params=query_params, headers=headers)
+
+    async def make_request(self, path, method, query_params=None, body=None, headers=None):
+        # type: (str, str, Dict, Union[Dict, bytes], Dict) -> HTTPClientResponse
+        auth = self._auth
+        try:
+            return await self._send_request(path, method, query_params, body, headers)
+        except RESTClientUnauthorized:
+            if self._reauthenticate is None:
+                raise
+            if self._auth_lock is None:
+                self._auth_lock = asyncio.Lock()
+            async with self._auth_lock:
+                # Concurrent request could have already renewed authentication.
+                if self._auth is auth:
+                    reauthenticate, self._reauthenticate = self._reauthenticate, None
+                    self._auth = NoAuth()
+                    try:
+                        self._auth = await reauthenticate()
+                    except Exception:
+                        self._auth = auth
+                        raise
+                    finally:
+                        self._reauthenticate = reauthenticate
+        return await self._send_request(path, method, query_params, body, headers)
+
+    async def _send_request(self, path, method, query_params, body, headers):
+        # type: (str, str, Dict, Union[Dict, bytes], Dict) -> HTTPClientResponse
+        try:
+            return await self._make_request(path, method, query_params, body, headers)
+        except (HTTPError, URLError) as e:
+            raise map_request_error(e)
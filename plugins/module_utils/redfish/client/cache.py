@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Dict, Optional, Tuple
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Dict = Optional = Tuple = None
+
+import threading
+from collections import OrderedDict
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.response import HTTPClientResponse
+
+DEFAULT_CACHE_SIZE = 128
+
+
+def get_etag(response):  # type: (HTTPClientResponse) -> Optional[str]
+    for name, value in response.headers.items():
+        if name.lower() == "etag":
+            return value
+    return None
+
+
+class ResponseCache:
+    """LRU cache of GET responses which carry an ETag.
+
+    Entries are keyed by request path and query, the stored ETag is used to revalidate
+    the entry with If-None-Match before its body is reused.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):  # type: (int) -> None
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # type: OrderedDict[Tuple[str, str], Tuple[str, HTTPClientResponse]]
+        self._lock = threading.Lock()
+
+    def get_etag(self, path, query):  # type: (str, str) -> Optional[str]
+        with self._lock:
+            entry = self._entries.get((path.rstrip("/"), query))
+        return entry[0] if entry else None
+
+    def hit(self, path, query):  # type: (str, str) -> Optional[HTTPClientResponse]
+        """Returns cached response after the server confirmed it's not modified."""
+        key = (path.rstrip("/"), query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.pop(key)
+            self._entries[key] = entry
+            self.hits += 1
+        # Callers own parsed body of the response they receive and may change it.
+        return entry[1].copy()
+
+    def store(self, path, query, response):  # type: (str, str, HTTPClientResponse) -> None
+        etag = get_etag(response)
+        key = (path.rstrip("/"), query)
+        with self._lock:
+            self.misses += 1
+            self._entries.pop(key, None)
+            if etag is None:
+                return
+            self._entries[key] = (etag, response)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):  # type: (str) -> None
+        """Drops entries of the path, its subresources and resources containing it.
+
+        Modifying a resource may change the collection it's member of, and actions
+        are posted to paths below the resource they modify.
+        """
+        path = path.rstrip("/")
+        with self._lock:
+            for key in list(self._entries):
+                cached_path = key[0]
+                if cached_path == path or cached_path.startswith(path + "/") or path.startswith(cached_path + "/"):
+                    del self._entries[key]
+
+    def clear(self):  # type: () -> None
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):  # type: () -> Dict[str, int]
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -9,8 +9,17 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+try:
+    from typing import Optional
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = None
+
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishError
 
+# Base registry messages of requests with query parameters service doesn't support.
+_QUERY_UNSUPPORTED_MESSAGES = ("QueryNotSupported", "QueryParameterUnsupported", "QueryCombinationInvalid")
+
 
 class HTTPClientError(RedfishError):
     pass
@@ -21,7 +30,21 @@ class RESTClientUnauthorized(RedfishError):
 
 
 class RESTClientRequestError(RedfishError):
-    pass
+
+    def __init__(self, msg, status_code=None):  # type: (str, Optional[int]) -> None
+        super(RESTClientRequestError, self).__init__(msg)
+        # HTTP status of the response, None if it isn't known.
+        self.status_code = status_code
+
+    def is_query_unsupported(self):  # type: () -> bool
+        """Tells if service rejected query parameters, like $expand, rather than failed to process the request."""
+        if self.status_code == 501:
+            return True
+        return self.status_code == 400 and any(message_id in str(self) for message_id in _QUERY_UNSUPPORTED_MESSAGES)
+
+
+class RESTClientPreconditionFailedError(RESTClientRequestError):
+    """Conditional request was rejected, e.g. resource was modified since it was read."""
 
 
 class RESTClientNotFoundError(RedfishError):
@@ -10,16 +10,32 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Dict, Union
+    from typing import Dict, Union, Optional, IO, Iterator, Any
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Dict = Union = None
+    Dict = Union = Optional = IO = Iterator = Any = None
 
 import json
-from ansible.module_utils.urls import open_url
+import time
+from ansible.module_utils.urls import open_url, basic_auth_header
+from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import HTTPClientError
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.response import HTTPClientResponse
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.pool import (
+    ConnectionPool,
+    CrossOriginRedirect,
+    get_pool,
+    uses_proxy,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.stream import (
+    is_stream,
+    get_stream_length,
+    rewind,
+    tell,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.trace import RequestTracer
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.limiter import RequestLimiter
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import AuthMethod, NoAuth, BasicAuth, SessionAuth
 
 
@@ -32,8 +48,8 @@ def build_url(base, path, query_params=None):  # type: (str, str, Dict) -> str
 
 class HTTPClient:
 
-    def __init__(self, hostname, port, validate_certs, timeout, auth):
-        # type: (str, int, bool, int, AuthMethod) -> None
+    def __init__(self, hostname, port, validate_certs, timeout, auth, keep_alive=False, tracer=None, limiter=None):
+        # type: (str, int, bool, int, AuthMethod, bool, Optional[RequestTracer], Optional[RequestLimiter]) -> None
         if "://" in hostname:
             self._protocol, self._hostname = hostname.split("://")
         else:
@@ -47,16 +63,27 @@ class HTTPClient:
 
         self.validate_certs = validate_certs
         self.timeout = timeout
+        # Records timing of each request if set.
+        self.tracer = tracer
+        # Limits requests to the server if set, e.g. shared with other clients of the same server.
+        self.limiter = limiter
+
+        # Persistent connections are used only when requests go to server directly,
+        # proxies are supported by open_url only.
+        self._pool = None  # type: Optional[ConnectionPool]
+        if keep_alive and not uses_proxy(self._protocol, self._hostname):
+            self._pool = get_pool(self._protocol, self._hostname, self._port, self.validate_certs)
 
     def get_base_url(self):
         return self._base_url
 
     def make_request(self, path, method, query_params=None, body=None, headers=None):
-        # type: (str, str, Dict, Union[Dict, bytes], Dict) -> HTTPClientResponse
+        # type: (str, str, Dict, Union[Dict, bytes, IO[bytes], Iterator[bytes]], Dict) -> HTTPClientResponse
         return self._make_request(path, method, query_params, body, headers)
 
-    def _make_request(self, path, method, query_params, body, headers):
-        # type: (str, str, Dict, Union[Dict, bytes], Dict) -> HTTPClientResponse
+    def _make_request(self, path, method, query_params, body, headers, attempt=1):
+        # type: (str, str, Dict, Union[Dict, bytes, IO[bytes], Iterator[bytes]], Dict, int) -> HTTPClientResponse
+        """Sends request. attempt is the number of the request made by the caller's retry policy, it's traced."""
         request_kwargs = {
             "follow_redirects": "all",
             "force_basic_auth": False,
@@ -67,7 +94,16 @@ class HTTPClient:
             "validate_certs": self.validate_certs,
         }
 
-        if body:
+        if body is not None and is_stream(body):
+            # Streams are sent in chunks as they are read, so their length must be known in advance.
+            request_kwargs["headers"]["Content-Type"] = "application/octet-stream"
+            length = get_stream_length(body) if hasattr(body, "read") else None
+            if length is not None:
+                request_kwargs["headers"]["Content-Length"] = str(length)
+            elif not any(name.lower() == "content-length" for name in (headers or {})):
+                raise HTTPClientError("Content-Length header is required to send body of type: {0}".format(type(body)))
+            request_body = body
+        elif body:
             if isinstance(body, dict) or isinstance(body, list):
                 request_kwargs["headers"]["Content-Type"] = "application/json"
                 request_body = json.dumps(body)
@@ -79,6 +115,89 @@ class HTTPClient:
         else:
             request_body = None
 
+        self._add_auth(request_kwargs)
+
+        if headers:
+            request_kwargs["headers"].update(headers)
+
+        url = build_url(self._base_url, path, query_params=query_params)
+        if self.limiter is None:
+            return self._send(url, request_body, request_kwargs, attempt=attempt)
+        queued = time.time()
+        with self.limiter.slot():
+            return self._send(url, request_body, request_kwargs, queued=time.time() - queued, attempt=attempt)
+
+    def _send(self, url, request_body, request_kwargs, queued=None, attempt=1):
+        # type: (str, Any, Dict, Optional[float], int) -> HTTPClientResponse
+        if self.tracer is None:
+            return HTTPClientResponse(self._open(url, request_body, request_kwargs))
+
+        record = {
+            "host": self._hostname,
+            "method": request_kwargs["method"],
+            "path": url[len(self._base_url):],
+            "bytes_out": self._get_body_size(request_body, request_kwargs["headers"]),
+            "status": None,
+            "bytes_in": None,
+            "attempt": attempt,
+            "retries": attempt - 1,
+        }
+        if queued is not None:
+            record["queued"] = queued
+        started = time.time()
+        try:
+            raw_response = self._open(url, request_body, request_kwargs)
+            record["first_byte"] = time.time() - started
+            response = HTTPClientResponse(raw_response)
+        except HTTPError as e:
+            record["status"] = e.code
+            record["error"] = str(e)
+            raise
+        except Exception as e:
+            record["error"] = str(e)
+            raise
+        else:
+            record["status"] = response.status_code
+            record["bytes_in"] = response.size
+            # Pooled responses carry durations of connection setup and exchange.
+            record.update(getattr(raw_response, "timings", {}))
+            record["retries"] += getattr(raw_response, "retries", 0)
+        finally:
+            record["total"] = time.time() - started
+            self.tracer.record(record)
+        return response
+
+    def _open(self, url, request_body, request_kwargs):  # type: (str, Any, Dict) -> Any
+        if self._pool is None:
+            return open_url(url=url, data=request_body, **request_kwargs)
+        pool_headers = dict(request_kwargs["headers"])
+        if request_kwargs["force_basic_auth"]:
+            pool_headers["Authorization"] = basic_auth_header(self._auth.username, self._auth.password)
+        position = tell(request_body) if is_stream(request_body) else None
+        try:
+            return self._pool.urlopen(method=request_kwargs["method"], url=url, body=request_body,
+                                      headers=pool_headers, timeout=self.timeout)
+        except CrossOriginRedirect as e:
+            # Pool has connections to the BMC only, other server is requested as without pooling.
+            if e.code == 303:
+                return open_url(url=e.location, **dict(request_kwargs, method="GET"))
+            # Sent stream can be repeated only if it can be rewound.
+            if is_stream(request_body) and not rewind(request_body, position):
+                raise
+            return open_url(url=e.location, data=request_body, **request_kwargs)
+
+    @staticmethod
+    def _get_body_size(body, headers):  # type: (Any, Dict) -> Optional[int]
+        if body is None:
+            return 0
+        if isinstance(body, (bytes, str)):
+            return len(body)
+        for name, value in headers.items():
+            if name.lower() == "content-length":
+                return int(value)
+        return None
+
+    def _add_auth(self, request_kwargs):  # type: (Dict) -> None
         if isinstance(self._auth, NoAuth):
             pass
         elif isinstance(self._auth, BasicAuth):
@@ -90,17 +209,34 @@ class HTTPClient:
         else:
             raise HTTPClientError("Unsupported auth type: {0}".format(type(self._auth)))
 
-        if headers:
-            request_kwargs["headers"].update(headers)
+    def open_stream(self, path, headers=None, timeout=None):  # type: (str, Dict, Optional[int]) -> Any
+        """Sends GET request and returns response without reading its body, e.g. for server-sent events.
 
-        url = build_url(self._base_url, path, query_params=query_params)
-        response = open_url(url=url, data=request_body, **request_kwargs)
-        return HTTPClientResponse(response)
+        Stream uses its own connection, caller must close it. With request limiter, opening the stream
+        takes a request slot, but the open stream doesn't hold it: it's idle between events, and
+        holding it would block other requests while the stream lasts.
+        """
+        request_kwargs = {
+            "follow_redirects": "all",
+            "force_basic_auth": False,
+            "headers": dict(headers or {}),
+            "method": "GET",
+            "timeout": timeout or self.timeout,
+            "use_proxy": True,
+            "validate_certs": self.validate_certs,
+        }
+        self._add_auth(request_kwargs)
+        url = build_url(self._base_url, path)
+        if self.limiter is None:
+            return open_url(url=url, **request_kwargs)
+        with self.limiter.slot():
+            return open_url(url=url, **request_kwargs)
 
     def get(self, path, query_params=None, headers=None):  # type: (str, Dict, Dict) -> HTTPClientResponse
         return self.make_request(path, method="GET", query_params=query_params, headers=headers)
 
-    def post(self, path, body=None, headers=None):  # type: (str, Union[Dict, bytes], Dict) -> HTTPClientResponse
+    def post(self, path, body=None, headers=None):
+        # type: (str, Union[Dict, bytes, IO[bytes], Iterator[bytes]], Dict) -> HTTPClientResponse
         return self.make_request(path, method="POST", body=body, headers=headers)
 
     def delete(self, path, headers=None):  # type: (str, Dict) -> HTTPClientResponse
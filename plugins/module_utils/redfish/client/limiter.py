@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Dict, Tuple, Optional, Callable, Iterator, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Dict = Tuple = Optional = Callable = Iterator = Any = None
+
+import os
+import json
+import time
+import fcntl
+import hashlib
+import threading
+from contextlib import contextmanager
+
+DEFAULT_LIMIT_DIR = "~/.ansible/yadro_obmc/limits"
+# Seconds between attempts to take a busy request slot shared with other processes.
+SLOT_POLL_INTERVAL = 0.02
+
+
+class RequestLimiter:
+    """Limits requests sent to one BMC.
+
+    At most max_in_flight requests are sent at the same time and no more than rate requests
+    per second on average, with bursts of up to one second of requests. Zero disables a limit.
+
+    Without directory limits are shared by threads of the process. With directory set,
+    they are shared by all processes using it: request slots are lock files held while
+    request is sent and rate tokens are kept in a file updated under lock.
+    """
+
+    def __init__(self, key, max_in_flight=0, rate=0, directory=None):
+        # type: (str, int, float, Optional[str]) -> None
+        self.key = key
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self.burst = max(rate, 1)
+        self.directory = os.path.expanduser(directory) if directory else None
+
+        self._semaphore = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._bucket_state = {"tokens": self.burst, "updated": time.time()}
+        self._bucket_lock = threading.Lock()
+        self._prefix = None  # type: Optional[str]
+        if self.directory:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, 0o700)
+            self._prefix = os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    @contextmanager
+    def slot(self):  # type: () -> Iterator[None]
+        """Waits until request can be sent and holds its slot within the block."""
+        # Rate token is taken first, so waiting for it doesn't occupy a slot.
+        self._take_token()
+        release = self._acquire_slot()
+        try:
+            yield
+        finally:
+            release()
+
+    def _take_token(self):  # type: () -> None
+        if not self.rate:
+            return
+        while True:
+            with self._bucket() as state:
+                now = time.time()
+                tokens = min(self.burst, state["tokens"] + (now - state["updated"]) * self.rate)
+                state["updated"] = now
+                if tokens >= 1:
+                    state["tokens"] = tokens - 1
+                    return
+                state["tokens"] = tokens
+                delay = (1 - tokens) / self.rate
+            time.sleep(delay)
+
+    @contextmanager
+    def _bucket(self):  # type: () -> Iterator[Dict[str, float]]
+        """Locks token bucket state, changes made within the block are saved."""
+        if self._prefix is None:
+            with self._bucket_lock:
+                yield self._bucket_state
+            return
+
+        with open(self._prefix + ".bucket", "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.load(f)
+                except ValueError:
+                    state = {"tokens": self.burst, "updated": time.time()}
+                yield state
+                f.seek(0)
+                f.truncate()
+                json.dump(state, f)
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _acquire_slot(self):  # type: () -> Callable[[], Any]
+        """Takes request slot and returns function releasing it."""
+        if not self.max_in_flight:
+            return lambda: None
+        if self._prefix is None:
+            self._semaphore.acquire()
+            return self._semaphore.release
+
+        while True:
+            for index in range(self.max_in_flight):
+                f = open("{0}.slot{1}".format(self._prefix, index), "a")
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except (IOError, OSError):
+                    f.close()
+                    continue
+                # Lock is released with the file.
+                return f.close
+            time.sleep(SLOT_POLL_INTERVAL)
+
+
+_limiters = {}  # type: Dict[Tuple[str, int, float, Optional[str]], RequestLimiter]
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(key, max_in_flight=0, rate=0, directory=None):
+    # type: (str, int, float, Optional[str]) -> RequestLimiter
+    """Returns limiter shared by all clients of the same BMC with the same limits."""
+    limiter_key = (key, max_in_flight, rate, directory)
+    with _limiters_lock:
+        limiter = _limiters.get(limiter_key)
+        if limiter is None:
+            limiter = RequestLimiter(key, max_in_flight=max_in_flight, rate=rate, directory=directory)
+            _limiters[limiter_key] = limiter
+        return limiter
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Dict, List, Tuple, Optional, Union, IO, Iterator
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Dict = List = Tuple = Optional = Union = IO = Iterator = None
+
+import ssl
+import time
+import errno
+import select
+import socket
+import threading
+from io import BytesIO
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.stream import is_stream, tell, rewind
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.retry import IDEMPOTENT_METHODS
+
+DEFAULT_POOL_SIZE = 8
+MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+def _is_stale_connection_error(error, method):  # type: (Exception, str) -> bool
+    """Checks if error means that a kept-alive connection was closed by the server
+    between two requests, and the request is safe to repeat on a new connection.
+
+    Request which wasn't sent is always repeated. Otherwise server may have processed it
+    before closing the connection, so only idempotent requests are repeated.
+    """
+    if isinstance(error, http_client.CannotSendRequest):
+        return True
+    if method not in IDEMPOTENT_METHODS:
+        return False
+    if isinstance(error, http_client.BadStatusLine):
+        return True
+    return isinstance(error, socket.error) and error.errno in (errno.ECONNRESET, errno.EPIPE)
+
+
+def _is_connection_dropped(connection):  # type: (http_client.HTTPConnection) -> bool
+    """Checks if idle connection was closed by the server. Socket of idle connection is readable only then."""
+    if connection.sock is None:
+        return False
+    try:
+        return bool(select.select([connection.sock], [], [], 0)[0])
+    except (ValueError, socket.error):
+        return True
+
+
+def _open_socket(connection):  # type: (http_client.HTTPConnection) -> socket.socket
+    """Connects socket like socket.create_connection, recording resolve and connect durations."""
+    started = time.time()
+    addresses = socket.getaddrinfo(connection.host, connection.port, 0, socket.SOCK_STREAM)
+    resolved = time.time()
+    connection.timings = {"dns": resolved - started}
+    error = None
+    for family, socktype, proto, _, address in addresses:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.settimeout(connection.timeout)
+            sock.connect(address)
+        except socket.error as e:
+            sock.close()
+            error = e
+            continue
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection.timings["connect"] = time.time() - resolved
+        return sock
+    raise error or socket.error("getaddrinfo returns an empty list")
+
+
+class _HTTPConnection(http_client.HTTPConnection):
+    """HTTPConnection which records durations of connection setup in timings."""
+
+    timings = None  # type: Optional[Dict[str, float]]
+
+    def connect(self):  # type: () -> None
+        self.sock = _open_socket(self)
+
+
+class _HTTPSConnection(http_client.HTTPSConnection):
+    """HTTPSConnection which records durations of connection setup and TLS handshake in timings."""
+
+    timings = None  # type: Optional[Dict[str, float]]
+
+    def connect(self):  # type: () -> None
+        sock = _open_socket(self)
+        started = time.time()
+        self.sock = self._context.wrap_socket(sock, server_hostname=self.host)
+        self.timings["tls"] = time.time() - started
+
+
+class CrossOriginRedirect(URLError):
+    """Raised for redirect to another server, which the pool has no connections to.
+
+    Caller may follow it with ``open_url``, as requests without pooling do.
+    """
+
+    def __init__(self, url, code, location):  # type: (str, int, str) -> None
+        super(CrossOriginRedirect, self).__init__("Redirect to another server: {0}".format(location))
+        self.url = url
+        self.code = code
+        self.location = location
+
+
+class PooledResponse:
+    """Fully read response detached from the connection it was received on.
+
+    Implements the part of the ``HTTPResponse`` interface used by ``HTTPClientResponse``.
+    """
+
+    def __init__(self, url, status, reason, headers, body):
+        # type: (str, int, str, List[Tuple[str, str]], bytes) -> None
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = dict(headers)
+        self._body = body
+        # Durations of the exchange in seconds, see ConnectionPool._send.
+        self.timings = {}  # type: Dict[str, float]
+        self.retries = 0
+
+    def read(self):  # type: () -> bytes
+        return self._body
+
+    def getcode(self):  # type: () -> int
+        return self.status
+
+
+class ConnectionPool:
+    """Keeps idle HTTP(S) connections to a single server for reuse.
+
+    Connections are handed out one request at a time, so the pool can be shared
+    between threads. Errors are raised as ``URLError`` and ``HTTPError`` to be
+    interchangeable with ``open_url``.
+    """
+
+    def __init__(self, protocol, hostname, port, validate_certs, maxsize=DEFAULT_POOL_SIZE):
+        # type: (str, str, int, bool, int) -> None
+        self.protocol = protocol
+        self.hostname = hostname
+        self.port = port
+        self.validate_certs = validate_certs
+        self.maxsize = maxsize
+
+        self._idle = []  # type: List[http_client.HTTPConnection]
+        self._lock = threading.Lock()
+        self._ssl_context = None
+        if protocol == "https":
+            self._ssl_context = self._create_ssl_context(validate_certs)
+
+    @staticmethod
+    def _create_ssl_context(validate_certs):  # type: (bool) -> ssl.SSLContext
+        context = ssl.create_default_context()
+        if not validate_certs:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context
+
+    def _new_connection(self, timeout):  # type: (int) -> http_client.HTTPConnection
+        if self.protocol == "https":
+            return _HTTPSConnection(self.hostname, self.port, timeout=timeout, context=self._ssl_context)
+        return _HTTPConnection(self.hostname, self.port, timeout=timeout)
+
+    def _acquire(self, timeout):  # type: (int) -> Tuple[http_client.HTTPConnection, bool]
+        with self._lock:
+            if self._idle:
+                connection = self._idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        return self._new_connection(timeout), False
+
+    def _release(self, connection):  # type: (http_client.HTTPConnection) -> None
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):  # type: () -> None
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def _send(self, method, path, body, headers, timeout):
+        # type: (str, str, Optional[Union[bytes, IO[bytes], Iterator[bytes]]], Dict, int) -> PooledResponse
+        connection, reused = self._acquire(timeout)
+        if reused and method not in IDEMPOTENT_METHODS and _is_connection_dropped(connection):
+            # Request isn't repeated once sent, so connection closed by the server is replaced beforehand.
+            connection.close()
+            connection, reused = self._new_connection(timeout), False
+        position = tell(body) if is_stream(body) else None
+        retries = 0
+        started = time.time()
+        try:
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            except Exception as e:
+                if not reused or not _is_stale_connection_error(e, method):
+                    raise
+                # Partially sent stream can be repeated only if it can be rewound.
+                if is_stream(body) and not rewind(body, position):
+                    raise
+                # Server dropped the idle connection, repeat once on a fresh one.
+                connection.close()
+                connection = self._new_connection(timeout)
+                reused = False
+                retries += 1
+                started = time.time()
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            first_byte = time.time() - started
+            response_body = response.read()
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        pooled_response = PooledResponse(path, response.status, response.reason, response.getheaders(), response_body)
+        # Connection setup is measured only for requests which opened the connection.
+        if not reused and connection.timings:
+            pooled_response.timings.update(connection.timings)
+        pooled_response.timings["first_byte"] = first_byte
+        pooled_response.retries = retries
+        return pooled_response
+
+    def urlopen(self, method, url, body=None, headers=None, timeout=30):
+        # type: (str, str, Optional[Union[bytes, IO[bytes], Iterator[bytes]]], Dict, int) -> PooledResponse
+        """Sends request. Body may be a file-like object or an iterator, then it's sent in chunks.
+
+        Redirects to the same server are followed, CrossOriginRedirect is raised for other servers.
+        """
+        headers = dict(headers or {})
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path = "{0}?{1}".format(path, parts.query)
+
+            try:
+                response = self._send(method, path, body, headers, timeout)
+            except (socket.error, ssl.SSLError, http_client.HTTPException) as e:
+                raise URLError(e)
+            response.url = url
+
+            location = response.headers.get("Location") or response.headers.get("location")
+            if response.status in REDIRECT_CODES and location:
+                next_url = urljoin(url, location)
+                if not self._is_same_origin(next_url):
+                    raise CrossOriginRedirect(url, response.status, next_url)
+                if response.status == 303:
+                    method, body = "GET", None
+                url = next_url
+                continue
+
+            if response.status >= 400:
+                raise HTTPError(url, response.status, response.reason, response.headers, BytesIO(response.read()))
+            return response
+
+        raise URLError("Too many redirects: {0}".format(url))
+
+    def _is_same_origin(self, url):  # type: (str) -> bool
+        parts = urlsplit(url)
+        return parts.scheme == self.protocol and parts.hostname == self.hostname and (parts.port or self.port) == self.port
+
+
+_pools = {}  # type: Dict[Tuple[str, str, int, bool], ConnectionPool]
+_pools_lock = threading.Lock()
+
+
+def get_pool(protocol, hostname, port, validate_certs):
+    # type: (str, str, int, bool) -> ConnectionPool
+    """Returns connection pool shared by all clients of the same server."""
+    key = (protocol, hostname, port, validate_certs)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(protocol, hostname, port, validate_certs)
+            _pools[key] = pool
+        return pool
+
+
+def close_pools():  # type: () -> None
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def uses_proxy(protocol, hostname):  # type: (str, str) -> bool
+    """Checks if environment routes requests to the host through a proxy.
+
+    Proxies are handled by ``open_url`` only, so pooling must be disabled for such hosts.
+    """
+    return protocol in getproxies() and not proxy_bypass(hostname)
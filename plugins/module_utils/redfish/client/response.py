@@ -10,27 +10,60 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Dict
+    from typing import Dict, Optional, Any
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Dict = None
+    Dict = Optional = Any = None
 
 import json
 from ansible.module_utils.six.moves.http_client import HTTPResponse
 
+# Faster decoders are used if installed, results are the same as of the json module.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+if HAS_ORJSON:
+    loads_json = orjson.loads
+elif HAS_UJSON:
+    loads_json = ujson.loads
+else:
+    loads_json = json.loads
+
 
 class HTTPClientResponse:
 
-    def __init__(self, response):  # type: (HTTPResponse) -> None
+    def __init__(self, response, body=None):  # type: (HTTPResponse, Optional[bytes]) -> None
         self._response = response
-        self._body = self._response.read()
+        self._body = self._response.read() if body is None else body
+        self._json = None  # type: Optional[Any]
 
     @property
     def json(self):  # type: () -> Dict
-        try:
-            return json.loads(self._body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
+        """Parsed body. It's decoded once, all accesses return the same object."""
+        if self._json is None:
+            try:
+                self._json = loads_json(self._body)
+            except ValueError:
+                raise ValueError("Unable to parse json")
+        return self._json
+
+    def copy(self):  # type: () -> HTTPClientResponse
+        """Returns response with the same body, which is parsed into separate object."""
+        return HTTPClientResponse(self._response, self._body)
+
+    @property
+    def size(self):  # type: () -> int
+        """Length of the response body in bytes."""
+        return len(self._body)
 
     @property
     def headers(self):  # type: () -> Dict
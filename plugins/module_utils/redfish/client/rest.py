@@ -11,44 +11,245 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Dict
+    from typing import Dict, Any, Optional, List, Callable, Set
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Dict = None
+    Dict = Any = Optional = List = Callable = Set = None
 
 import json
+import time
+import threading
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.http import HTTPClient, HTTPClientResponse
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.cache import ResponseCache
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.retry import RetryPolicy
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.discovery import DiscoveryCache
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.stream import is_stream, tell, rewind
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import AuthMethod, NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishError
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
     RESTClientRequestError,
     RESTClientNotFoundError,
     RESTClientConnectionError,
     RESTClientUnauthorized,
+    RESTClientPreconditionFailedError,
 )
 
 
+DEFAULT_COLLECTION_WORKERS = 1
+DEFAULT_SERVICE_ROOT_PATH = "/redfish/v1"
+
+
+def map_request_error(error):  # type: (Exception) -> RedfishError
+    """Maps HTTPError or connection error of a request to client exception."""
+    if isinstance(error, HTTPError):
+        if error.code == 404:
+            return RESTClientNotFoundError("Not found: {0}".format(error.url))
+        elif error.code == 401:
+            return RESTClientUnauthorized('Unauthorized error')
+        elif error.code == 412:
+            return RESTClientPreconditionFailedError(
+                "Resource was modified by another client: {0}".format(error.url), status_code=error.code)
+        try:
+            msg = json.load(error)
+        except ValueError:
+            msg = str(error)
+        return RESTClientRequestError("Request finished with error: {0}".format(msg), status_code=error.code)
+    return RESTClientConnectionError("Cannot connect to server: {0}".format(str(error)))
+
+
 class RESTClient(HTTPClient):
 
     def __init__(self, *args, **kwargs):
+        # Number of requests used to read collection members in parallel.
+        self.collection_workers = kwargs.pop("collection_workers", DEFAULT_COLLECTION_WORKERS)
+        self.service_root_path = kwargs.pop("service_root_path", DEFAULT_SERVICE_ROOT_PATH)
+        # Number of GET responses kept for ETag revalidation. Cache is disabled when zero.
+        cache_size = kwargs.pop("response_cache_size", 0)
+        # Failed requests are not repeated if policy isn't set.
+        self.retry_policy = kwargs.pop("retry_policy", None)  # type: Optional[RetryPolicy]
+        # Service root is read from the cache, if set, instead of requesting it.
+        self._discovery_cache = kwargs.pop("discovery_cache", None)  # type: Optional[DiscoveryCache]
         super(RESTClient, self).__init__(*args, **kwargs)
+        self._service_root = None  # type: Optional[Dict[str, Any]]
+        # Time the service root was read from the service.
+        self._discovered = None  # type: Optional[float]
+        # Values of @odata.type of resources read through the client.
+        self.schema_versions = set()  # type: Set[str]
+        self._cache = ResponseCache(cache_size) if cache_size else None  # type: Optional[ResponseCache]
+        self._reauthenticate = None  # type: Optional[Callable[[], AuthMethod]]
+        self._auth_lock = threading.Lock()
+
+    def set_auth(self, auth, reauthenticate=None):
+        # type: (AuthMethod, Optional[Callable[[], AuthMethod]]) -> None
+        """Changes authentication method of following requests.
+
+        If reauthenticate is set, it's called to get new authentication method when server
+        rejects current one, e.g. session expired. Rejected request is retried once.
+        Callback is called without authentication and can't trigger itself recursively.
+        """
+        with self._auth_lock:
+            self._auth = auth
+            self._reauthenticate = reauthenticate
+
+    def load_discovery(self):  # type: () -> bool
+        """Takes service root and schema versions from discovery cache. Returns False if server isn't cached."""
+        if self._service_root is not None:
+            return True
+        entry = self._discovery_cache.get(self._base_url) if self._discovery_cache else None
+        if entry is None:
+            return False
+        self._service_root = entry["service_root"]
+        self._discovered = entry["created"]
+        self.schema_versions.update(entry.get("versions", ()))
+        return True
+
+    def get_service_root(self):  # type: () -> Dict[str, Any]
+        """Returns service root document. It is requested once per client, or taken from discovery cache."""
+        if not self.load_discovery():
+            self._service_root = self.get(self.service_root_path).json
+            self._discovered = time.time()
+            self.save_discovery()
+        return self._service_root
+
+    def save_discovery(self):  # type: () -> None
+        """Saves service root and schema versions seen to discovery cache, if it's set."""
+        if self._discovery_cache is None or self._service_root is None:
+            return
+        try:
+            self._discovery_cache.put(self._base_url, self._service_root, list(self.schema_versions), self._discovered)
+        except (IOError, OSError):
+            # Service is probed again by the next run.
+            pass
+
+    def get_protocol_features(self):  # type: () -> Dict[str, Any]
+        return self.get_service_root().get("ProtocolFeaturesSupported", {})
+
+    def disable_protocol_feature(self, feature):  # type: (str) -> None
+        """Marks feature as unsupported when service fails to process advertised query."""
+        features = self.get_service_root().setdefault("ProtocolFeaturesSupported", {})
+        features[feature] = False
+        self.save_discovery()
+
+    def get(self, path, query_params=None, headers=None, select=None):
+        # type: (str, Dict, Dict, Optional[List[str]]) -> HTTPClientResponse
+        """Reads resource. With select set, only listed properties are requested if service supports $select.
+
+        Nested properties are separated by slash, e.g. "NTP/NTPServers".
+        """
+        if select and self.get_protocol_features().get("SelectQuery"):
+            query_params = dict(query_params or {})
+            query_params["$select"] = ",".join(select)
+        return super(RESTClient, self).get(path, query_params=query_params, headers=headers)
+
+    def get_if_modified(self, path, etag):  # type: (str, str) -> Optional[HTTPClientResponse]
+        """Reads resource if it was changed since etag was received, returns None otherwise.
+
+        Unlike the response cache, caller keeps the etag and the resource, e.g. between runs.
+        """
+        return self._send_request(path, "GET", None, None, {"If-None-Match": etag}, allow_not_modified=True)
+
+    def get_cache_stats(self):  # type: () -> Dict[str, int]
+        if self._cache is None:
+            return {"hits": 0, "misses": 0, "size": 0}
+        return self._cache.get_stats()
 
     def make_request(self, path, method, query_params=None, body=None, headers=None):
         # type: (str, str, Dict, Dict, Dict) -> HTTPClientResponse
+        auth = self._auth
+        position = tell(body) if is_stream(body) else None
         try:
-            response = self._make_request(path, method, query_params, body, headers)
-        except HTTPError as e:
-            if e.code == 404:
-                raise RESTClientNotFoundError("Not found: {0}".format(e.url))
-            elif e.code == 401:
-                raise RESTClientUnauthorized('Unauthorized error')
-            else:
-                try:
-                    msg = json.load(e)
-                except ValueError:
-                    msg = str(e)
-                raise RESTClientRequestError("Request finished with error: {0}".format(msg))
-        except (URLError, SSLValidationError, ConnectionError) as e:
-            raise RESTClientConnectionError("Cannot connect to server: {0}".format(str(e)))
+            return self._make_cached_request(path, method, query_params, body, headers)
+        except RESTClientUnauthorized:
+            if self._reauthenticate is None:
+                raise
+            if is_stream(body) and not rewind(body, position):
+                raise
+            with self._auth_lock:
+                # Concurrent request could have already renewed authentication.
+                if self._auth is auth:
+                    # Rejected credentials aren't sent with login requests made by callback.
+                    reauthenticate, self._reauthenticate = self._reauthenticate, None
+                    self._auth = NoAuth()
+                    try:
+                        self._auth = reauthenticate()
+                    except Exception:
+                        self._auth = auth
+                        raise
+                    finally:
+                        self._reauthenticate = reauthenticate
+        return self._make_cached_request(path, method, query_params, body, headers)
+
+    def _make_cached_request(self, path, method, query_params, body, headers):
+        # type: (str, str, Dict, Dict, Dict) -> HTTPClientResponse
+        if self._cache is None:
+            return self._send_request(path, method, query_params, body, headers)
+
+        if method != "GET":
+            try:
+                return self._send_request(path, method, query_params, body, headers)
+            finally:
+                self._cache.invalidate(path)
+
+        query = urlencode(query_params) if query_params else ""
+        etag = self._cache.get_etag(path, query)
+        if etag is None:
+            response = self._send_request(path, method, query_params, body, headers)
         else:
-            return response
+            conditional_headers = dict(headers or {})
+            conditional_headers["If-None-Match"] = etag
+            response = self._send_request(
+                path, method, query_params, body, conditional_headers, allow_not_modified=True,
+            )
+            if response is None:
+                cached_response = self._cache.hit(path, query)
+                if cached_response is not None:
+                    return cached_response
+                # Entry was dropped by concurrent request, read resource unconditionally.
+                response = self._send_request(path, method, query_params, body, headers)
+        self._cache.store(path, query, response)
+        return response
+
+    def _send_request(self, path, method, query_params, body, headers, allow_not_modified=False):
+        # type: (str, str, Dict, Dict, Dict, bool) -> Optional[HTTPClientResponse]
+        """Sends request and maps errors to exceptions.
+
+        With allow_not_modified set, None is returned if server responds with 304 Not Modified.
+        """
+        position = tell(body) if is_stream(body) else None
+        attempt = 1
+        while True:
+            try:
+                response = self._make_request(path, method, query_params, body, headers, attempt=attempt)
+            except HTTPError as e:
+                if e.code == 304 and allow_not_modified:
+                    # open_url reports Not Modified as error
+                    return None
+                error = e
+            except (URLError, SSLValidationError, ConnectionError) as e:
+                error = e
+            else:
+                if allow_not_modified and response.status_code == 304:
+                    return None
+                return response
+
+            delay = self._get_retry_delay(method, attempt, error, body, position)
+            if delay is None:
+                raise map_request_error(error)
+            self.retry_policy.wait(delay)
+            attempt += 1
+
+    def _get_retry_delay(self, method, attempt, error, body, position):
+        # type: (str, int, Exception, Any, Optional[int]) -> Optional[float]
+        policy = self.retry_policy
+        if policy is None or not policy.is_retryable(method, error):
+            return None
+        delay = policy.get_delay(attempt, error)
+        if delay is None or not policy.spend(self._hostname):
+            return None
+        # Partially sent stream can be repeated only if it can be rewound.
+        if is_stream(body) and not rewind(body, position):
+            return None
+        return delay
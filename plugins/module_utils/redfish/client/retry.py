@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Dict, List, Optional, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Dict = List = Optional = Any = None
+
+import ssl
+import time
+import random
+import threading
+from email.utils import parsedate_tz, mktime_tz
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 1.0
+DEFAULT_RETRY_BUDGET = 10
+# Longest wait between attempts, including waits requested with Retry-After.
+MAX_RETRY_DELAY = 60
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def get_retry_after(error):  # type: (HTTPError) -> Optional[float]
+    """Returns seconds to wait requested by server with Retry-After header, as delay or date."""
+    for name, value in (error.headers or {}).items():
+        if name.lower() != "retry-after":
+            continue
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        date = parsedate_tz(value)
+        if date is not None:
+            return max(mktime_tz(date) - time.time(), 0)
+    return None
+
+
+class RetryPolicy:
+    """Decides if a failed request is repeated and how long to wait before that.
+
+    Requests are repeated up to max_attempts in total, if they failed to connect, timed out
+    or were answered with 429, 502, 503 or 504. Only methods listed in methods are repeated,
+    idempotent ones by default. Delay grows exponentially from backoff with full jitter,
+    Retry-After of the response is honored. Policy allows budget retries per host, so
+    unresponsive BMC doesn't slow down every request.
+    """
+
+    def __init__(self, max_attempts=DEFAULT_RETRY_ATTEMPTS, backoff=DEFAULT_RETRY_BACKOFF, methods=IDEMPOTENT_METHODS,
+                 budget=DEFAULT_RETRY_BUDGET):
+        # type: (int, float, List[str], int) -> None
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.methods = [method.upper() for method in methods]
+        self.budget = budget
+        self._spent = {}  # type: Dict[str, int]
+        self._lock = threading.Lock()
+
+    def is_retryable(self, method, error):  # type: (str, Exception) -> bool
+        if method.upper() not in self.methods:
+            return False
+        if isinstance(error, HTTPError):
+            return error.code in RETRY_STATUSES
+        if isinstance(error, URLError):
+            # Certificate won't become valid on the next attempt.
+            return not isinstance(error.reason, ssl.CertificateError)
+        return isinstance(error, ConnectionError) and not isinstance(error, SSLValidationError)
+
+    def get_delay(self, attempt, error):  # type: (int, Exception) -> Optional[float]
+        """Returns seconds to wait before repeating request failed on attempt, None if it's not repeated."""
+        if attempt >= self.max_attempts:
+            return None
+        delay = random.uniform(0, self.backoff * 2 ** (attempt - 1))
+        if isinstance(error, HTTPError):
+            retry_after = get_retry_after(error)
+            if retry_after is not None:
+                delay = retry_after
+        return min(delay, MAX_RETRY_DELAY)
+
+    def spend(self, host):  # type: (str) -> bool
+        """Takes one retry from the budget of host, returns False if it's exhausted."""
+        with self._lock:
+            spent = self._spent.get(host, 0)
+            if spent >= self.budget:
+                return False
+            self._spent[host] = spent + 1
+            return True
+
+    def wait(self, delay):  # type: (float) -> None
+        time.sleep(delay)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Any, Optional
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Any = Optional = None
+
+import os
+import stat
+
+
+def is_stream(body):  # type: (Any) -> bool
+    """Checks if body is a file-like object or an iterator of bytes chunks, which are sent without buffering."""
+    return hasattr(body, "read") or hasattr(body, "__next__") or hasattr(body, "next")
+
+
+def get_stream_length(stream):  # type: (Any) -> Optional[int]
+    """Returns number of bytes left in file-like object, or None if it can't be determined."""
+    try:
+        file_stat = os.fstat(stream.fileno())
+        if stat.S_ISREG(file_stat.st_mode):
+            return file_stat.st_size - stream.tell()
+    except (AttributeError, OSError, IOError, ValueError):
+        pass
+    try:
+        position = stream.tell()
+        stream.seek(0, os.SEEK_END)
+        length = stream.tell() - position
+        stream.seek(position)
+        return length
+    except (AttributeError, OSError, IOError, ValueError):
+        return None
+
+
+def rewind(stream, position):  # type: (Any, Optional[int]) -> bool
+    """Moves stream back to position, so its content can be sent again. Returns False if it's impossible."""
+    if position is None:
+        return False
+    try:
+        stream.seek(position)
+    except (AttributeError, OSError, IOError, ValueError):
+        return False
+    return True
+
+
+def tell(stream):  # type: (Any) -> Optional[int]
+    """Returns current position of file-like object, or None for iterators and unseekable streams."""
+    try:
+        return stream.tell() if stream.seekable() else None
+    except (AttributeError, OSError, IOError, ValueError):
+        return None
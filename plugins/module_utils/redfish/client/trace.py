@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Dict, List, Optional, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Dict = List = Optional = Any = None
+
+import json
+import threading
+
+TIMING_FIELDS = ("queued", "dns", "connect", "tls", "first_byte", "total")
+
+
+class RequestTracer:
+    """Collects a record per HTTP request sent by clients it's passed to.
+
+    Record holds host, method, path with query, status, bytes_out, bytes_in, attempt, retries, error
+    and durations in seconds: queued is set for clients with request limiter, dns, connect
+    and tls are set only for requests which opened a new connection, first_byte and total
+    are always set. Request repeated by retry policy gets a record per attempt, attempt is
+    its number, starting from 1. retries counts repeats of the request before the response,
+    both previous attempts and repeats on stale connections. With path set, each record is
+    also appended to the file as a JSON line, so traces of many runs can be collected.
+    """
+
+    def __init__(self, path=None):  # type: (Optional[str]) -> None
+        self.path = path
+        self._records = []  # type: List[Dict[str, Any]]
+        self._lock = threading.Lock()
+
+    def record(self, record):  # type: (Dict[str, Any]) -> None
+        for field in TIMING_FIELDS:
+            if record.get(field) is not None:
+                record[field] = round(record[field], 6)
+        with self._lock:
+            self._records.append(record)
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(record, sort_keys=True) + "\n")
+
+    def get_records(self):  # type: () -> List[Dict[str, Any]]
+        with self._lock:
+            return list(self._records)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Callable, Iterable, Iterator, List, Dict, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Callable = Iterable = Iterator = List = Dict = Any = None
+
+import time
+import threading
+
+
+def map_concurrently(func, items, max_workers):
+    # type: (Callable[[Any], Any], Iterable[Any], int) -> List[Any]
+    """Applies function to every item using up to max_workers threads.
+
+    Results are returned in the order of items. If any call fails, remaining items
+    are not started and the first error is raised after running calls are finished.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    results = [None] * len(items)
+    errors = []
+    pending = iter(range(len(items)))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                index = None if errors else next(pending, None)
+            if index is None:
+                return
+            try:
+                results[index] = func(items[index])
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+def iter_concurrently(func, items, max_workers):
+    # type: (Callable[[Any], Any], Iterable[Any], int) -> Iterator[Any]
+    """Applies function to every item using up to max_workers threads and yields results in the order of items.
+
+    Result is yielded as soon as it and all results before it are ready. Workers run at most
+    2 * max_workers items ahead of the consumer, so results don't pile up in memory. If any call
+    fails, remaining items are not started and the error is raised in place of its result.
+    Items not started by then are skipped when the consumer stops iterating early.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    window = 2 * max_workers
+    results = {}  # type: Dict[int, Any]
+    state = {"started": 0, "consumed": 0, "stopped": False}
+    condition = threading.Condition()
+
+    def worker():
+        while True:
+            with condition:
+                while not state["stopped"] and state["started"] - state["consumed"] >= window:
+                    condition.wait()
+                if state["stopped"] or state["started"] >= len(items):
+                    return
+                index = state["started"]
+                state["started"] += 1
+            try:
+                result = (True, func(items[index]))
+            except Exception as e:
+                result = (False, e)
+            with condition:
+                results[index] = result
+                if not result[0]:
+                    state["stopped"] = True
+                condition.notify_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    try:
+        for index in range(len(items)):
+            with condition:
+                while index not in results:
+                    condition.wait()
+                succeeded, value = results.pop(index)
+                state["consumed"] += 1
+                condition.notify_all()
+            if not succeeded:
+                raise value
+            yield value
+    finally:
+        with condition:
+            state["stopped"] = True
+            condition.notify_all()
+
+
+def map_with_deadline(func, items, max_workers, timeout):
+    # type: (Callable[[Any], Any], Iterable[Any], int, float) -> Dict[int, Any]
+    """Applies function to every item using up to max_workers threads, waiting for timeout seconds at most.
+
+    Returns results of calls finished in time by item index. Calls still running are left in
+    daemon threads, items not started by then are skipped. Function must handle its errors.
+    """
+    items = list(items)
+    results = {}  # type: Dict[int, Any]
+    pending = iter(range(len(items)))
+    lock = threading.Lock()
+    deadline = time.time() + timeout
+
+    def worker():
+        while True:
+            with lock:
+                index = next(pending, None) if time.time() < deadline else None
+            if index is None:
+                return
+            result = func(items[index])
+            with lock:
+                results[index] = result
+
+    threads = [threading.Thread(target=worker) for _ in range(min(max(max_workers, 1), len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join(max(deadline - time.time(), 0))
+
+    with lock:
+        return dict(results)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional, Dict, List, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = Dict = List = Any = None
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+DEFAULT_DISCOVERY_CACHE_DIR = "~/.ansible/yadro_obmc/discovery"
+DEFAULT_DISCOVERY_CACHE_TTL = 3600
+
+
+class DiscoveryCache:
+    """Keeps what was discovered about services on disk, so following runs don't probe them again.
+
+    Entry of a server holds its service root document, with supported protocol features and
+    mockup flag, and schema versions of resources read from it, so implementations of these
+    versions are selected in advance. Entry expires ttl seconds after the service root was read.
+    """
+
+    def __init__(self, directory=DEFAULT_DISCOVERY_CACHE_DIR, ttl=DEFAULT_DISCOVERY_CACHE_TTL):  # type: (str, int) -> None
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+
+    def _get_entry_path(self, server):  # type: (str) -> str
+        return os.path.join(self.directory, hashlib.sha256(server.encode("utf-8")).hexdigest())
+
+    def get(self, server):  # type: (str) -> Optional[Dict[str, Any]]
+        """Returns entry with service_root, versions and created keys, if it hasn't expired."""
+        try:
+            with open(self._get_entry_path(server)) as f:
+                entry = json.load(f)
+            if time.time() - entry["created"] < self.ttl and isinstance(entry["service_root"], dict):
+                return entry
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def put(self, server, service_root, versions=(), created=None):
+        # type: (str, Dict[str, Any], List[str], Optional[float]) -> None
+        """Saves entry of the server. created is time the service root was read, now by default."""
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, 0o700)
+        entry = {
+            "service_root": service_root,
+            "versions": sorted(versions),
+            "created": time.time() if created is None else created,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.rename(tmp_path, self._get_entry_path(server))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def delete(self, server):  # type: (str) -> None
+        try:
+            os.remove(self._get_entry_path(server))
+        except OSError:
+            pass
@@ -12,3 +12,7 @@ __metaclass__ = type
 
 class RedfishError(Exception):
     pass
+
+
+class RedfishTimeoutError(RedfishError):
+    pass
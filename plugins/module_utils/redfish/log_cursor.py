@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional, Dict, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = Dict = Any = None
+
+import os
+import json
+import hashlib
+import tempfile
+from ansible.module_utils.six import string_types
+
+DEFAULT_LOG_CURSOR_DIR = "~/.ansible/yadro_obmc/log_cursors"
+
+
+class LogCursorStore:
+    """Keeps cursors of log services on disk, so following runs read only entries added since.
+
+    Entries are keyed by server and path of the log service. Cursor holds Id, Created and
+    Position of the last entry read, as built by make_log_cursor.
+    """
+
+    def __init__(self, directory=DEFAULT_LOG_CURSOR_DIR):  # type: (str) -> None
+        self.directory = os.path.expanduser(directory)
+
+    def _get_entry_path(self, server, log_path):  # type: (str, str) -> str
+        key = "\0".join([server, log_path]).encode("utf-8")
+        return os.path.join(self.directory, hashlib.sha256(key).hexdigest())
+
+    def get(self, server, log_path):  # type: (str, str) -> Optional[Dict[str, Any]]
+        try:
+            with open(self._get_entry_path(server, log_path)) as f:
+                cursor = json.load(f)
+            if isinstance(cursor["Id"], string_types) and cursor["Position"] > 0:
+                return cursor
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def put(self, server, log_path, cursor):  # type: (str, str, Dict[str, Any]) -> None
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, 0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(cursor, f)
+            os.rename(tmp_path, self._get_entry_path(server, log_path))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def delete(self, server, log_path):  # type: (str, str) -> None
+        try:
+            os.remove(self._get_entry_path(server, log_path))
+        except OSError:
+            pass
@@ -10,36 +10,124 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Optional, List
+    from typing import Optional, List, Dict, Any
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Optional = List = None
+    Optional = List = Dict = Any = None
 
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import AuthMethod, NoAuth, BasicAuth, SessionAuth
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.cache import DEFAULT_CACHE_SIZE
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.trace import RequestTracer
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.retry import RetryPolicy
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.limiter import RequestLimiter
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import preload_dispatch
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import load_collection
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.session.session import Session
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.session.service import SessionService
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.account.service import AccountService
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.certificate.service import CertificateService
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.update.service import UpdateService
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.event.service import EventService
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.manager import Manager
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.system.system import System
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.chassis.chassis import Chassis
-from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientNotFoundError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
+    RESTClientNotFoundError,
+    RESTClientRequestError,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.token_cache import SessionTokenCache
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.discovery import DiscoveryCache
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.tracking import EventListener
 
 
 class RedfishAPI:
 
-    def __init__(self, hostname, base_prefix="/redfish/v1", port=443, validate_certs=True, timeout=30, auth=NoAuth()):
-        # type: (str, str, int, bool, int, AuthMethod) -> None
+    def __init__(self, hostname, base_prefix="/redfish/v1", port=443, validate_certs=True, timeout=30, auth=NoAuth(),
+                 keep_alive=True, collection_workers=4, response_cache_size=DEFAULT_CACHE_SIZE, tracer=None,
+                 retry_policy=None, limiter=None, discovery_cache=None):
+        # type: (str, str, int, bool, int, AuthMethod, bool, int, int, Optional[RequestTracer], Optional[RetryPolicy], Optional[RequestLimiter], Optional[DiscoveryCache]) -> None  # noqa: E501
         self._client = RESTClient(
             auth=auth,
             hostname=hostname,
             port=port,
             validate_certs=validate_certs,
-            timeout=timeout
+            timeout=timeout,
+            keep_alive=keep_alive,
+            collection_workers=collection_workers,
+            service_root_path=base_prefix,
+            response_cache_size=response_cache_size,
+            tracer=tracer,
+            retry_policy=retry_policy,
+            limiter=limiter,
+            discovery_cache=discovery_cache,
         )
         self._base_prefix = base_prefix
+        self._session_path = None  # type: Optional[str]
+        self._token_cache = None  # type: Optional[SessionTokenCache]
+        if self._client.load_discovery():
+            # Implementations of versions seen by previous runs are selected up front.
+            preload_dispatch(self._client.schema_versions)
+
+    def get_cache_stats(self):  # type: () -> Dict[str, int]
+        """Returns hits and misses of the response cache, hit is a GET answered with 304 Not Modified."""
+        return self._client.get_cache_stats()
+
+    def get_trace(self):  # type: () -> List[Dict[str, Any]]
+        """Returns records of requests sent so far, empty if API was created without tracer."""
+        if self._client.tracer is None:
+            return []
+        return self._client.tracer.get_records()
+
+    def login(self, username, password, token_cache=None):
+        # type: (str, str, Optional[SessionTokenCache]) -> None
+        """Switches following requests to session authentication. Expired session is re-created.
+
+        With token_cache set, token is reused by following runs and session isn't closed on logout.
+        If service doesn't support sessions, i.e. session collection isn't found or doesn't allow POST,
+        current authentication method is kept.
+        """
+        server = self._client.get_base_url()
+        self._token_cache = token_cache
+        cached = token_cache.get(server, username, password) if token_cache else None
+        if cached:
+            token, self._session_path = cached
+        else:
+            # Service without sessions responds with 404 or 405, other errors are reported.
+            try:
+                token = self._open_session(username, password)
+            except RESTClientNotFoundError:
+                return
+            except RESTClientRequestError as e:
+                if e.status_code != 405:
+                    raise
+                return
+        self._client.set_auth(
+            SessionAuth(token),
+            reauthenticate=lambda: SessionAuth(self._open_session(username, password)),
+        )
+
+    def _open_session(self, username, password):  # type: (str, str) -> str
+        session = self.create_session(username, password)
+        self._session_path = "{0}/SessionService/Sessions/{1}".format(self._base_prefix, session.get_id())
+        if self._token_cache:
+            self._token_cache.put(self._client.get_base_url(), username, password, session.get_token(), self._session_path)
+        return session.get_token()
+
+    def logout(self):  # type: () -> None
+        """Closes session opened by login, unless its token is cached for following runs.
+
+        Schema versions seen during the run are saved to the discovery cache, if it's used.
+        """
+        self._client.save_discovery()
+        if self._session_path and not self._token_cache:
+            try:
+                self._client.delete(self._session_path)
+            except RedfishError:
+                # Session expires on the server anyway
+                pass
+        self._session_path = None
 
     def create_session(self, username, password):  # type: (str, str) -> Session
         if not isinstance(username, str):
@@ -47,7 +135,7 @@ class RedfishAPI:
         if not isinstance(password, str):
             raise TypeError("Password must be string. Received: {0}".format(type(password)))
 
-        service_root_data = self._client.get(self._base_prefix).json
+        service_root_data = self._client.get_service_root()
         if "@odata.mockup" in service_root_data and service_root_data["@odata.mockup"]:
             session_path = "{0}/SessionService/Sessions".format(self._base_prefix)
             session_data = {
@@ -92,13 +180,24 @@ class RedfishAPI:
         update_service_data = self._client.get(update_service_path).json
         return UpdateService.from_json(self._client, update_service_data)
 
+    def get_event_service(self):  # type: () -> EventService
+        event_service_path = "{0}/EventService".format(self._base_prefix)
+        event_service_data = self._client.get(event_service_path).json
+        return EventService.from_json(self._client, event_service_data)
+
+    def listen_events(self):  # type: () -> Optional[EventListener]
+        """Starts reading server-sent events in background, if service supports them."""
+        try:
+            event_service = self.get_event_service()
+            uri = event_service.get_server_sent_event_uri()
+            if not (event_service.get_service_enabled() and uri):
+                return None
+        except RedfishError:
+            return None
+        return EventListener(self._client, uri).start()
+
     def get_manager_collection(self):  # type: () -> List[Manager]
-        managers = []
-        managers_collection = self._client.get("{0}/Managers".format(self._base_prefix)).json
-        for member in managers_collection["Members"]:
-            manager_data = self._client.get(member["@odata.id"]).json
-            managers.append(Manager.from_json(self._client, manager_data))
-        return managers
+        return load_collection(self._client, "{0}/Managers".format(self._base_prefix), Manager)
 
     def get_manager(self, manager_id):  # type: (str) -> Optional[Manager]
         if not isinstance(manager_id, str):
@@ -112,12 +211,7 @@ class RedfishAPI:
         return Manager.from_json(self._client, manager_data)
 
     def get_system_collection(self):  # type: () -> List[System]
-        systems = []
-        systems_collection = self._client.get("{0}/Systems".format(self._base_prefix)).json
-        for member in systems_collection["Members"]:
-            system_data = self._client.get(member["@odata.id"]).json
-            systems.append(System.from_json(self._client, system_data))
-        return systems
+        return load_collection(self._client, "{0}/Systems".format(self._base_prefix), System)
 
     def get_system(self, system_id):  # type: (str) -> Optional[System]
         if not isinstance(system_id, str):
@@ -131,12 +225,7 @@ class RedfishAPI:
         return System.from_json(self._client, system_data)
 
     def get_chassis_collection(self):  # type: () -> List[Chassis]
-        chassis = []
-        chassis_collection = self._client.get("{0}/Chassis".format(self._base_prefix)).json
-        for member in chassis_collection["Members"]:
-            chassis_data = self._client.get(member["@odata.id"]).json
-            chassis.append(Chassis.from_json(self._client, chassis_data))
-        return chassis
+        return load_collection(self._client, "{0}/Chassis".format(self._base_prefix), Chassis)
 
     def get_chassis(self, chassis_id):  # type: (str) -> Optional[Chassis]
         if not isinstance(chassis_id, str):
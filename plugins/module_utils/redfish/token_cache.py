@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Optional, Tuple
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Optional = Tuple = None
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+DEFAULT_TOKEN_CACHE_DIR = "~/.ansible/yadro_obmc/sessions"
+DEFAULT_TOKEN_CACHE_TTL = 300
+
+
+class SessionTokenCache:
+    """Keeps Redfish session tokens on disk, so following tasks can reuse them.
+
+    Entries are keyed by server and credentials digest: token isn't reused after
+    password change or with a wrong password. Files are readable by owner only.
+    """
+
+    def __init__(self, directory=DEFAULT_TOKEN_CACHE_DIR, ttl=DEFAULT_TOKEN_CACHE_TTL):  # type: (str, int) -> None
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+
+    def _get_entry_path(self, server, username, password):  # type: (str, str, str) -> str
+        key = "\0".join([server, username, password]).encode("utf-8")
+        return os.path.join(self.directory, hashlib.sha256(key).hexdigest())
+
+    def get(self, server, username, password):  # type: (str, str, str) -> Optional[Tuple[str, str]]
+        """Returns token and session path, if session was created less than ttl seconds ago."""
+        entry_path = self._get_entry_path(server, username, password)
+        try:
+            with open(entry_path) as f:
+                entry = json.load(f)
+            if time.time() - entry["created"] < self.ttl:
+                return entry["token"], entry["session"]
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def put(self, server, username, password, token, session):  # type: (str, str, str, str, str) -> None
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, 0o700)
+        entry_path = self._get_entry_path(server, username, password)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"token": token, "session": session, "created": time.time()}, f)
+            os.rename(tmp_path, entry_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def delete(self, server, username, password):  # type: (str, str, str) -> None
+        try:
+            os.remove(self._get_entry_path(server, username, password))
+        except OSError:
+            pass
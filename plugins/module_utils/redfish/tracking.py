@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Callable, Optional, Any
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Callable = Optional = Any = None
+
+import time
+import socket
+import threading
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishTimeoutError
+
+# Server-sent events connection is idle between events, so it's kept open much longer than requests.
+EVENT_STREAM_TIMEOUT = 3600
+
+
+class Backoff:
+    """Exponentially growing delays between polls of a long running operation."""
+
+    def __init__(self, initial=0.5, factor=2.0, maximum=8.0):  # type: (float, float, float) -> None
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+        self._delay = initial
+
+    def reset(self):  # type: () -> None
+        self._delay = self.initial
+
+    def next_delay(self):  # type: () -> float
+        delay = self._delay
+        self._delay = min(self._delay * self.factor, self.maximum)
+        return delay
+
+
+class EventListener:
+    """Reads Redfish server-sent events in background and wakes up waiting pollers on each event.
+
+    Events aren't interpreted: they only tell that something changed on the service, so
+    the tracked resource is worth checking right away. If the stream can't be opened or
+    breaks, waiters silently fall back to sleeping.
+    """
+
+    def __init__(self, client, uri):  # type: (RESTClient, str) -> None
+        self._client = client
+        self._uri = uri
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._response = None  # type: Any
+        self.connected = False
+        self._thread = threading.Thread(target=self._listen)
+        self._thread.daemon = True
+
+    def start(self):  # type: () -> EventListener
+        self._thread.start()
+        return self
+
+    def _listen(self):  # type: () -> None
+        response = None
+        try:
+            response = self._client.open_stream(
+                self._uri, headers={"Accept": "text/event-stream"}, timeout=EVENT_STREAM_TIMEOUT,
+            )
+            with self._lock:
+                if self._closed:
+                    return
+                self._response = response
+                self.connected = True
+            for line in iter(response.readline, b""):
+                if self._closed:
+                    break
+                if line.startswith(b"data:"):
+                    self._event.set()
+        except Exception:
+            pass
+        finally:
+            self.connected = False
+            if response is not None:
+                try:
+                    response.close()
+                except Exception:
+                    pass
+
+    def wait(self, timeout):  # type: (float) -> bool
+        """Waits for an event up to timeout seconds. Returns True if an event was received."""
+        if not self.connected:
+            time.sleep(timeout)
+            return False
+        received = self._event.wait(timeout)
+        self._event.clear()
+        return received
+
+    def close(self):  # type: () -> None
+        """Stops waking up pollers and closes the stream.
+
+        Response can't be closed while another thread reads it, so its socket is shut down instead:
+        the read ends right away and the reading thread closes the response.
+        """
+        with self._lock:
+            self._closed = True
+            self.connected = False
+            response = self._response
+        if response is not None:
+            sock = _find_socket(response)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except (IOError, OSError):
+                    # Already closed by server
+                    pass
+
+
+def _find_socket(response):  # type: (Any) -> Optional[socket.socket]
+    """Returns socket under urllib response, None if it can't be found.
+
+    Python 3 keeps it in response.fp.raw._sock, Python 2 in response.fp._sock.fp._sock.
+    """
+    stream = response
+    for _ in range(8):
+        if stream is None or isinstance(stream, socket.socket):
+            return stream
+        stream = getattr(stream, "raw", None) or getattr(stream, "_sock", None) or getattr(stream, "fp", None)
+    return None
+
+
+def wait_until(check, timeout, backoff=None, listener=None):
+    # type: (Callable[[], Any], float, Optional[Backoff], Optional[EventListener]) -> Any
+    """Calls check until it returns true value, which is returned.
+
+    Polling interval grows exponentially, and starts over after every event received by listener.
+    Raises RedfishTimeoutError if value wasn't returned in timeout seconds.
+    """
+    backoff = backoff or Backoff()
+    deadline = time.time() + timeout
+    while True:
+        result = check()
+        if result:
+            return result
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise RedfishTimeoutError("Operation not finished in {0} seconds".format(timeout))
+        delay = min(backoff.next_delay(), remaining)
+        if listener is None:
+            time.sleep(delay)
+        elif listener.wait(delay):
+            backoff.reset()
@@ -52,7 +52,6 @@ EXAMPLES = r"""
 """
 
 
-from functools import partial
 from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import OpenBmcModule
 
 
@@ -66,19 +65,14 @@ class OpenBmcHostnameModule(OpenBmcModule):
         )
 
     def _run(self):
-        changes = []
-
-        network_protocol = self.redfish.get_manager("bmc").get_network_protocol()
+        network_protocol = self.redfish.get_manager("bmc").get_network_protocol(select=["HostName"])
+        network_protocol.begin_changes()
         if self.params["name"] != network_protocol.get_hostname():
-            changes.append(partial(
-                network_protocol.set_hostname,
-                self.params["name"],
-            ))
+            network_protocol.set_hostname(self.params["name"])
 
-        if changes:
+        if network_protocol.has_pending_changes():
             if not self.check_mode:
-                for action in changes:
-                    action()
+                network_protocol.commit_changes()
             self.exit_json(msg="Operation successful.", changed=True)
         else:
             self.exit_json(msg="No changes required.", changed=False)
@@ -0,0 +1,218 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+---
+module: bmc_log_info
+short_description: Return entries of system or BMC log.
+version_added: "1.2.0"
+description:
+  - Entries are read page by page in the order they were added to the log.
+  - With I(incremental) enabled, position of the last entry read is kept on the controller,
+    so following runs return only entries added since.
+  - This module supports check mode. Cursor isn't saved in check mode.
+author: "Radmir Safin (@radmirsafin)"
+extends_documentation_fragment:
+  - yadro.obmc.connection_options
+options:
+  source:
+    type: str
+    default: system
+    choices: ["system", "bmc"]
+    description: Resource log service belongs to, host system or BMC.
+  log_service:
+    type: str
+    default: EventLog
+    description: Id of the log service, like C(EventLog) or C(Journal).
+  incremental:
+    type: bool
+    default: False
+    description:
+      - Return only entries added since the previous run with this option enabled.
+      - If the log was cleared or rotated since, entries created since the last entry read are returned,
+        entries without recognized C(Created) time are skipped then.
+  cursor_dir:
+    type: path
+    default: ~/.ansible/yadro_obmc/log_cursors
+    description: Directory keeping cursors of incremental runs.
+  max_entries:
+    type: int
+    default: 0
+    description:
+      - Maximum number of entries returned, zero means no limit.
+      - With I(incremental) enabled, remaining entries are returned by following runs.
+  page_size:
+    type: int
+    default: 1000
+    description: Number of entries requested at once, if service supports C($top) query.
+"""
+
+RETURN = r"""
+---
+msg:
+  type: str
+  returned: always
+  description: Operation status message.
+error:
+  type: str
+  returned: on error
+  description: Error details if raised.
+entries:
+  type: list
+  elements: dict
+  returned: on success
+  description: Log entries in the order they were added.
+  sample: [
+    {
+      "Id": "1652345678",
+      "Name": "System Event Log Entry",
+      "Created": "2022-05-12T08:54:38+00:00",
+      "EntryType": "Event",
+      "Severity": "OK",
+      "Message": "Host system DC power is on",
+      "MessageId": "OpenBMC.0.1.DCPowerOn",
+      "MessageArgs": []
+    }
+  ]
+cursor:
+  type: dict
+  returned: on success
+  description: Position of the last entry read, null if log is empty and no cursor was saved.
+  sample: {
+    "Id": "1652345678",
+    "Created": "2022-05-12T08:54:38+00:00",
+    "Position": 42
+  }
+"""
+
+EXAMPLES = r"""
+---
+- name: Get system event log
+  yadro.obmc.bmc_log_info:
+    connection:
+      hostname: "localhost"
+      username: "username"
+      password: "password"
+
+- name: Get BMC journal entries added since previous run
+  yadro.obmc.bmc_log_info:
+    connection:
+      hostname: "localhost"
+      username: "username"
+      password: "password"
+    source: bmc
+    log_service: Journal
+    incremental: true
+"""
+
+
+from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import OpenBmcModule
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.log.service import DEFAULT_LOG_PAGE_SIZE
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.log_cursor import (
+    DEFAULT_LOG_CURSOR_DIR,
+    LogCursorStore,
+)
+
+
+class OpenBmcLogInfoModule(OpenBmcModule):
+
+    def __init__(self):
+        argument_spec = {
+            "source": {
+                "type": "str",
+                "required": False,
+                "default": "system",
+                "choices": ["system", "bmc"],
+            },
+            "log_service": {
+                "type": "str",
+                "required": False,
+                "default": "EventLog",
+            },
+            "incremental": {
+                "type": "bool",
+                "required": False,
+                "default": False,
+            },
+            "cursor_dir": {
+                "type": "path",
+                "required": False,
+                "default": DEFAULT_LOG_CURSOR_DIR,
+            },
+            "max_entries": {
+                "type": "int",
+                "required": False,
+                "default": 0,
+            },
+            "page_size": {
+                "type": "int",
+                "required": False,
+                "default": DEFAULT_LOG_PAGE_SIZE,
+            },
+        }
+        super(OpenBmcLogInfoModule, self).__init__(
+            argument_spec=argument_spec,
+            supports_check_mode=True
+        )
+
+    def _run(self):
+        if self.params["max_entries"] < 0:
+            self.fail_json(msg="Option max_entries must not be negative.")
+        if self.params["page_size"] < 1:
+            self.fail_json(msg="Option page_size must be positive.")
+
+        if self.params["source"] == "bmc":
+            resource = self.redfish.get_manager("bmc")
+        else:
+            resource = self.redfish.get_system("system")
+        log_service = resource.get_log_service(self.params["log_service"])
+        if log_service is None:
+            self.fail_json(msg="Log service {0} not found.".format(self.params["log_service"]))
+
+        connection = self.params["connection"]
+        server = "{0}:{1}".format(connection["hostname"], connection["port"])
+        store = None
+        cursor = None
+        if self.params["incremental"]:
+            store = LogCursorStore(self.params["cursor_dir"])
+            cursor = store.get(server, log_service.get_path())
+
+        entries = []
+        new_cursor = cursor
+        for entry, new_cursor in log_service.iter_entries_since(
+            cursor, page_size=self.params["page_size"], compact=True,
+        ):
+            entries.append({
+                "Id": entry.get_id(),
+                "Name": entry.get_name(),
+                "Created": entry.get_created(),
+                "EntryType": entry.get_entry_type(),
+                "Severity": entry.get_severity(),
+                "Message": entry.get_message(),
+                "MessageId": entry.get_message_id(),
+                "MessageArgs": entry.get_message_args(),
+            })
+            if len(entries) == self.params["max_entries"]:
+                break
+
+        if store is not None and new_cursor is not None and new_cursor != cursor and not self.check_mode:
+            store.put(server, log_service.get_path(), new_cursor)
+        self.exit_json(msg="Operation successful.", changed=False, entries=entries, cursor=new_cursor)
+
+
+def main():
+    OpenBmcLogInfoModule().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -123,7 +123,6 @@ EXAMPLES = r"""
 """
 
 
-from functools import partial
 from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import OpenBmcModule
 
 
@@ -142,8 +141,6 @@ class OpenBmcNetworkInterfaceModule(OpenBmcModule):
         )
 
     def _run(self):
-        changes = []
-
         if self.params["dhcp_enabled"] and self.params["ipv4_addresses"]:
             self.fail_json(
                 msg="Cannot configure network interface.",
@@ -165,13 +162,11 @@ class OpenBmcNetworkInterfaceModule(OpenBmcModule):
                 error="Interface {0} not found.".format(self.params["name"]),
                 changed=False
             )
+        interface.begin_changes()
 
         if self.params["dhcp_enabled"] is not None:
             if interface.get_dhcpv4_enabled() != self.params["dhcp_enabled"]:
-                changes.append(partial(
-                    interface.set_dhcpv4_enabled,
-                    self.params["dhcp_enabled"],
-                ))
+                interface.set_dhcpv4_enabled(self.params["dhcp_enabled"])
 
         ip_addresses = interface.get_static_ipv4_addresses()
         if self.params["ipv4_addresses"] is not None:
@@ -193,10 +188,7 @@ class OpenBmcNetworkInterfaceModule(OpenBmcModule):
                         "Gateway": conf["gateway"],
                         "SubnetMask": conf["subnet_mask"],
                     })
-                changes.append(partial(
-                    interface.set_ipv4_addresses,
-                    payload,
-                ))
+                interface.set_ipv4_addresses(payload)
 
         static_nameservers = interface.get_static_nameservers()
         if self.params["static_nameservers"] is not None:
@@ -205,15 +197,11 @@ class OpenBmcNetworkInterfaceModule(OpenBmcModule):
                 if all(ns in static_nameservers for ns in self.params["static_nameservers"]):
                     nameservers_changed = False
             if nameservers_changed:
-                changes.append(partial(
-                    interface.set_static_nameservers,
-                    self.params["static_nameservers"],
-                ))
+                interface.set_static_nameservers(self.params["static_nameservers"])
 
-        if changes:
+        if interface.has_pending_changes():
             if not self.check_mode:
-                for action in changes:
-                    action()
+                interface.commit_changes()
             self.exit_json(msg="Operation successful.", changed=True)
         else:
             self.exit_json(msg="No changes required.", changed=False)
@@ -65,7 +65,6 @@ EXAMPLES = r"""
 """
 
 
-from functools import partial
 from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import OpenBmcModule
 
 
@@ -83,28 +82,20 @@ class OpenBmcSecurityConfigModule(OpenBmcModule):
         )
 
     def _run(self):
-        changes = []
-
-        network_protocol = self.redfish.get_manager("bmc").get_network_protocol()
+        network_protocol = self.redfish.get_manager("bmc").get_network_protocol(select=["SSH", "IPMI"])
+        network_protocol.begin_changes()
 
         if self.params["ssh_enabled"] is not None and \
                 self.params["ssh_enabled"] != network_protocol.get_ssh_enabled():
-            changes.append(partial(
-                network_protocol.set_ssh_enabled,
-                self.params["ssh_enabled"],
-            ))
+            network_protocol.set_ssh_enabled(self.params["ssh_enabled"])
 
         if self.params["ipmi_enabled"] is not None and \
                 self.params["ipmi_enabled"] != network_protocol.get_ipmi_enabled():
-            changes.append(partial(
-                network_protocol.set_ipmi_enabled,
-                self.params["ipmi_enabled"]
-            ))
+            network_protocol.set_ipmi_enabled(self.params["ipmi_enabled"])
 
-        if changes:
+        if network_protocol.has_pending_changes():
             if not self.check_mode:
-                for action in changes:
-                    action()
+                network_protocol.commit_changes()
             self.exit_json(msg="Operation successful.", changed=True)
         else:
             self.exit_json(msg="No changes required.", changed=False)
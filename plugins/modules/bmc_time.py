@@ -90,7 +90,6 @@ EXAMPLES = r"""
 """
 
 
-from functools import partial
 from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import OpenBmcModule
 
 
@@ -107,8 +106,6 @@ class OpenBmcTimeModule(OpenBmcModule):
         )
 
     def _run(self):
-        changes = []
-
         if self.params["ntp_servers"] and len(self.params["ntp_servers"]) > 3:
             self.fail_json(
                 msg="Cannot configure NTP servers.",
@@ -117,26 +114,20 @@ class OpenBmcTimeModule(OpenBmcModule):
             )
 
         manager = self.redfish.get_manager("bmc")
-        network_protocol = manager.get_network_protocol()
+        network_protocol = manager.get_network_protocol(select=["NTP"])
+        network_protocol.begin_changes()
 
         if self.params["ntp_enabled"] is not None and \
                 self.params["ntp_enabled"] != network_protocol.get_ntp_enabled():
-            changes.append(partial(
-                network_protocol.set_ntp_enabled,
-                self.params["ntp_enabled"],
-            ))
+            network_protocol.set_ntp_enabled(self.params["ntp_enabled"])
 
         if self.params["ntp_servers"] is not None and \
                 self.params["ntp_servers"] != network_protocol.get_ntp_servers():
-            changes.append(partial(
-                network_protocol.set_ntp_servers,
-                self.params["ntp_servers"],
-            ))
+            network_protocol.set_ntp_servers(self.params["ntp_servers"])
 
-        if changes:
+        if network_protocol.has_pending_changes():
             if not self.check_mode:
-                for action in changes:
-                    action()
+                network_protocol.commit_changes()
             self.exit_json(msg="Operation successful.", changed=True)
         else:
             self.exit_json(msg="No changes required.", changed=False)
@@ -82,8 +82,9 @@ class OpenBmcFirmwareInfoModule(OpenBmcModule):
 
     def _run(self):
         update_service = self.redfish.get_update_service()
-        bmc_inventory = update_service.get_firmware_inventory("bmc_active")
-        bios_inventory = update_service.get_firmware_inventory("bios_active")
+        select = ["Id", "Name", "Updateable", "Version", "Status"]
+        bmc_inventory = update_service.get_firmware_inventory("bmc_active", select=select)
+        bios_inventory = update_service.get_firmware_inventory("bios_active", select=select)
         self.exit_json(msg="Operation successful.", firmware_info={
             "BMC": {
                 "Id": bmc_inventory.get_id(),
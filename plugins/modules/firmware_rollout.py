@@ -0,0 +1,271 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: firmware_rollout
+short_description: Updates bmc or host firmware on many servers.
+version_added: "1.2.0"
+description:
+  - Updates bmc or host firmware of many servers from a single task, as M(yadro.obmc.firmware_update)
+    does for a single server.
+  - Servers are updated concurrently. Image uploads, activation waits and reboots of all servers
+    are driven by one process, so the task should be run once, e.g. with C(run_once) or on localhost.
+  - Servers can be updated in batches, starting with canary servers. Rollout is stopped when canary
+    update fails or failed updates exceed I(max_fail_percentage).
+  - Supports http, https, tftp servers or local storage as image location. Image from http(s)
+    server is downloaded once to the control node and uploaded to every server from there.
+author: "Sergey Kovalev (@kvlvs)"
+extends_documentation_fragment:
+  - yadro.obmc.connections_options
+options:
+  image_path:
+    required: True
+    type: str
+    description:
+      - Path to the image. It can be http, https, tftp server or local storage.
+  validate_certs:
+    required: False
+    type: bool
+    default: True
+    description:
+      - Indicates a need for certificate validation
+      - Actual only for https server as image location
+  upload_timeout:
+    required: False
+    type: int
+    default: 1800
+    description:
+      - How many seconds to wait for the image to be uploaded to each server.
+  activate_timeout:
+    required: False
+    type: int
+    default: 300
+    description:
+      - How many seconds to wait for the image to be activated on BMC or on the host.
+  max_concurrency:
+    required: False
+    type: int
+    default: 8
+    description:
+      - Maximum number of servers updated at the same time.
+  canary_count:
+    required: False
+    type: int
+    default: 0
+    description:
+      - Number of servers updated first, before the others.
+      - If any of them fails, other servers are not updated.
+  batch_percentage:
+    required: False
+    type: int
+    default: 100
+    description:
+      - Percentage of servers (after canary servers) updated in one batch.
+      - Next batch is started when all updates of the previous one are finished.
+  max_fail_percentage:
+    required: False
+    type: int
+    default: 0
+    description:
+      - Percentage of all servers allowed to fail before the rollout is stopped.
+      - Checked after each batch.
+  checksum:
+    required: False
+    type: str
+    description:
+      - SHA-256 checksum of the image, as C(sha256:<hex>) or C(<hex>).
+      - Image is verified before upload. Not supported for tftp server as image location.
+  image_cache:
+    required: False
+    type: bool
+    default: False
+    description:
+      - Keep images downloaded from http(s) server on the control node, so the image is fetched
+        once and uploaded to any number of servers from disk.
+      - Images are stored by SHA-256 of their content. Without I(checksum), image cached for URL
+        is reused only if server reports the same C(ETag), C(Last-Modified) and C(Content-Length)
+        as when the image was fetched, otherwise it's fetched again.
+  image_cache_dir:
+    required: False
+    type: path
+    default: ~/.ansible/yadro_obmc/images
+    description: Directory for cached images.
+  image_cache_size:
+    required: False
+    type: int
+    default: 4096
+    description:
+      - Maximum size of cached images in megabytes. Least recently used images are removed first.
+"""
+
+RETURN = r"""
+---
+msg:
+  type: str
+  returned: always
+  description: Operation status message.
+error:
+  type: str
+  returned: on error
+  description: Error details if raised.
+hosts:
+  type: list
+  elements: dict
+  returned: always
+  description: Update state of each server in the order of I(connections).
+  contains:
+    hostname:
+      type: str
+      description: BMC server IP address or hostname.
+    state:
+      type: str
+      description: Update result, one of C(updated), C(failed) or C(skipped).
+    stage:
+      type: str
+      description: Last started update stage.
+    changed:
+      type: bool
+      description: Whether the server was changed.
+    image_id:
+      type: str
+      description: Identifier of the new image.
+    msg:
+      type: str
+      description: Update status message.
+    error:
+      type: str
+      description: Error details if update failed.
+    redfish_trace:
+      type: list
+      elements: dict
+      description: Records of requests to the server, if I(trace) is enabled for its connection.
+"""
+
+EXAMPLES = r"""
+---
+- name: Update BMC firmware on all servers
+  yadro.obmc.firmware_rollout:
+    connections: "{{ groups['bmc'] | map('extract', hostvars, 'bmc_connection') | list }}"
+    image_path: http://images.example.com/bmc-firmware.bin
+    max_concurrency: 32
+    canary_count: 2
+    batch_percentage: 25
+    max_fail_percentage: 5
+  run_once: True
+  delegate_to: localhost
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import CONNECTION_OPTIONS, connect
+from ansible_collections.yadro.obmc.plugins.module_utils.firmware import (
+    FirmwareRollout,
+    FirmwareUpdateError,
+    prepare_image,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.image_cache import (
+    ImageCache,
+    DEFAULT_IMAGE_CACHE_DIR,
+    DEFAULT_IMAGE_CACHE_SIZE,
+)
+
+
+class OpenBmcFirmwareRollout(AnsibleModule):
+
+    def __init__(self):
+        argument_spec = {
+            'connections': {
+                'type': 'list',
+                'elements': 'dict',
+                'required': True,
+                'options': CONNECTION_OPTIONS,
+            },
+            'image_path': {'type': 'str', 'required': True},
+            'validate_certs': {'type': 'bool', 'required': False, 'default': True},
+            'upload_timeout': {'type': 'int', 'required': False, 'default': 1800},
+            'activate_timeout': {'type': 'int', 'required': False, 'default': 300},
+            'max_concurrency': {'type': 'int', 'required': False, 'default': 8},
+            'canary_count': {'type': 'int', 'required': False, 'default': 0},
+            'batch_percentage': {'type': 'int', 'required': False, 'default': 100},
+            'max_fail_percentage': {'type': 'int', 'required': False, 'default': 0},
+            'checksum': {'type': 'str', 'required': False},
+            'image_cache': {'type': 'bool', 'required': False, 'default': False},
+            'image_cache_dir': {'type': 'path', 'required': False, 'default': DEFAULT_IMAGE_CACHE_DIR},
+            'image_cache_size': {'type': 'int', 'required': False, 'default': DEFAULT_IMAGE_CACHE_SIZE},
+        }
+        super(OpenBmcFirmwareRollout, self).__init__(
+            argument_spec=argument_spec,
+            supports_check_mode=False,
+        )
+        # API of each server by its index in connections, to return request traces.
+        self._apis = {}
+
+    def _connect(self, index):
+        redfish = connect(self.params['connections'][index])
+        self._apis[index] = redfish
+        return redfish
+
+    def _add_traces(self, hosts):
+        for index, host in enumerate(hosts):
+            if self.params['connections'][index]['trace'] and index in self._apis:
+                host['redfish_trace'] = self._apis[index].get_trace()
+
+    def run(self):
+        connections = self.params['connections']
+        rollout = FirmwareRollout(
+            self._connect,
+            [connection['hostname'] for connection in connections],
+            upload_timeout=self.params['upload_timeout'],
+            activate_timeout=self.params['activate_timeout'],
+            max_concurrency=self.params['max_concurrency'],
+            canary_count=self.params['canary_count'],
+            batch_percentage=self.params['batch_percentage'],
+            max_fail_percentage=self.params['max_fail_percentage'],
+        )
+
+        cache = None
+        if self.params['image_cache']:
+            cache = ImageCache(self.params['image_cache_dir'], self.params['image_cache_size'] * 1024 * 1024)
+
+        try:
+            # Remote image is downloaded once instead of being requested by each server
+            with prepare_image(
+                self.params['image_path'],
+                self.params['validate_certs'],
+                checksum=self.params['checksum'],
+                cache=cache,
+                download=True,
+            ) as image_path:
+                hosts = rollout.run(image_path, validate_certs=self.params['validate_certs'])
+        except FirmwareUpdateError as e:
+            self._add_traces(rollout.hosts)
+            self.fail_json(msg=e.msg, error=e.error, changed=e.changed, hosts=rollout.hosts)
+
+        self._add_traces(hosts)
+        changed = any(host['changed'] for host in hosts)
+        failed_count = rollout.get_failed_count()
+        if failed_count:
+            self.fail_json(
+                msg="Operation failed.",
+                error="Firmware update failed on {0} of {1} servers".format(failed_count, len(hosts)),
+                changed=changed,
+                hosts=hosts,
+            )
+        self.exit_json(msg="Operation successful.", changed=changed, hosts=hosts)
+
+
+def main():
+    OpenBmcFirmwareRollout().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,33 @@ options:
     default: 300
     description:
       - How many seconds to wait for the image to be activated on BMC or on the host.
+  checksum:
+    required: False
+    type: str
+    description:
+      - SHA-256 checksum of the image, as C(sha256:<hex>) or C(<hex>).
+      - Image is verified before upload. Not supported for tftp server as image location.
+  image_cache:
+    required: False
+    type: bool
+    default: False
+    description:
+      - Keep images downloaded from http(s) server on the control node, so the image is fetched
+        once and uploaded to any number of servers from disk.
+      - Images are stored by SHA-256 of their content. Without I(checksum), image cached for URL
+        is reused only if server reports the same C(ETag), C(Last-Modified) and C(Content-Length)
+        as when the image was fetched, otherwise it's fetched again.
+  image_cache_dir:
+    required: False
+    type: path
+    default: ~/.ansible/yadro_obmc/images
+    description: Directory for cached images.
+  image_cache_size:
+    required: False
+    type: int
+    default: 4096
+    description:
+      - Maximum size of cached images in megabytes. Least recently used images are removed first.
 """
 
 RETURN = r"""
@@ -74,19 +101,13 @@ EXAMPLES = r"""
 """
 
 
-import os
-import time
-import json
-from io import open
 from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import OpenBmcModule
-from ansible.module_utils.urls import open_url
-from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-
-
-BMC_ACTIVE_ID = 'bmc_active'
-BIOS_ACTIVE_ID = 'bios_active'
-BMC_IMAGE_DESC = 'BMC image'
-BIOS_IMAGE_DESC = 'Host image'
+from ansible_collections.yadro.obmc.plugins.module_utils.firmware import FirmwareUpdater, FirmwareUpdateError, prepare_image
+from ansible_collections.yadro.obmc.plugins.module_utils.image_cache import (
+    ImageCache,
+    DEFAULT_IMAGE_CACHE_DIR,
+    DEFAULT_IMAGE_CACHE_SIZE,
+)
 
 
 class OpenBmcFirmwareUpdate(OpenBmcModule):
@@ -108,7 +129,11 @@ class OpenBmcFirmwareUpdate(OpenBmcModule):
                 'type': 'int',
                 'required': False,
                 'default': 300,
-            }
+            },
+            'checksum': {'type': 'str', 'required': False},
+            'image_cache': {'type': 'bool', 'required': False, 'default': False},
+            'image_cache_dir': {'type': 'path', 'required': False, 'default': DEFAULT_IMAGE_CACHE_DIR},
+            'image_cache_size': {'type': 'int', 'required': False, 'default': DEFAULT_IMAGE_CACHE_SIZE},
         }
         super(OpenBmcFirmwareUpdate, self).__init__(
             argument_spec=argument_spec,
@@ -116,186 +141,29 @@ class OpenBmcFirmwareUpdate(OpenBmcModule):
         )
 
     def _run(self):
-        system = self.redfish.get_system('system')
-        if system.get_power_state() != 'Off':
-            self.fail_json(
-                error='Host is not powered off',
-                msg='Host must be powered off for updating firmware',
-                changed=False,
-            )
-
-        # Save initial images identifiers for
-        # determine new uploaded image
-        init_img_ids = self._get_init_images_ids()
-
-        self._upload_image()
-
-        new_image = self._determine_new_image(
-            init_img_ids=init_img_ids,
+        updater = FirmwareUpdater(
+            self.redfish,
+            upload_timeout=self.params['upload_timeout'],
+            activate_timeout=self.params['activate_timeout'],
         )
-
-        self._wait_image_activation(new_image)
-        self._reboot_updated_device(new_image)
+        cache = None
+        if self.params['image_cache']:
+            cache = ImageCache(self.params['image_cache_dir'], self.params['image_cache_size'] * 1024 * 1024)
+
+        try:
+            updater.check_host_powered_off()
+            with prepare_image(
+                self.params['image_path'],
+                self.params['validate_certs'],
+                checksum=self.params['checksum'],
+                cache=cache,
+            ) as image_path:
+                updater.update(image_path, validate_certs=self.params['validate_certs'])
+        except FirmwareUpdateError as e:
+            self.fail_json(msg=e.msg, error=e.error, changed=e.changed)
 
         self.exit_json(msg="Operation successful.", changed=True)
 
-    def _upload_image(self):
-        upd_service = self.redfish.get_update_service()
-
-        if os.path.exists(self.params['image_path']):
-            if not os.path.isfile(self.params['image_path']):
-                self.fail_json(
-                    error='Wrong local path was given',
-                    msg='{0} is not a file. Path to image file is required'.format(
-                        self.params['image_path']),
-                    changed=False,
-                )
-
-            with open(self.params['image_path'], 'rb') as file:
-                upd_service.upload_image(file.read())
-
-        elif self.params['image_path'].startswith(('http://', 'https://')):
-            response = None
-            try:
-                response = open_url(
-                    url=self.params['image_path'],
-                    method='GET',
-                    validate_certs=self.params['validate_certs'],
-                    timeout=60,
-                )
-            except HTTPError as e:
-                self.fail_json(
-                    error=(str(e)),
-                    msg='Error while getting image from {0}'.format(
-                        self.params['image_path']),
-                    changed=False,
-                )
-            except URLError as e:
-                self.fail_json(
-                    error=str(e.reason),
-                    msg='Error while getting image from {0}'.format(
-                        self.params['image_path']),
-                    changed=False,
-                )
-            except Exception as e:
-                self.fail_json(
-                    error=str(e),
-                    msg='Unexpected error while getting image from {0}'.format(
-                        self.params['image_path']),
-                    changed=False,
-                )
-
-            upd_service.upload_image(response.read())
-
-        elif self.params['image_path'].startswith('tftp://'):
-            upd_service.simple_update(self.params['image_path'])
-
-        else:
-            self.fail_json(
-                error='Unknown image location {0}'.format(
-                    self.params['image_path']),
-                msg='Only http, https, tftp ot local '
-                    'system location are supported',
-                changed=False,
-            )
-
-    def _get_init_images_ids(self):
-        upd_service = self.redfish.get_update_service()
-        init_images = upd_service.get_firmware_inventory_collection()
-        return set(img.get_id() for img in init_images)
-
-    def _determine_new_image(self, init_img_ids):
-        # We have to wait until image will be uploaded. Generally, it is
-        # actual for tftp download, which is really long and processing
-        # on the server's side. This is the reason for a big timeout
-
-        new_image = None
-        start_time = time.time()
-
-        while not new_image:
-            time.sleep(1)
-            # refresh firmware collection
-            upd_service = self.redfish.get_update_service()
-            current_images = upd_service.get_firmware_inventory_collection()
-            # if count of images was changed, we suppose
-            # that new image was uploaded
-            if len(current_images) > len(init_img_ids):
-                for image in current_images:
-                    is_active = image.get_id() in (BMC_ACTIVE_ID, BIOS_ACTIVE_ID)
-                    # if one of images has id that was not saved
-                    # at the beginning, then it is new uploaded image
-                    if image.get_id() not in init_img_ids and not is_active:
-                        new_image = image
-                        break
-
-            if time.time() - start_time > self.params['upload_timeout']:
-                self.fail_json(
-                    error='Timeout error',
-                    msg='New image was not found or was not '
-                        'upload for {timeout} seconds'.format(
-                            timeout=self.params['upload_timeout']),
-                    changed=True,
-                )
-
-        return new_image
-
-    def _wait_image_activation(self, image):
-        start_time = time.time()
-        while not self._is_upload_active(image):
-            timedelta = time.time() - start_time
-            if timedelta > self.params['activate_timeout']:
-                self.fail_json(
-                    error='Timeout error',
-                    msg='Image {id} was not found in '
-                        'Active status'.format(id=image.get_id()),
-                    changed=True,
-                )
-
-            time.sleep(1)
-
-    def _is_upload_active(self, image):
-        connection = self.params['connection']
-        url = '{hostname}:{port}/xyz/openbmc_project/software/{image_id}'.format(
-            hostname=connection['hostname'],
-            port=connection['port'],
-            image_id=image.get_id()
-        )
-
-        response = open_url(
-            url,
-            url_username=connection['username'],
-            url_password=connection['password'],
-            force_basic_auth=True,
-            method='GET',
-            timeout=60,
-            validate_certs=connection['validate_certs'],
-        )
-
-        activation_status = json.loads(response.read())['data']['Activation']
-        return activation_status == 'xyz.openbmc_project.Software.Activation.Activations.Active'
-
-    def _reboot_updated_device(self, image):
-        description = image.get_description()
-
-        if description == BMC_IMAGE_DESC:
-            manager = self.redfish.get_manager('bmc')
-            manager.reset_graceful()
-
-        elif description == BIOS_IMAGE_DESC:
-            system = self.redfish.get_system('system')
-            system.power_on_graceful()
-
-        else:
-            self.fail_json(
-                error='Could not recognize image description',
-                msg='New image description is {new_desc}. '
-                    'Expected: {exp_desc}. '
-                    'Host and BMC were not restarted'.format(
-                        new_desc=description,
-                        exp_desc=(BMC_IMAGE_DESC, BIOS_IMAGE_DESC)),
-                changed=True,  # Image was uploaded without restart
-            )
-
 
 def main():
     OpenBmcFirmwareUpdate().run()
@@ -0,0 +1,141 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: fleet_info
+short_description: Return system information of many servers.
+version_added: "1.2.0"
+description:
+  - Returns the same system information as M(yadro.obmc.system_info) for a list of servers.
+  - Servers are requested concurrently from a single process, so the task should be run once,
+    e.g. with C(run_once) or on localhost.
+  - Failure to read a server is reported in its result and doesn't fail the task.
+author: "Radmir Safin (@radmirsafin)"
+extends_documentation_fragment:
+  - yadro.obmc.connections_options
+options:
+  max_concurrency:
+    required: False
+    type: int
+    default: 32
+    description:
+      - Maximum number of servers requested at the same time.
+"""
+
+RETURN = r"""
+---
+msg:
+  type: str
+  returned: always
+  description: Operation status message.
+error:
+  type: str
+  returned: on error
+  description: Error details if raised.
+hosts:
+  type: list
+  elements: dict
+  returned: on success
+  description: Result of each server in the order of I(connections).
+  contains:
+    hostname:
+      type: str
+      description: BMC server IP address or hostname.
+    system_info:
+      type: dict
+      description: System information, if it was read.
+    error:
+      type: str
+      description: Error details if system information was not read.
+    elapsed:
+      type: float
+      description: Seconds spent on the server.
+    redfish_trace:
+      type: list
+      elements: dict
+      description: Records of requests to the server, if I(trace) is enabled for its connection.
+failed_count:
+  type: int
+  returned: on success
+  description: Number of servers system information was not read from.
+elapsed:
+  type: float
+  returned: on success
+  description: Seconds spent on all servers.
+"""
+
+EXAMPLES = r"""
+---
+- name: Get system information of all servers
+  yadro.obmc.fleet_info:
+    connections: "{{ groups['bmc'] | map('extract', hostvars, 'bmc_connection') | list }}"
+    max_concurrency: 64
+  run_once: True
+  delegate_to: localhost
+  register: fleet_info
+"""
+
+import time
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.yadro.obmc.plugins.module_utils.obmc_module import CONNECTION_OPTIONS, connect
+from ansible_collections.yadro.obmc.plugins.module_utils.system_info import gather_system_info
+
+
+class OpenBmcFleetInfoModule(AnsibleModule):
+
+    def __init__(self):
+        argument_spec = {
+            "connections": {
+                "required": True,
+                "type": "list",
+                "elements": "dict",
+                "options": CONNECTION_OPTIONS,
+            },
+            "max_concurrency": {"required": False, "type": "int", "default": 32},
+        }
+        super(OpenBmcFleetInfoModule, self).__init__(argument_spec=argument_spec, supports_check_mode=True)
+        # API of each server by its index in connections, to return request traces.
+        self._apis = {}
+
+    def _connect(self, index):
+        redfish = connect(self.params["connections"][index])
+        self._apis[index] = redfish
+        return redfish
+
+    def _add_traces(self, hosts):
+        for index, host in enumerate(hosts):
+            if self.params["connections"][index]["trace"] and index in self._apis:
+                host["redfish_trace"] = self._apis[index].get_trace()
+
+    def run(self):
+        start = time.time()
+        hosts = gather_system_info(
+            self._connect,
+            [connection["hostname"] for connection in self.params["connections"]],
+            self.params["max_concurrency"],
+        )
+        self._add_traces(hosts)
+        self.exit_json(
+            msg="Operation successful.",
+            hosts=hosts,
+            failed_count=len([host for host in hosts if host["error"] is not None]),
+            elapsed=round(time.time() - start, 3),
+        )
+
+
+def main():
+    OpenBmcFleetInfoModule().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measures decoding of bmcweb payloads by available JSON decoders and by HTTPClientResponse.
+
+Payloads are built from resources in the fixtures directory: single resources as they are,
+collections expanded with $expand by repeating their member, with --members members.
+Row "response" is a response which body is read three times:
+
+    python bench_json.py
+    python bench_json.py --members 2000 --repeat 20
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import copy
+import json
+import timeit
+import argparse
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client import response as response_module
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.response import HTTPClientResponse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Fixture and path of the collection it's member of, None for single resources.
+PAYLOADS = [
+    ("computer_system.json", None),
+    ("firmware_inventory_member.json", "/redfish/v1/UpdateService/FirmwareInventory"),
+    ("memory_member.json", "/redfish/v1/Systems/system/Memory"),
+    ("log_entry.json", "/redfish/v1/Systems/system/LogServices/EventLog/Entries"),
+]
+
+
+def load_payload(name, collection_path, members):  # type: (str, str, int) -> bytes
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        resource = json.load(f)
+    if collection_path is None:
+        return json.dumps(resource).encode()
+
+    collection = {
+        "@odata.id": collection_path,
+        "@odata.type": "#{0}Collection.{0}Collection".format(resource["@odata.type"].split(".")[0][1:]),
+        "Members": [],
+        "Members@odata.count": members,
+        "Name": "Collection",
+    }
+    for index in range(members):
+        member = copy.deepcopy(resource)
+        member["Id"] = "{0}{1}".format(resource["Id"], index)
+        member["@odata.id"] = "{0}/{1}".format(collection_path, member["Id"])
+        collection["Members"].append(member)
+    return json.dumps(collection).encode()
+
+
+def get_decoders():
+    decoders = [("json", json.loads)]
+    if response_module.HAS_ORJSON:
+        decoders.append(("orjson", response_module.orjson.loads))
+    if response_module.HAS_UJSON:
+        decoders.append(("ujson", response_module.ujson.loads))
+    return decoders
+
+
+def read_response(body, reads=3):  # type: (bytes, int) -> None
+    """Reads body of a response several times, as callers do to check and then to use it."""
+    raw_response = MagicMock()
+    raw_response.read.return_value = body
+    response = HTTPClientResponse(raw_response)
+    for _ in range(reads):
+        response.json
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=500, help="Number of members of expanded collections.")
+    parser.add_argument("--repeat", type=int, default=50, help="Number of decodes measured per payload.")
+    args = parser.parse_args()
+
+    print("Decoder used by HTTPClientResponse: {0}".format(response_module.loads_json.__module__))
+    print("{0:<32} {1:>10} {2:>10} {3:>12}".format("payload", "size, KiB", "decoder", "ms/op"))
+    for name, collection_path in PAYLOADS:
+        body = load_payload(name, collection_path, args.members)
+        for decoder_name, loads in get_decoders():
+            elapsed = timeit.timeit(lambda: loads(body), number=args.repeat)
+            print("{0:<32} {1:>10.1f} {2:>10} {3:>12.3f}".format(
+                name, len(body) / 1024.0, decoder_name, elapsed / args.repeat * 1000,
+            ))
+
+        elapsed = timeit.timeit(lambda: read_response(body), number=args.repeat)
+        print("{0:<32} {1:>10.1f} {2:>10} {3:>12.3f}".format(
+            name, len(body) / 1024.0, "response", elapsed / args.repeat * 1000,
+        ))
+
+
+if __name__ == "__main__":
+    main()
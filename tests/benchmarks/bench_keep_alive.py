@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Compares request rate of HTTPClient with open_url transport and with persistent connections.
+
+By default runs against a local HTTP server. Pass --certfile and --keyfile to serve HTTPS
+and include TLS handshake cost, or --hostname with credentials to measure a real BMC:
+
+    python bench_keep_alive.py --requests 200
+    python bench_keep_alive.py --certfile cert.pem --keyfile key.pem
+    python bench_keep_alive.py --hostname 10.0.0.1 --username root --password 0penBmc --path /redfish/v1/Systems
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ssl
+import json
+import time
+import argparse
+import threading
+
+from ansible.module_utils.six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from ansible.module_utils.six.moves.socketserver import ThreadingMixIn
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth, BasicAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.pool import close_pools
+
+
+SERVICE_ROOT = json.dumps({
+    "@odata.id": "/redfish/v1",
+    "@odata.type": "#ServiceRoot.v1_5_0.ServiceRoot",
+    "Id": "RootService",
+    "Name": "Root Service",
+    "RedfishVersion": "1.9.0",
+}).encode()
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class ServiceRootHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(SERVICE_ROOT)))
+        self.end_headers()
+        self.wfile.write(SERVICE_ROOT)
+
+
+def start_local_server(certfile, keyfile):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ServiceRootHandler)
+    protocol = "http"
+    if certfile:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        protocol = "https"
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server, "{0}://127.0.0.1".format(protocol), server.server_port
+
+
+def measure(client, path, requests):
+    started = time.time()
+    for _ in range(requests):
+        client.get(path).json
+    return requests / (time.time() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--hostname", help="BMC to measure. Local server is used if not set.")
+    parser.add_argument("--port", type=int, default=443)
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--path", default="/redfish/v1")
+    parser.add_argument("--certfile", help="Certificate for local HTTPS server.")
+    parser.add_argument("--keyfile", help="Private key for local HTTPS server.")
+    args = parser.parse_args()
+
+    server = None
+    if args.hostname:
+        hostname, port = args.hostname, args.port
+    else:
+        server, hostname, port = start_local_server(args.certfile, args.keyfile)
+
+    auth = BasicAuth(args.username, args.password) if args.username else NoAuth()
+    results = {}
+    for keep_alive in (False, True):
+        client = RESTClient(
+            hostname=hostname,
+            port=port,
+            validate_certs=False,
+            timeout=30,
+            auth=auth,
+            keep_alive=keep_alive,
+        )
+        results[keep_alive] = measure(client, args.path, args.requests)
+        close_pools()
+
+    print("open_url:    {0:8.1f} requests/s".format(results[False]))
+    print("keep-alive:  {0:8.1f} requests/s".format(results[True]))
+    print("speedup:     {0:8.2f}x".format(results[True] / results[False]))
+
+    if server is not None:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
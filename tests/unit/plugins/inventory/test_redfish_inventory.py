@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.yadro.obmc.plugins.inventory.redfish import InventoryModule
+
+SYSTEM = {
+    "Manufacturer": "YADRO",
+    "Model": "VEGMAN S220",
+    "PowerState": "On",
+    "Status": {"Health": "OK", "HealthRollup": "Warning"},
+    "Boot": {"BootSourceOverrideEnabled": "Disabled"},
+}
+MANAGER = {"FirmwareVersion": "2.11.0", "Status": {"Health": "OK"}}
+
+
+class FakeClient:
+    """Serves system and manager resources, failing for unreachable hostname."""
+
+    requests = []
+
+    def __init__(self, hostname, **kwargs):
+        self.hostname = hostname
+
+    def _response(self, path):
+        if self.hostname == "unreachable":
+            raise Exception("Cannot connect to server")
+        response = MagicMock()
+        response.json = SYSTEM if "Systems" in path else MANAGER
+        response.headers = {"ETag": '"1"'}
+        return response
+
+    def get(self, path):
+        self.requests.append(("GET", self.hostname, path))
+        return self._response(path)
+
+    def get_if_modified(self, path, etag):
+        self.requests.append(("REVALIDATE", self.hostname, path))
+        self._response(path)
+        return None
+
+
+@pytest.fixture
+def plugin():
+    plugin = InventoryModule()
+    options = {
+        "hosts": ["bmc01", {"name": "node02", "hostname": "unreachable"}],
+        "username": "root",
+        "password": "secret",
+        "port": 443,
+        "validate_certs": False,
+        "timeout": 30,
+        "max_concurrency": 4,
+        "max_wait": 10,
+        "refresh_ttl": 300,
+        "group_by_facts": True,
+        "strict": False,
+        "compose": {},
+        "groups": {},
+        "keyed_groups": [],
+        "leading_separator": True,
+        "use_extra_vars": False,
+    }
+    plugin.get_option = lambda name: options[name]
+    plugin.inventory = InventoryData()
+    plugin.templar = Templar(loader=DataLoader())
+    FakeClient.requests = []
+    with patch("ansible_collections.yadro.obmc.plugins.inventory.redfish.RESTClient", FakeClient):
+        yield plugin
+
+
+def test_inventory_groups(plugin):
+    hosts = plugin._get_hosts()
+    entries = plugin._refresh(hosts, {})
+    plugin._populate(hosts, entries)
+
+    bmc01 = plugin.inventory.get_host("bmc01")
+    assert bmc01.vars["obmc_model"] == "VEGMAN S220"
+    assert bmc01.vars["obmc_health"] == "Warning"
+    assert bmc01.vars["obmc_firmware_version"] == "2.11.0"
+    # Only listed properties are kept in cache
+    assert "Boot" not in entries["bmc01"]["resources"]["system"]["data"]
+
+    groups = plugin.inventory.groups
+    assert "bmc01" in [h.name for h in groups["obmc_power_state_On"].get_hosts()]
+    assert "bmc01" in [h.name for h in groups["obmc_health_Warning"].get_hosts()]
+    assert [h.name for h in groups["obmc_unreachable"].get_hosts()] == ["node02"]
+    assert plugin.inventory.get_host("node02").vars["obmc_error"] == "Cannot connect to server"
+
+
+def test_incremental_refresh(plugin):
+    hosts = plugin._get_hosts()
+    entries = plugin._refresh(hosts, {})
+
+    # Fresh entries are not requested
+    FakeClient.requests = []
+    entries = plugin._refresh(hosts, entries)
+    assert [r for r in FakeClient.requests if r[1] == "bmc01"] == []
+
+    # Outdated entries are revalidated with their ETags
+    entries["bmc01"]["checked"] = 0
+    plugin._refresh(hosts, entries)
+    assert sorted(r[0] for r in FakeClient.requests if r[1] == "bmc01") == ["REVALIDATE", "REVALIDATE"]
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import pytest
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.account.service import AccountService
+
+SERVICE_PATH = "/redfish/v1/AccountService"
+ACCOUNT_PATH = SERVICE_PATH + "/Accounts/operator"
+
+
+def ldap_data(enabled):
+    return {
+        "ServiceEnabled": enabled,
+        "ServiceAddresses": ["ldap://ldap.example.com"],
+        "Authentication": {"AuthenticationType": "UsernameAndPassword", "Username": "cn=bmc", "Password": None},
+        "LDAPService": {"SearchSettings": {
+            "BaseDistinguishedNames": ["dc=example,dc=com"],
+            "UsernameAttribute": "uid",
+            "GroupsAttribute": "memberOf",
+        }},
+        "RemoteRoleMapping": [
+            {"RemoteGroup": "admins", "LocalRole": "Administrator"},
+            {"RemoteGroup": "users", "LocalRole": "ReadOnly"},
+        ],
+    }
+
+
+class FakeAccountService:
+
+    def __init__(self):
+        self.documents = {
+            SERVICE_PATH: {
+                "@odata.id": SERVICE_PATH,
+                "@odata.type": "#AccountService.v1_5_0.AccountService",
+                "Id": "AccountService",
+                "Name": "Account Service",
+                "LDAP": ldap_data(False),
+                "ActiveDirectory": ldap_data(True),
+            },
+            ACCOUNT_PATH: {
+                "@odata.id": ACCOUNT_PATH,
+                "@odata.type": "#ManagerAccount.v1_4_0.ManagerAccount",
+                "Id": "operator",
+                "Name": "User Account",
+                "UserName": "operator",
+                "Password": None,
+                "RoleId": "Operator",
+                "Enabled": True,
+                "Locked": False,
+            },
+        }
+        self.requests = []
+
+    def _response(self, data=None, status=200):
+        response = MagicMock()
+        response.status_code = status
+        response.headers = {}
+        response.json = data
+        return response
+
+    def get(self, path, query_params=None, headers=None, select=None):
+        self.requests.append(("GET", path, None))
+        return self._response(copy.deepcopy(self.documents[path]))
+
+    def patch(self, path, body=None, headers=None):
+        self.requests.append(("PATCH", path, body))
+        # Service responds with messages only, like OpenBMC does
+        return self._response(status=204)
+
+    def post(self, path, body=None, headers=None):
+        self.requests.append(("POST", path, body))
+        return self._response(status=201)
+
+    def delete(self, path, headers=None):
+        self.requests.append(("DELETE", path, None))
+        return self._response()
+
+
+class TestAccountService:
+
+    @pytest.fixture
+    def bmc(self, mocker):
+        bmc = FakeAccountService()
+        client = RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+        for method in ("get", "patch", "post", "delete"):
+            mocker.patch.object(client, method, side_effect=getattr(bmc, method))
+        bmc.client = client
+        return bmc
+
+    def test_config_ldap_applied_without_reload(self, bmc):
+        account_service = AccountService.load(bmc.client, SERVICE_PATH)
+
+        config = account_service.config_ldap(
+            "LDAP",
+            enabled=True,
+            password="secret",
+            role_groups=[None, {"name": "users", "role": "Operator"}, {"name": "guests", "role": "ReadOnly"}],
+        )
+
+        assert [(method, body) for method, _, body in bmc.requests[2:]] == [
+            ("PATCH", {"ActiveDirectory": {"ServiceEnabled": False}}),
+            ("PATCH", {"LDAP": {
+                "ServiceEnabled": True,
+                "Authentication": {"Password": "secret"},
+                "RemoteRoleMapping": [
+                    None,
+                    {"RemoteGroup": "users", "LocalRole": "Operator"},
+                    {"RemoteGroup": "guests", "LocalRole": "ReadOnly"},
+                ],
+            }}),
+        ]
+        assert config["enabled"] is True
+        assert config["password"] is None
+        assert config["role_groups"] == [{"name": "users", "role": "Operator"}, {"name": "guests", "role": "ReadOnly"}]
+        assert config["uri"] == "ldap://ldap.example.com"
+        assert account_service.get_ldap_config("ActiveDirectory")["enabled"] is False
+
+    def test_accounts_changed_without_reload(self, bmc):
+        account_service = AccountService.load(bmc.client, SERVICE_PATH)
+        account = account_service.get_account("operator")
+
+        account.set_password("secret")
+        account_service.create_account("guest", "password", "ReadOnly", True)
+        account_service.delete_account("operator")
+
+        assert [(method, path) for method, path, _ in bmc.requests] == [
+            ("GET", SERVICE_PATH),
+            ("GET", ACCOUNT_PATH),
+            ("PATCH", ACCOUNT_PATH),
+            ("POST", SERVICE_PATH + "/Accounts"),
+            ("DELETE", ACCOUNT_PATH),
+        ]
+        assert account._data["Password"] is None
+
+    def test_password_not_kept_after_commit(self, bmc):
+        account = AccountService.load(bmc.client, SERVICE_PATH).get_account("operator")
+
+        with account.changes():
+            account.set_password("secret")
+            account.set_enabled(False)
+
+        assert bmc.requests[-1] == ("PATCH", ACCOUNT_PATH, {"Password": "secret", "Enabled": False})
+        assert account.get_enabled() is False
+        assert account._data["Password"] is None
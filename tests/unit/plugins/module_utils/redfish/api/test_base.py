@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+from io import BytesIO
+
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.http import HTTPClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientPreconditionFailedError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.chassis.chassis import Chassis
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.network_protocol import (
+    ManagerNetworkProtocol,
+    ManagerNetworkProtocol_v1_5_0,
+)
+
+
+class TestRedfishAPIObject:
+
+    @pytest.fixture
+    def client(self, mocker):
+        client = RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+        client._service_root = {"ProtocolFeaturesSupported": {"SelectQuery": True}}
+        response = MagicMock()
+        response.json = {
+            "@odata.id": "/redfish/v1/Managers/bmc/NetworkProtocol",
+            "@odata.type": "#ManagerNetworkProtocol.v1_5_0.ManagerNetworkProtocol",
+            "NTP": {"ProtocolEnabled": True, "NTPServers": ["pool.ntp.org"]},
+        }
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__), return_value=response)
+        return client, mock
+
+    def test_load_with_select(self, client):
+        client, mock = client
+        network_protocol = ManagerNetworkProtocol.load(
+            client, "/redfish/v1/Managers/bmc/NetworkProtocol", select=["NTP"],
+        )
+        assert isinstance(network_protocol, ManagerNetworkProtocol_v1_5_0)
+        assert network_protocol.get_ntp_servers() == ["pool.ntp.org"]
+
+        network_protocol.reload()
+        assert mock.call_count == 2
+        for call in mock.call_args_list:
+            assert call[0][2] == {"$select": "NTP"}
+
+    def test_subresources_memoized(self, mocker):
+        client = RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+        documents = {
+            "/redfish/v1/Chassis/chassis": {
+                "@odata.id": "/redfish/v1/Chassis/chassis",
+                "@odata.type": "#Chassis.v1_14_0.Chassis",
+            },
+            "/redfish/v1/Chassis/chassis/Thermal": {
+                "@odata.id": "/redfish/v1/Chassis/chassis/Thermal",
+                "@odata.type": "#Thermal.v1_4_0.Thermal",
+            },
+            "/redfish/v1/Chassis/chassis/Power": {
+                "@odata.id": "/redfish/v1/Chassis/chassis/Power",
+                "@odata.type": "#Power.v1_5_2.Power",
+            },
+        }
+
+        def make_request(path, *args, **kwargs):
+            response = MagicMock()
+            response.json = dict(documents[path])
+            return response
+
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__), side_effect=make_request)
+        chassis = Chassis.load(client, "/redfish/v1/Chassis/chassis")
+
+        thermal = chassis.get_thermal()
+        assert chassis.get_thermal() is thermal
+        assert chassis.get_power() is chassis.get_power()
+        assert mock.call_count == 3
+
+        # Reload drops loaded subresources
+        chassis.reload()
+        assert chassis.get_thermal() is not thermal
+        assert mock.call_count == 5
+
+    def test_changes_merged_into_one_patch(self, client):
+        client, mock = client
+        network_protocol = ManagerNetworkProtocol.load(client, "/redfish/v1/Managers/bmc/NetworkProtocol")
+
+        with network_protocol.changes():
+            network_protocol.set_ntp_enabled(False)
+            network_protocol.set_ntp_servers(["192.168.1.100"])
+            network_protocol.set_ssh_enabled(True)
+            assert network_protocol.has_pending_changes()
+            assert mock.call_count == 1
+
+        # One PATCH, sent properties are applied without reload
+        assert mock.call_count == 2
+        assert mock.call_args_list[1][0][1] == "PATCH"
+        assert mock.call_args_list[1][0][3] == {
+            "NTP": {"ProtocolEnabled": False, "NTPServers": ["192.168.1.100"]},
+            "SSH": {"ProtocolEnabled": True},
+        }
+        assert not network_protocol.has_pending_changes()
+        assert network_protocol.get_ntp_enabled() is False
+        assert network_protocol.get_ntp_servers() == ["192.168.1.100"]
+        assert network_protocol.get_ssh_enabled() is True
+
+    def test_discarded_changes(self, client):
+        client, mock = client
+        network_protocol = ManagerNetworkProtocol.load(client, "/redfish/v1/Managers/bmc/NetworkProtocol")
+
+        network_protocol.begin_changes()
+        network_protocol.set_ntp_enabled(False)
+        network_protocol.discard_changes()
+        network_protocol.begin_changes()
+        network_protocol.commit_changes()
+        assert mock.call_count == 1
+
+    @pytest.fixture
+    def etag_client(self, mocker):
+        client = RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+        document = {
+            "@odata.id": "/redfish/v1/Managers/bmc/NetworkProtocol",
+            "@odata.type": "#ManagerNetworkProtocol.v1_5_0.ManagerNetworkProtocol",
+            "HostName": "bmc",
+            "SSH": {"ProtocolEnabled": False},
+        }
+
+        def make_request(path, method, query_params, body, headers, attempt=1):
+            response = MagicMock()
+            response.status_code = 200
+            response.headers = {"ETag": '"2"'} if method == "PATCH" else {"ETag": '"1"'}
+            if method == "PATCH":
+                document.update(body)
+            response.json = dict(document)
+            return response
+
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__), side_effect=make_request)
+        return client, mock
+
+    def test_patch_applies_response(self, etag_client):
+        client, mock = etag_client
+        network_protocol = ManagerNetworkProtocol.load(client, "/redfish/v1/Managers/bmc/NetworkProtocol")
+
+        network_protocol.set_hostname("bmc-01")
+        network_protocol.set_ssh_enabled(True)
+        assert network_protocol.get_hostname() == "bmc-01"
+        assert mock.call_count == 3
+        assert mock.call_args_list[1][0][4] == {"If-Match": '"1"'}
+        # Version returned by the previous write is used
+        assert mock.call_args_list[2][0][4] == {"If-Match": '"2"'}
+
+    def test_patch_without_etag_for_select(self, etag_client):
+        client, mock = etag_client
+        network_protocol = ManagerNetworkProtocol.load(
+            client, "/redfish/v1/Managers/bmc/NetworkProtocol", select=["HostName"],
+        )
+        network_protocol.set_hostname("bmc-01")
+        assert mock.call_args_list[-1][0][4] is None
+
+    def test_patch_precondition_failed(self, mocker):
+        client = RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+        network_protocol = ManagerNetworkProtocol_v1_5_0(client, "/redfish/v1/Managers/bmc/NetworkProtocol", {
+            "@odata.etag": '"1"',
+            "HostName": "bmc",
+        })
+        error = HTTPError("https://localhost:443/redfish/v1/Managers/bmc/NetworkProtocol", 412, "Precondition Failed",
+                          {}, BytesIO(b"{}"))
+        mocker.patch("{0}.HTTPClient._make_request".format(HTTPClient.__module__), side_effect=error)
+        with pytest.raises(RESTClientPreconditionFailedError):
+            network_protocol.set_hostname("bmc-01")
+        assert network_protocol.get_hostname() == "bmc"
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+import pytest
+import threading
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
+    RESTClientNotFoundError,
+    RESTClientRequestError,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import RedfishFieldNotFoundError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.collection import (
+    iter_collection,
+    iter_members,
+    load_collection,
+    load_members,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.system.memory import Memory, Memory_v1_7_0
+
+
+def memory_data(path):
+    return {
+        "@odata.id": path,
+        "@odata.type": "#Memory.v1_7_0.Memory",
+        "Id": path.rsplit("/", 1)[-1],
+        "CapacityMiB": 32768,
+        "Oem": {"OpenBmc": {"Location": "CPU0_DIMM_A"}},
+    }
+
+
+class FakeBmc:
+
+    def __init__(self, members_count, delay=0.0, expand=None, expand_error=None, page_size=None):
+        self.members = ["/redfish/v1/Systems/system/Memory/dimm{0}".format(i) for i in range(members_count)]
+        self.delay = delay
+        self.page_size = page_size
+        self.expand = expand
+        # Error raised for expanded request, if service advertises $expand but rejects it.
+        self.expand_error = expand_error
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, path, query_params=None, headers=None, select=None):
+        with self._lock:
+            self.requests.append((path, query_params))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            response = MagicMock()
+            if path == "/redfish/v1":
+                response.json = {"ProtocolFeaturesSupported": {"ExpandQuery": self.expand}} if self.expand else {}
+            elif path == "/redfish/v1/Systems/system/Memory" and self.page_size:
+                skip = int((query_params or {}).get("$skip", 0))
+                response.json = {"Members": [{"@odata.id": member} for member in self.members[skip:skip + self.page_size]]}
+                if skip + self.page_size < len(self.members):
+                    response.json["Members@odata.nextLink"] = "{0}?$skip={1}".format(path, skip + self.page_size)
+            elif path == "/redfish/v1/Systems/system/Memory" and query_params:
+                if self.expand_error:
+                    raise self.expand_error
+                # Last member is not inlined to check partial expansion
+                response.json = {"Members": [memory_data(member) for member in self.members[:-1]] + [
+                    {"@odata.id": self.members[-1]},
+                ]}
+            elif path == "/redfish/v1/Systems/system/Memory":
+                response.json = {"Members": [{"@odata.id": member} for member in self.members]}
+            elif path in self.members:
+                response.json = memory_data(path)
+            else:
+                raise RESTClientNotFoundError("Not found: {0}".format(path))
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestCollection:
+
+    @pytest.fixture
+    def client(self):
+        def factory(workers):
+            return RESTClient(
+                hostname="localhost",
+                port=443,
+                validate_certs=True,
+                timeout=30,
+                auth=NoAuth(),
+                collection_workers=workers,
+            )
+        return factory
+
+    @pytest.mark.parametrize("workers", [1, 4, 64])
+    def test_members_order_preserved(self, mocker, client, workers):
+        bmc = FakeBmc(32)
+        rest_client = client(workers)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        members = load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+
+        assert [m.get_id() for m in members] == ["dimm{0}".format(i) for i in range(32)]
+        assert all(isinstance(m, Memory_v1_7_0) for m in members)
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_concurrency_limited(self, mocker, client, workers):
+        bmc = FakeBmc(12, delay=0.01)
+        rest_client = client(workers)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+
+        assert bmc.max_in_flight == workers
+
+    @pytest.mark.parametrize("expand, query", [
+        ({"ExpandAll": True, "Levels": True, "MaxLevels": 6, "NoLinks": True}, {"$expand": ".($levels=1)"}),
+        ({"ExpandAll": True, "Levels": False}, {"$expand": "*"}),
+    ])
+    def test_expanded_collection(self, mocker, client, expand, query):
+        bmc = FakeBmc(8, expand=expand)
+        rest_client = client(4)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        members = load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+
+        assert [m.get_id() for m in members] == ["dimm{0}".format(i) for i in range(8)]
+        assert bmc.requests == [
+            ("/redfish/v1", None),
+            ("/redfish/v1/Systems/system/Memory", query),
+            (bmc.members[-1], None),
+        ]
+
+    def test_expand_unsupported(self, mocker, client):
+        bmc = FakeBmc(2)
+        rest_client = client(1)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+
+        assert ("/redfish/v1/Systems/system/Memory", None) in bmc.requests
+        assert len(bmc.requests) == 4
+
+    @pytest.mark.parametrize("error", [
+        RESTClientRequestError("Request finished with error: Base.1.8.QueryNotSupported", status_code=400),
+        RESTClientRequestError("Request finished with error: Not Implemented", status_code=501),
+    ])
+    def test_expand_failure_falls_back(self, mocker, client, error):
+        # Service advertises $expand, but rejects it
+        bmc = FakeBmc(2, expand={"ExpandAll": True}, expand_error=error)
+        rest_client = client(1)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        members = load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+        load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+
+        assert len(members) == 2
+        expanded_requests = [r for r in bmc.requests if r[1]]
+        assert len(expanded_requests) == 1
+
+    @pytest.mark.parametrize("error", [
+        RESTClientRequestError("Request finished with error: Internal error", status_code=500),
+        RESTClientRequestError("Request finished with error: Base.1.8.PropertyValueNotInList", status_code=400),
+    ])
+    def test_expand_error_raised(self, mocker, client, error):
+        bmc = FakeBmc(2, expand={"ExpandAll": True}, expand_error=error)
+        rest_client = client(1)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        with pytest.raises(RESTClientRequestError):
+            load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+        # Error isn't related to $expand, it's still used
+        assert rest_client.get_protocol_features()["ExpandQuery"]
+
+    def test_member_error_raised(self, mocker, client):
+        bmc = FakeBmc(4)
+        rest_client = client(4)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        with pytest.raises(RESTClientNotFoundError):
+            load_members(rest_client, bmc.members + ["/redfish/v1/Systems/system/Memory/missing"], Memory)
+
+    def test_compact_members(self, mocker, client):
+        bmc = FakeBmc(2)
+        rest_client = client(1)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        memory = load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory, compact=True)[0]
+
+        assert not hasattr(memory, "__dict__")
+        assert memory.get_id() == "dimm0"
+        assert memory.get_capacity_mib() == 32768
+        with pytest.raises(RedfishFieldNotFoundError):
+            memory.get_part_number()
+        # Fields not read by the implementation are dropped
+        assert memory._data.to_dict() == {
+            "@odata.id": "/redfish/v1/Systems/system/Memory/dimm0",
+            "@odata.type": "#Memory.v1_7_0.Memory",
+            "Id": "dimm0",
+            "CapacityMiB": 32768,
+        }
+        with pytest.raises(TypeError):
+            memory._patch({"Enabled": False})
+
+        memory.reload()
+        assert memory._data["Oem"] == {"OpenBmc": {"Location": "CPU0_DIMM_A"}}
+
+    def test_pages_followed(self, mocker, client):
+        bmc = FakeBmc(5, page_size=2)
+        rest_client = client(2)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        members = load_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+
+        assert [m.get_id() for m in members] == ["dimm{0}".format(i) for i in range(5)]
+        pages = [r[1] for r in bmc.requests if r[0] == "/redfish/v1/Systems/system/Memory"]
+        assert pages == [None, {"$skip": "2"}, {"$skip": "4"}]
+
+    def test_members_yielded_as_read(self, mocker, client):
+        bmc = FakeBmc(8, page_size=4)
+        rest_client = client(1)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        members = iter_collection(rest_client, "/redfish/v1/Systems/system/Memory", Memory)
+        assert bmc.requests == []
+        assert next(members).get_id() == "dimm0"
+        # Next page isn't requested until members of the first one are consumed
+        assert ("/redfish/v1/Systems/system/Memory", {"$skip": "4"}) not in bmc.requests
+        members.close()
+
+    def test_iter_member_error_raised(self, mocker, client):
+        bmc = FakeBmc(4)
+        rest_client = client(4)
+        mocker.patch.object(rest_client, "get", side_effect=bmc.get)
+
+        members = iter_members(rest_client, ["/redfish/v1/Systems/system/Memory/missing"] + bmc.members, Memory)
+        with pytest.raises(RESTClientNotFoundError):
+            next(members)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import RESTClientNotFoundError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.log.entry import LogEntry_v1_4_0
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.log.service import (
+    LogService,
+    parse_timestamp,
+)
+
+LOG_PATH = "/redfish/v1/Systems/system/LogServices/EventLog"
+ENTRIES_PATH = LOG_PATH + "/Entries"
+
+
+def entry_data(entry_id, minute):
+    return {
+        "@odata.id": "{0}/{1}".format(ENTRIES_PATH, entry_id),
+        "@odata.type": "#LogEntry.v1_4_0.LogEntry",
+        "Id": str(entry_id),
+        "Name": "System Event Log Entry",
+        "Created": "2022-05-12T08:{0:02d}:00+00:00".format(minute),
+        "EntryType": "Event",
+        "Severity": "OK",
+        "Message": "Entry {0}".format(entry_id),
+        "MessageId": "OpenBMC.0.1.DCPowerOn",
+        "MessageArgs": [],
+    }
+
+
+class FakeLog:
+
+    def __init__(self, entries, top_skip=True, page_size=4):
+        self.entries = entries
+        self.top_skip = top_skip
+        self.page_size = page_size
+        self.requests = []
+
+    def get(self, path, query_params=None, headers=None, select=None):
+        self.requests.append((path, query_params))
+        response = MagicMock()
+        if path == "/redfish/v1":
+            response.json = {"ProtocolFeaturesSupported": {"TopSkipQuery": self.top_skip}}
+        elif path == LOG_PATH:
+            response.json = {
+                "@odata.id": LOG_PATH,
+                "@odata.type": "#LogService.v1_1_0.LogService",
+                "Id": "EventLog",
+                "Name": "System Log Service",
+                "ServiceEnabled": True,
+                "OverWritePolicy": "WrapsWhenFull",
+            }
+        elif path == ENTRIES_PATH:
+            query_params = query_params or {}
+            skip = int(query_params.get("$skip", 0))
+            top = min(int(query_params.get("$top", self.page_size)), self.page_size)
+            response.json = {"Members": self.entries[skip:skip + top]}
+            if skip + top < len(self.entries):
+                response.json["Members@odata.nextLink"] = "{0}?$skip={1}".format(path, skip + top)
+        else:
+            raise RESTClientNotFoundError("Not found: {0}".format(path))
+        return response
+
+
+class TestLogService:
+
+    @pytest.fixture
+    def client(self):
+        return RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+
+    def load(self, mocker, client, bmc):
+        mocker.patch.object(client, "get", side_effect=bmc.get)
+        return LogService.load(client, LOG_PATH)
+
+    def test_parse_timestamp(self):
+        assert parse_timestamp("1970-01-01T00:00:10Z") == 10
+        assert parse_timestamp("1970-01-01T01:00:10.5+01:00") == 10.5
+        assert parse_timestamp("1970-01-01T00:00:10") == 10
+        with pytest.raises(ValueError):
+            parse_timestamp("yesterday")
+
+    def test_entries_paged(self, mocker, client):
+        bmc = FakeLog([entry_data(i, i) for i in range(1, 11)])
+        log_service = self.load(mocker, client, bmc)
+
+        entries = list(log_service.iter_entries(page_size=4, compact=True))
+
+        assert [e.get_id() for e in entries] == [str(i) for i in range(1, 11)]
+        assert all(isinstance(e, LogEntry_v1_4_0) for e in entries)
+        assert [r for r in bmc.requests if r[0] == ENTRIES_PATH] == [
+            (ENTRIES_PATH, {"$top": 4}),
+            (ENTRIES_PATH, {"$top": 4, "$skip": "4"}),
+            (ENTRIES_PATH, {"$top": 4, "$skip": "8"}),
+        ]
+
+    def test_entries_since_cursor(self, mocker, client):
+        bmc = FakeLog([entry_data(i, i) for i in range(1, 11)])
+        log_service = self.load(mocker, client, bmc)
+        _, cursor = list(log_service.iter_entries_since(page_size=4))[6]
+        assert cursor == {"Id": "7", "Created": "2022-05-12T08:07:00+00:00", "Position": 7}
+        del bmc.requests[:]
+
+        result = list(log_service.iter_entries_since(cursor, page_size=4))
+
+        assert [e.get_id() for e, _ in result] == ["8", "9", "10"]
+        assert result[-1][1]["Position"] == 10
+        assert bmc.requests[0] == (ENTRIES_PATH, {"$top": 4, "$skip": 6})
+
+    def test_entries_since_cursor_without_top_skip(self, mocker, client):
+        bmc = FakeLog([entry_data(i, i) for i in range(1, 11)], top_skip=False)
+        log_service = self.load(mocker, client, bmc)
+        cursor = {"Id": "7", "Created": "2022-05-12T08:07:00+00:00", "Position": 7}
+
+        result = list(log_service.iter_entries_since(cursor))
+
+        assert [e.get_id() for e, _ in result] == ["8", "9", "10"]
+        assert all(query is None or "$top" not in query for _, query in bmc.requests)
+
+    def test_entries_since_cleared_log(self, mocker, client):
+        bmc = FakeLog([entry_data(i, i) for i in range(11, 14)])
+        log_service = self.load(mocker, client, bmc)
+        cursor = {"Id": "10", "Created": "2022-05-12T08:10:00+00:00", "Position": 2}
+
+        result = list(log_service.iter_entries_since(cursor))
+
+        assert [e.get_id() for e, _ in result] == ["11", "12", "13"]
+        assert [c["Position"] for _, c in result] == [1, 2, 3]
+
+    def test_entries_since_rotated_log(self, mocker, client):
+        entries = [entry_data(9, 9), entry_data(10, 10), entry_data(11, 10), entry_data(12, 11), entry_data(13, 12)]
+        del entries[-1]["Created"]
+        bmc = FakeLog(entries)
+        log_service = self.load(mocker, client, bmc)
+        cursor = {"Id": "10", "Created": "2022-05-12T08:10:00+00:00", "Position": 7}
+
+        result = list(log_service.iter_entries_since(cursor))
+
+        # Entry created in the same second as the cursor one is kept
+        assert [e.get_id() for e, _ in result] == ["11", "12"]
+        assert [c["Position"] for _, c in result] == [3, 4]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.update.service import UpdateService
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.task.task import Task_v1_4_3
+
+TASK_DATA = {
+    "@odata.id": "/redfish/v1/TaskService/Tasks/0",
+    "@odata.type": "#Task.v1_4_3.Task",
+    "Id": "0",
+    "TaskState": "Running",
+    "TaskStatus": "OK",
+}
+
+
+class FakeResponse:
+
+    def __init__(self, json=None, headers=None):
+        self._json = json
+        self.headers = headers or {}
+
+    @property
+    def json(self):
+        if self._json is None:
+            raise ValueError("Unable to parse json")
+        return self._json
+
+
+class TestUpdateService:
+
+    @pytest.fixture
+    def client(self):
+        return RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+
+    @pytest.fixture
+    def update_service(self, client):
+        return UpdateService.from_json(client, {
+            "@odata.id": "/redfish/v1/UpdateService",
+            "@odata.type": "#UpdateService.v1_4_0.UpdateService",
+        })
+
+    def test_task_from_upload_response(self, mocker, client, update_service):
+        mocker.patch.object(client, "post", return_value=FakeResponse(TASK_DATA))
+        task = update_service.upload_image(b"image")
+        assert isinstance(task, Task_v1_4_3)
+        assert not task.is_finished()
+
+    def test_task_from_location(self, mocker, client, update_service):
+        mocker.patch.object(client, "post", return_value=FakeResponse(
+            headers={"Location": "https://localhost/redfish/v1/TaskService/Tasks/0/Monitor"},
+        ))
+        get = mocker.patch.object(client, "get", return_value=FakeResponse(dict(TASK_DATA, TaskState="Completed")))
+        task = update_service.upload_image(b"image")
+        assert task.is_finished()
+        assert get.call_args[0][0] == "/redfish/v1/TaskService/Tasks/0/Monitor"
+
+    def test_no_task(self, mocker, client, update_service):
+        mocker.patch.object(client, "post", return_value=FakeResponse({"@odata.type": "#Message.v1_0_0.Message"}))
+        assert update_service.upload_image(b"image") is None
+
+    def test_inventory_ids(self, mocker, client, update_service):
+        get = mocker.patch.object(client, "get", return_value=FakeResponse({"Members": [
+            {"@odata.id": "/redfish/v1/UpdateService/FirmwareInventory/bmc_active"},
+            {"@odata.id": "/redfish/v1/UpdateService/FirmwareInventory/1a2b3c4d"},
+        ]}))
+        assert update_service.get_firmware_inventory_ids() == ["bmc_active", "1a2b3c4d"]
+        get.assert_called_once_with("/redfish/v1/UpdateService/FirmwareInventory")
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.base import RedfishAPIObject
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.exceptions import RedfishModelVersionError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.versions import (
+    parse_odata_type,
+    register_version,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.manager import Manager, Manager_v1_9_0
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.ethernet_interface import (
+    EthernetInterface,
+    EthernetInterface_v1_4_1,
+    EthernetInterfaceMockup_v1_4_1,
+)
+
+
+class Widget(RedfishAPIObject):
+    pass
+
+
+@register_version("#Widget.v1_0_0.Widget")
+class Widget_v1_0_0(Widget):
+    pass
+
+
+@register_version("#Widget.v1_3_0.Widget", until="#Widget.v1_5_0.Widget")
+class Widget_v1_3_0(Widget):
+    pass
+
+
+class TestVersions:
+
+    @pytest.fixture
+    def client(self):
+        return RESTClient(hostname="localhost", port=443, validate_certs=True, timeout=30, auth=NoAuth())
+
+    def test_parse_odata_type(self):
+        assert parse_odata_type("#Thermal.v1_4_1.Fan") == (("Thermal", "Fan", False), (1, 4, 1))
+        assert parse_odata_type("#Manager.v1_11_0.Manager.Mockup") == (("Manager", "Manager", True), (1, 11, 0))
+        assert parse_odata_type("#PowerSupply.PowerSupply") is None
+
+    @pytest.mark.parametrize("odata_type, expected", [
+        ("#Widget.v1_0_0.Widget", Widget_v1_0_0),
+        ("#Widget.v1_2_5.Widget", Widget_v1_0_0),
+        ("#Widget.v1_3_0.Widget", Widget_v1_3_0),
+        ("#Widget.v1_4_9.Widget", Widget_v1_3_0),
+        ("#Widget.v1_5_0.Widget", Widget_v1_0_0),
+        ("#Widget.v2_0_0.Widget", None),
+        ("#Widget.v1_0_0.Widget.Mockup", None),
+        ("#Gadget.v1_0_0.Gadget", None),
+    ])
+    def test_version_ranges(self, odata_type, expected):
+        assert Widget.select_version(odata_type) is expected
+
+    def test_newer_minor_version_supported(self, client):
+        manager = Manager.from_json(client, {"@odata.id": "/redfish/v1/Managers/bmc", "@odata.type": "#Manager.v1_14_0.Manager"})
+        assert type(manager) is Manager_v1_9_0
+        assert client.schema_versions == {"#Manager.v1_14_0.Manager"}
+
+    def test_older_version_unsupported(self, client):
+        with pytest.raises(RedfishModelVersionError):
+            Manager.from_json(client, {"@odata.id": "/redfish/v1/Managers/bmc", "@odata.type": "#Manager.v1_8_0.Manager"})
+
+    def test_mockup_implementation(self, client):
+        data = {
+            "@odata.id": "/redfish/v1/Managers/bmc/EthernetInterfaces/eth0",
+            "@odata.type": "#EthernetInterface.v1_6_0.EthernetInterface",
+        }
+        assert type(EthernetInterface.from_json(client, data)) is EthernetInterface_v1_4_1
+        data["@odata.mockup"] = True
+        assert type(EthernetInterface.from_json(client, data)) is EthernetInterfaceMockup_v1_4_1
+
+    def test_unversioned_type_rejected(self):
+        with pytest.raises(ValueError):
+            register_version("#Widget.Widget")
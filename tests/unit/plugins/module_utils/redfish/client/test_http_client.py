@@ -182,6 +182,41 @@ class TestHttpClient:
         default_client.post("/testpath", body=body)
         mock.assert_called_with(**open_url_kwargs)
 
+    def test_open_url_params_with_post_file_data(self, mocker, default_client, open_url_kwargs, tmp_path):
+        mock = mocker.patch("{0}.open_url".format(default_client.__module__))
+        image_path = tmp_path / "image"
+        image_path.write_bytes(b"0123456789")
+        with open(str(image_path), "rb") as body:
+            body.seek(4)
+            open_url_kwargs.update({
+                "method": "POST",
+                "data": body,
+                "headers": {
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": "6",
+                }
+            })
+            default_client.post("/testpath", body=body)
+        mock.assert_called_with(**open_url_kwargs)
+
+    def test_open_url_params_with_post_iterator_data(self, mocker, default_client, open_url_kwargs):
+        mock = mocker.patch("{0}.open_url".format(default_client.__module__))
+        body = iter([b"chunk", b"chunk"])
+        open_url_kwargs.update({
+            "method": "POST",
+            "data": body,
+            "headers": {
+                "Content-Type": "application/octet-stream",
+                "Content-Length": "10",
+            }
+        })
+        default_client.post("/testpath", body=body, headers={"Content-Length": "10"})
+        mock.assert_called_with(**open_url_kwargs)
+
+    def test_client_fail_if_stream_length_unknown(self, default_client):
+        with pytest.raises(HTTPClientError):
+            default_client.post("/testpath", body=iter([b"chunk"]))
+
     def test_client_fail_if_body_unsuppported(self, default_client):
         with pytest.raises(HTTPClientError):
             default_client.post("/testpath", body=("unsupported", "body"))
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+import threading
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.limiter import RequestLimiter, get_limiter
+
+
+class TestRequestLimiter:
+
+    def test_max_in_flight(self):
+        limiter = RequestLimiter("bmc:443", max_in_flight=2)
+        state = {"in_flight": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def request():
+            with limiter.slot():
+                with lock:
+                    state["in_flight"] += 1
+                    state["peak"] = max(state["peak"], state["in_flight"])
+                time.sleep(0.01)
+                with lock:
+                    state["in_flight"] -= 1
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert state["peak"] == 2
+
+    def test_rate(self):
+        limiter = RequestLimiter("bmc:443", rate=100)
+        start = time.time()
+        # Burst of 100 requests, then 10 more at the rate
+        for _ in range(110):
+            with limiter.slot():
+                pass
+        assert time.time() - start >= 0.09
+
+    def test_slots_shared_through_directory(self, tmpdir):
+        # Limiters with the same directory behave as if they were in different processes
+        first = RequestLimiter("bmc:443", max_in_flight=1, directory=str(tmpdir))
+        second = RequestLimiter("bmc:443", max_in_flight=1, directory=str(tmpdir))
+        other_host = RequestLimiter("other:443", max_in_flight=1, directory=str(tmpdir))
+        acquired = threading.Event()
+
+        def request():
+            with second.slot():
+                acquired.set()
+
+        with first.slot():
+            with other_host.slot():
+                pass
+            thread = threading.Thread(target=request)
+            thread.start()
+            assert not acquired.wait(0.1)
+        assert acquired.wait(5)
+        thread.join()
+
+    def test_rate_shared_through_directory(self, tmpdir):
+        first = RequestLimiter("bmc:443", rate=1, directory=str(tmpdir))
+        second = RequestLimiter("bmc:443", rate=1, directory=str(tmpdir))
+        with first.slot():
+            pass
+        # Bucket of one token was emptied by the first limiter
+        start = time.time()
+        with second.slot():
+            pass
+        assert time.time() - start >= 0.5
+
+    def test_limiter_shared_by_host(self):
+        assert get_limiter("bmc:443", max_in_flight=2) is get_limiter("bmc:443", max_in_flight=2)
+        assert get_limiter("bmc:443", max_in_flight=2) is not get_limiter("other:443", max_in_flight=2)
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+import json
+import socket
+import threading
+
+from io import BytesIO
+
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from ansible.module_utils.six.moves.socketserver import ThreadingMixIn
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.http import HTTPClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.pool import (
+    ConnectionPool,
+    CrossOriginRedirect,
+    get_pool,
+    close_pools,
+)
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.trace import RequestTracer
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, code, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _drop(self):
+        # Request is processed, but connection is closed before the response
+        self.server.dropped += 1
+        self.close_connection = True
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.path == "/drop":
+            self._drop()
+        elif self.path == "/missing":
+            self._reply(404, {"error": "Not found"})
+        elif self.path == "/redirect":
+            self._reply(301, {}, headers={"Location": "/target"})
+        elif self.path == "/elsewhere":
+            self._reply(302, {}, headers={"Location": self.server.redirect_to})
+        else:
+            self._reply(200, {
+                "path": self.path,
+                "authorization": self.headers.get("Authorization"),
+            })
+
+    def do_POST(self):
+        self.server.connections.add(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        received = self.rfile.read(length).decode()
+        if self.path == "/drop":
+            self._drop()
+        else:
+            self._reply(200, {"received": received})
+
+
+class TestConnectionPool:
+
+    @pytest.fixture
+    def server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        server.connections = set()
+        server.dropped = 0
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        yield server
+        close_pools()
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def pool(self, server):
+        pool = ConnectionPool("http", "127.0.0.1", server.server_port, validate_certs=True)
+        yield pool
+        pool.close()
+
+    def _url(self, server, path):
+        return "http://127.0.0.1:{0}{1}".format(server.server_port, path)
+
+    def test_connection_reused(self, server, pool):
+        for _ in range(5):
+            response = pool.urlopen("GET", self._url(server, "/path"))
+            assert response.getcode() == 200
+            assert json.loads(response.read())["path"] == "/path"
+        assert len(server.connections) == 1
+
+    def test_post_body_sent(self, server, pool):
+        response = pool.urlopen("POST", self._url(server, "/path"), body=b"data")
+        assert json.loads(response.read()) == {"received": "data"}
+
+    def test_post_stream_sent(self, server, pool):
+        response = pool.urlopen("POST", self._url(server, "/path"), body=BytesIO(b"x" * 100000),
+                                headers={"Content-Length": "100000"})
+        assert json.loads(response.read()) == {"received": "x" * 100000}
+
+        chunks = (chunk for chunk in [b"da", b"ta"])
+        response = pool.urlopen("POST", self._url(server, "/path"), body=chunks, headers={"Content-Length": "4"})
+        assert json.loads(response.read()) == {"received": "data"}
+
+    def test_http_error_raised(self, server, pool):
+        with pytest.raises(HTTPError) as e:
+            pool.urlopen("GET", self._url(server, "/missing"))
+        assert e.value.code == 404
+        assert json.load(e.value) == {"error": "Not found"}
+
+    def test_same_origin_redirect_followed(self, server, pool):
+        response = pool.urlopen("GET", self._url(server, "/redirect"))
+        assert json.loads(response.read())["path"] == "/target"
+
+    def test_cross_origin_redirect(self, server, pool):
+        other = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        other.connections = set()
+        thread = threading.Thread(target=other.serve_forever)
+        thread.daemon = True
+        thread.start()
+        server.redirect_to = "http://localhost:{0}/target".format(other.server_port)
+        try:
+            with pytest.raises(CrossOriginRedirect) as e:
+                pool.urlopen("GET", self._url(server, "/elsewhere"))
+            assert e.value.location == server.redirect_to
+
+            # Client follows the redirect without pooling, as open_url does
+            client = HTTPClient(
+                hostname="http://127.0.0.1",
+                port=server.server_port,
+                validate_certs=True,
+                timeout=30,
+                auth=BasicAuth("username", "password"),
+                keep_alive=True,
+            )
+            assert client.get("/elsewhere").json["path"] == "/target"
+            assert len(other.connections) == 1
+        finally:
+            other.shutdown()
+            other.server_close()
+
+    def test_stale_connection_replaced(self, server, pool):
+        pool.urlopen("GET", self._url(server, "/path"))
+        # Simulate server closing idle connection
+        pool._idle[0].sock.shutdown(socket.SHUT_RDWR)
+        response = pool.urlopen("GET", self._url(server, "/path"))
+        assert response.getcode() == 200
+        assert response.retries == 1
+        assert "connect" in response.timings
+
+    @pytest.mark.parametrize("method, attempts", [("GET", 2), ("POST", 1)])
+    def test_only_idempotent_request_repeated(self, server, pool, method, attempts):
+        pool.urlopen("GET", self._url(server, "/path"))
+        with pytest.raises(URLError):
+            pool.urlopen(method, self._url(server, "/drop"), body=b"data")
+        assert server.dropped == attempts
+
+    def test_dropped_connection_replaced_before_post(self, server, pool):
+        pool.urlopen("GET", self._url(server, "/path"))
+        pool._idle[0].sock.shutdown(socket.SHUT_RDWR)
+        response = pool.urlopen("POST", self._url(server, "/path"), body=b"data")
+        assert json.loads(response.read())["received"] == "data"
+        assert response.retries == 0
+
+    def test_connection_error_raised(self, pool):
+        closed_port_pool = ConnectionPool("http", "127.0.0.1", 1, validate_certs=True)
+        with pytest.raises(URLError):
+            closed_port_pool.urlopen("GET", "http://127.0.0.1:1/path")
+
+    def test_pool_shared_by_server(self):
+        assert get_pool("https", "localhost", 443, True) is get_pool("https", "localhost", 443, True)
+        assert get_pool("https", "localhost", 443, True) is not get_pool("https", "localhost", 443, False)
+        close_pools()
+
+    def test_http_client_uses_pool(self, server):
+        client = HTTPClient(
+            hostname="http://127.0.0.1",
+            port=server.server_port,
+            validate_certs=True,
+            timeout=30,
+            auth=BasicAuth("username", "password"),
+            keep_alive=True,
+        )
+        for _ in range(3):
+            response = client.get("/path")
+        assert response.json["authorization"].startswith("Basic ")
+        assert len(server.connections) == 1
+
+    def test_http_client_traces_requests(self, server, tmpdir):
+        trace_file = str(tmpdir.join("trace.jsonl"))
+        client = HTTPClient(
+            hostname="http://127.0.0.1",
+            port=server.server_port,
+            validate_certs=True,
+            timeout=30,
+            auth=BasicAuth("username", "password"),
+            keep_alive=True,
+            tracer=RequestTracer(path=trace_file),
+        )
+        client.post("/path", body={"key": "value"})
+        client.get("/path", query_params={"$select": "Id"})
+        with pytest.raises(HTTPError):
+            client.get("/missing")
+
+        records = client.tracer.get_records()
+        assert [(r["method"], r["path"], r["status"]) for r in records] == [
+            ("POST", "/path", 200),
+            ("GET", "/path?%24select=Id", 200),
+            ("GET", "/missing", 404),
+        ]
+        first, second = records[:2]
+        assert first["host"] == "127.0.0.1"
+        assert first["bytes_out"] == len(json.dumps({"key": "value"}))
+        assert first["bytes_in"] > 0
+        # Connection setup is measured only for the request which opened it
+        assert all(first[field] >= 0 for field in ("dns", "connect", "first_byte", "total"))
+        assert "connect" not in second
+        assert "error" in records[2]
+        with open(trace_file) as f:
+            assert [json.loads(line) for line in f] == records
@@ -33,6 +33,12 @@ class TestResponse:
     def test_json_load(self, response):
         assert response.json == {"json": "data"}
 
+    def test_json_parsed_once(self, response, http_response_mock):
+        assert response.json is response.json
+        assert response.copy().json is not response.json
+        assert response.copy().json == response.json
+        http_response_mock.read.assert_called_once()
+
     def test_json_load_error(self, http_response_mock):
         http_response_mock.read.return_value = "Invalid"
         response = HTTPClientResponse(http_response_mock)
@@ -16,12 +16,15 @@ from io import StringIO
 from ansible.module_utils.urls import SSLValidationError, ConnectionError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.common.text.converters import to_text
-from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth, SessionAuth
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.response import HTTPClientResponse
 from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
     RESTClientRequestError,
     RESTClientNotFoundError,
     RESTClientConnectionError,
+    RESTClientUnauthorized,
 )
 
 
@@ -66,3 +69,134 @@ class TestRestClient:
         mock.side_effect = HTTPError("localhost", 404, "Bad Request Error", {}, StringIO(payload))
         with pytest.raises(RESTClientNotFoundError):
             default_client.get("/testpath")
+
+    @pytest.mark.parametrize("features, expected_query", [
+        ({"SelectQuery": True}, {"$select": "HostName,NTP/NTPServers"}),
+        ({"SelectQuery": False}, None),
+        ({}, None),
+    ])
+    def test_client_select_query(self, mocker, default_client, features, expected_query):
+        default_client._service_root = {"ProtocolFeaturesSupported": features}
+        mock = mocker.patch("{0}.RESTClient._make_request".format(default_client.__module__))
+        default_client.get("/testpath", select=["HostName", "NTP/NTPServers"])
+        mock.assert_called_once_with("/testpath", "GET", expected_query, None, None, attempt=1)
+
+
+class TestRestClientCache:
+
+    @pytest.fixture
+    def client(self):
+        return RESTClient(
+            hostname="localhost",
+            port=443,
+            validate_certs=True,
+            timeout=30,
+            auth=BasicAuth("username", "password"),
+            response_cache_size=2,
+        )
+
+    def _response(self, etag=None, status=200):
+        response = MagicMock()
+        response.status_code = status
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    def test_not_modified_served_from_cache(self, mocker, client):
+        raw_response = MagicMock()
+        raw_response.read.return_value = b'{"Id": "bmc"}'
+        raw_response.getcode.return_value = 200
+        raw_response.headers = {"ETag": '"1"'}
+        first = HTTPClientResponse(raw_response)
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = [first, HTTPError("localhost", 304, "Not Modified", {}, None), self._response(status=304)]
+
+        assert client.get("/redfish/v1/Managers/bmc") is first
+        # Cached response is returned with its own parsed body, callers may change it
+        for _ in range(2):
+            cached = client.get("/redfish/v1/Managers/bmc")
+            assert cached.json == first.json
+            assert cached.json is not first.json
+        assert mock.call_args_list[1][0][4] == {"If-None-Match": '"1"'}
+        assert client.get_cache_stats() == {"hits": 2, "misses": 1, "size": 1}
+
+    def test_response_without_etag_not_cached(self, mocker, client):
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = [self._response(), self._response()]
+        client.get("/redfish/v1/Managers/bmc")
+        client.get("/redfish/v1/Managers/bmc")
+        assert mock.call_args_list[1][0][4] is None
+        assert client.get_cache_stats() == {"hits": 0, "misses": 2, "size": 0}
+
+    def test_least_recently_used_evicted(self, mocker, client):
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = lambda *args, **kwargs: self._response(etag='"1"')
+        for path in ("/redfish/v1/A", "/redfish/v1/B", "/redfish/v1/C"):
+            client.get(path)
+        assert client._cache.get_etag("/redfish/v1/A", "") is None
+        assert client._cache.get_etag("/redfish/v1/C", "") == '"1"'
+
+    @pytest.mark.parametrize("method, path", [
+        ("patch", "/redfish/v1/Managers/bmc/NetworkProtocol"),
+        ("post", "/redfish/v1/Managers/bmc/NetworkProtocol/Actions/Reset"),
+        ("delete", "/redfish/v1/Managers/bmc"),
+    ])
+    def test_mutating_request_invalidates(self, mocker, client, method, path):
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = lambda *args, **kwargs: self._response(etag='"1"')
+        client.get("/redfish/v1/Managers/bmc/NetworkProtocol")
+        client.get("/redfish/v1/Systems/system")
+        getattr(client, method)(path)
+        assert client._cache.get_etag("/redfish/v1/Managers/bmc/NetworkProtocol", "") is None
+        assert client._cache.get_etag("/redfish/v1/Systems/system", "") == '"1"'
+
+
+class TestRestClientReauthentication:
+
+    @pytest.fixture
+    def client(self):
+        return RESTClient(
+            hostname="localhost",
+            port=443,
+            validate_certs=True,
+            timeout=30,
+            auth=SessionAuth("expired"),
+        )
+
+    def test_request_retried_with_new_auth(self, mocker, client):
+        unauthorized = HTTPError("localhost", 401, "Unauthorized", {}, None)
+        sent_auth = []
+
+        def make_request(*args, **kwargs):
+            sent_auth.append(client._auth)
+            if isinstance(client._auth, SessionAuth) and client._auth.token == "expired":
+                raise unauthorized
+            return "Response"
+
+        mocker.patch("{0}.RESTClient._make_request".format(client.__module__), side_effect=make_request)
+        reauthenticate = MagicMock(side_effect=lambda: SessionAuth("renewed"))
+        client.set_auth(SessionAuth("expired"), reauthenticate=reauthenticate)
+
+        assert client.get("/testpath") == "Response"
+        assert client.get("/testpath") == "Response"
+        reauthenticate.assert_called_once_with()
+        assert [getattr(auth, "token") for auth in sent_auth] == ["expired", "renewed", "renewed"]
+
+    def test_unauthorized_raised_without_callback(self, mocker, client):
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = HTTPError("localhost", 401, "Unauthorized", {}, None)
+        with pytest.raises(RESTClientUnauthorized):
+            client.get("/testpath")
+        assert mock.call_count == 1
+
+    def test_failed_reauthentication_raised(self, mocker, client):
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = HTTPError("localhost", 401, "Unauthorized", {}, None)
+
+        def reauthenticate():
+            # Login request is rejected too and must not call callback again
+            client.post("/redfish/v1/SessionService/Sessions")
+
+        client.set_auth(SessionAuth("expired"), reauthenticate=reauthenticate)
+        with pytest.raises(RESTClientUnauthorized):
+            client.get("/testpath")
+        assert client._auth.token == "expired"
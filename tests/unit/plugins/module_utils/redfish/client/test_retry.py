@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ssl
+import pytest
+
+from io import StringIO
+from ansible.module_utils.urls import SSLValidationError
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.retry import RetryPolicy, MAX_RETRY_DELAY
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.pool import PooledResponse
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.trace import RequestTracer
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
+    RESTClientRequestError,
+    RESTClientConnectionError,
+)
+
+
+def http_error(code, headers=None):
+    return HTTPError("https://localhost:443/testpath", code, "Error", headers or {}, StringIO(u"{}"))
+
+
+class TestRetryPolicy:
+
+    @pytest.mark.parametrize("method, error, expected", [
+        ("GET", http_error(503), True),
+        ("GET", http_error(500), False),
+        ("GET", URLError("timed out"), True),
+        ("GET", URLError(ssl.CertificateError("hostname mismatch")), False),
+        ("GET", SSLValidationError("Test"), False),
+        ("POST", http_error(503), False),
+    ])
+    def test_is_retryable(self, method, error, expected):
+        assert RetryPolicy().is_retryable(method, error) is expected
+
+    def test_get_delay(self):
+        policy = RetryPolicy(max_attempts=3, backoff=1)
+        assert 0 <= policy.get_delay(1, URLError("Test")) <= 1
+        assert 0 <= policy.get_delay(2, URLError("Test")) <= 2
+        assert policy.get_delay(3, URLError("Test")) is None
+        assert policy.get_delay(1, http_error(503, {"Retry-After": "5"})) == 5
+        assert policy.get_delay(1, http_error(503, {"retry-after": "3600"})) == MAX_RETRY_DELAY
+
+    def test_budget_per_host(self):
+        policy = RetryPolicy(budget=1)
+        assert policy.spend("bmc1")
+        assert not policy.spend("bmc1")
+        assert policy.spend("bmc2")
+
+
+class TestRESTClientRetry:
+
+    @pytest.fixture
+    def client(self, mocker):
+        client = RESTClient(
+            hostname="localhost",
+            port=443,
+            validate_certs=True,
+            timeout=30,
+            auth=BasicAuth("username", "password"),
+            retry_policy=RetryPolicy(max_attempts=3, backoff=0, budget=3),
+        )
+        wait = mocker.patch.object(client.retry_policy, "wait")
+        return client, wait
+
+    def test_transient_error_retried(self, mocker, client):
+        client, wait = client
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = [http_error(503, {"Retry-After": "2"}), URLError("Connection reset"), "Response"]
+        assert client.get("/testpath") == "Response"
+        assert mock.call_count == 3
+        assert wait.call_args_list[0][0][0] == 2
+
+    def test_attempts_exhausted(self, mocker, client):
+        client, wait = client
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = URLError("timed out")
+        with pytest.raises(RESTClientConnectionError):
+            client.get("/testpath")
+        assert mock.call_count == 3
+
+    def test_not_idempotent_request_not_retried(self, mocker, client):
+        client, wait = client
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = http_error(503)
+        with pytest.raises(RESTClientRequestError):
+            client.post("/testpath", body={"key": "value"})
+        assert mock.call_count == 1
+
+    def test_budget_exhausted(self, mocker, client):
+        client, wait = client
+        mock = mocker.patch("{0}.RESTClient._make_request".format(client.__module__))
+        mock.side_effect = URLError("timed out")
+        with pytest.raises(RESTClientConnectionError):
+            client.get("/testpath")
+        # One retry is left in the budget
+        with pytest.raises(RESTClientConnectionError):
+            client.get("/testpath")
+        assert mock.call_count == 5
+
+    def test_attempts_traced(self, mocker, client):
+        client, wait = client
+        client.tracer = RequestTracer()
+        response = PooledResponse("/testpath", 200, "OK", [("Content-Type", "application/json")], b"{}")
+        response.retries = 1
+        mocker.patch.object(client, "_open", side_effect=[http_error(503), URLError("Connection reset"), response])
+        client.get("/testpath")
+
+        records = client.tracer.get_records()
+        assert [(r["attempt"], r["retries"], r["status"]) for r in records] == [(1, 0, 503), (2, 1, None), (3, 3, 200)]
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import sys
+
+collect_ignore = []
+if sys.version_info < (3, 7):
+    # Asyncio client needs Python 3, its tests use asyncio.run added in 3.7.
+    collect_ignore.append("test_async_redfish.py")
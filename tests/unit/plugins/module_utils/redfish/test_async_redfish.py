@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import socket
+import asyncio
+import threading
+import pytest
+
+from ansible.module_utils.six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from ansible.module_utils.six.moves.socketserver import ThreadingMixIn
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth, SessionAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.async_redfish import AsyncRedfishAPI
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.async_rest import AsyncRESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
+    RESTClientNotFoundError,
+    RESTClientRequestError,
+    RESTClientConnectionError,
+)
+
+SYSTEMS_COUNT = 3
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class RedfishHandler(BaseHTTPRequestHandler):
+    """Serves a few Redfish resources over keep-alive connections with session authentication."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, data, headers=None, chunked=False):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(body), 10):
+                chunk = body[i:i + 10]
+                self.wfile.write("{0:x}\r\n".format(len(chunk)).encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def authorized(self):
+        if self.headers.get("X-Auth-Token") in self.server.tokens:
+            return True
+        self.send_json(401, {"error": "Unauthorized"})
+        return False
+
+    def drop(self):
+        # Request is processed, but connection is closed before the response
+        self.server.dropped += 1
+        self.close_connection = True
+
+    def do_POST(self):
+        body = self.read_body()
+        if self.path == "/redfish/v1/Drop":
+            self.drop()
+        elif self.server.session_error:
+            self.send_json(self.server.session_error, {"error": {"message": "Sessions error"}})
+        elif self.path == "/redfish/v1/SessionService/Sessions" and body == {"UserName": "root", "Password": "secret"}:
+            self.server.sessions_count += 1
+            token = "token{0}".format(self.server.sessions_count)
+            self.server.tokens.add(token)
+            self.send_json(201, {"Id": token}, headers={"X-Auth-Token": token})
+        else:
+            self.send_json(401, {"error": "Unauthorized"})
+
+    def do_DELETE(self):
+        if not self.authorized():
+            return
+        self.server.tokens.discard(self.path.rsplit("/", 1)[-1])
+        self.send_json(200, {})
+
+    def do_GET(self):
+        if self.path == "/redfish/v1/Drop":
+            self.drop()
+        elif self.path == "/redfish/v1":
+            features = {"ExpandQuery": {"ExpandAll": True}} if self.server.expand_error else {}
+            self.send_json(200, {"@odata.id": "/redfish/v1", "ProtocolFeaturesSupported": features})
+        elif not self.authorized():
+            return
+        elif self.path.startswith("/redfish/v1/Systems?"):
+            self.server.expand_requests += 1
+            status, message = self.server.expand_error
+            self.send_json(status, {"error": {"code": message, "message": message}})
+        elif self.path == "/redfish/v1/Systems":
+            self.send_json(200, {"Members": [
+                {"@odata.id": "/redfish/v1/Systems/{0}".format(i)} for i in range(SYSTEMS_COUNT)
+            ]})
+        elif self.path.startswith("/redfish/v1/Systems/") and self.path[-1].isdigit():
+            system_id = self.path.rsplit("/", 1)[-1]
+            self.send_json(200, {"@odata.type": "#ComputerSystem.v1_13_0.ComputerSystem", "Id": system_id})
+        elif self.path == "/redfish/v1/Managers/bmc":
+            self.send_json(200, {"Id": "bmc", "Description": "x" * 100}, chunked=True)
+        elif self.path == "/redfish/v1/Broken":
+            self.send_json(500, {"error": {"message": "Internal error"}})
+        else:
+            self.send_json(404, {"error": "Not found"})
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RedfishHandler)
+    server.tokens = set()
+    server.sessions_count = 0
+    server.dropped = 0
+    server.session_error = None
+    # Status and message of response to $expand request, service doesn't advertise $expand if not set.
+    server.expand_error = None
+    server.expand_requests = 0
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get_redfish(server):
+    return AsyncRedfishAPI("http://127.0.0.1", port=server.server_address[1], timeout=5)
+
+
+def test_session_and_collection(server):
+    async def run():
+        async with get_redfish(server) as redfish:
+            await redfish.login("root", "secret")
+            systems = await redfish.get_system_collection()
+            missing = await redfish.get_system("missing")
+            manager = await redfish.get_manager("bmc")
+            return systems, missing, manager
+
+    systems, missing, manager = asyncio.run(run())
+    assert [system["Id"] for system in systems] == [str(i) for i in range(SYSTEMS_COUNT)]
+    assert missing is None
+    assert manager["Description"] == "x" * 100
+    # Session is closed on exit
+    assert server.tokens == set()
+
+
+def test_reauthentication(server):
+    async def run():
+        redfish = get_redfish(server)
+        await redfish.login("root", "secret")
+        server.tokens.clear()
+        return await redfish.get_system("1")
+
+    assert asyncio.run(run())["Id"] == "1"
+    assert server.sessions_count == 2
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_login_without_sessions(server, status):
+    server.session_error = status
+
+    async def run():
+        async with get_redfish(server) as redfish:
+            await redfish.login("root", "secret")
+            return redfish._client._auth
+
+    assert not isinstance(asyncio.run(run()), SessionAuth)
+
+
+def test_login_error_raised(server):
+    server.session_error = 500
+
+    async def run():
+        async with get_redfish(server) as redfish:
+            await redfish.login("root", "secret")
+
+    with pytest.raises(RESTClientRequestError, match="Sessions error"):
+        asyncio.run(run())
+
+
+def test_expand_failure_falls_back(server):
+    server.expand_error = (400, "Base.1.8.QueryNotSupported")
+
+    async def run():
+        async with get_redfish(server) as redfish:
+            await redfish.login("root", "secret")
+            await redfish.get_system_collection()
+            return await redfish.get_system_collection()
+
+    assert len(asyncio.run(run())) == SYSTEMS_COUNT
+    assert server.expand_requests == 1
+
+
+def test_expand_error_raised(server):
+    server.expand_error = (500, "Internal error")
+
+    async def run():
+        async with get_redfish(server) as redfish:
+            await redfish.login("root", "secret")
+            await redfish.get_system_collection()
+
+    with pytest.raises(RESTClientRequestError, match="Internal error"):
+        asyncio.run(run())
+
+
+def test_error_mapping(server):
+    async def run():
+        server.tokens.add("token")
+        client = AsyncRESTClient("http://127.0.0.1", server.server_address[1], False, 5, SessionAuth("token"))
+        with pytest.raises(RESTClientNotFoundError):
+            await client.get("/redfish/v1/Missing")
+        with pytest.raises(RESTClientRequestError, match="Internal error"):
+            await client.get("/redfish/v1/Broken")
+        await client.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("method, attempts", [("GET", 2), ("POST", 1)])
+def test_only_idempotent_request_repeated(server, method, attempts):
+    async def run():
+        client = AsyncRESTClient("http://127.0.0.1", server.server_address[1], False, 5, NoAuth())
+        await client.get("/redfish/v1")
+        try:
+            await client.make_request("/redfish/v1/Drop", method, body={"data": 1})
+        finally:
+            await client.close()
+
+    with pytest.raises(RESTClientConnectionError):
+        asyncio.run(run())
+    assert server.dropped == attempts
+
+
+def test_connection_error():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    async def run():
+        client = AsyncRESTClient("http://127.0.0.1", port, False, 5, NoAuth())
+        await client.get("/redfish/v1")
+
+    with pytest.raises(RESTClientConnectionError):
+        asyncio.run(run())
+
+
+def test_many_sessions_in_one_loop(server):
+    async def read_systems():
+        async with get_redfish(server) as redfish:
+            await redfish.login("root", "secret")
+            return await redfish.get_system_collection()
+
+    async def run():
+        return await asyncio.gather(*[read_systems() for _ in range(50)])
+
+    results = asyncio.run(run())
+    assert len(results) == 50
+    assert all(len(systems) == SYSTEMS_COUNT for systems in results)
+    assert server.sessions_count == 50
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import stat
+import time
+import pytest
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.discovery import DiscoveryCache
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.redfish import RedfishAPI
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api import base
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.manager.manager import Manager, Manager_v1_9_0
+
+SERVICE_ROOT = {
+    "@odata.id": "/redfish/v1",
+    "@odata.type": "#ServiceRoot.v1_11_0.ServiceRoot",
+    "ProtocolFeaturesSupported": {"SelectQuery": True},
+}
+
+
+class TestDiscoveryCache:
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return DiscoveryCache(str(tmp_path / "discovery"), ttl=300)
+
+    def test_entry_reused(self, cache):
+        cache.put("https://bmc:443", SERVICE_ROOT, ["#Manager.v1_11_0.Manager"])
+        entry = cache.get("https://bmc:443")
+        assert entry["service_root"] == SERVICE_ROOT
+        assert entry["versions"] == ["#Manager.v1_11_0.Manager"]
+        assert cache.get("https://other:443") is None
+        for name in os.listdir(cache.directory):
+            assert stat.S_IMODE(os.stat(os.path.join(cache.directory, name)).st_mode) == 0o600
+
+    def test_expired_entry_ignored(self, cache):
+        cache.put("https://bmc:443", SERVICE_ROOT, created=time.time() - 301)
+        assert cache.get("https://bmc:443") is None
+
+    def test_corrupted_entry_ignored(self, cache):
+        cache.put("https://bmc:443", SERVICE_ROOT)
+        for name in os.listdir(cache.directory):
+            with open(os.path.join(cache.directory, name), "w") as f:
+                f.write("{")
+        assert cache.get("https://bmc:443") is None
+
+    def test_deleted_entry(self, cache):
+        cache.put("https://bmc:443", SERVICE_ROOT)
+        cache.delete("https://bmc:443")
+        assert cache.get("https://bmc:443") is None
+
+
+class TestRestClientDiscovery:
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return DiscoveryCache(str(tmp_path / "discovery"), ttl=300)
+
+    def _client(self, cache):
+        return RESTClient(
+            hostname="localhost",
+            port=443,
+            validate_certs=True,
+            timeout=30,
+            auth=BasicAuth("username", "password"),
+            discovery_cache=cache,
+        )
+
+    def test_service_root_requested_once_per_cache(self, mocker, cache):
+        response = MagicMock()
+        response.json = dict(SERVICE_ROOT)
+        mock = mocker.patch("{0}.RESTClient._make_request".format(RESTClient.__module__), return_value=response)
+
+        first = self._client(cache)
+        assert first.get_protocol_features() == {"SelectQuery": True}
+        first.schema_versions.add("#Manager.v1_11_0.Manager")
+        first.disable_protocol_feature("SelectQuery")
+        assert mock.call_count == 1
+
+        second = self._client(cache)
+        assert second.get_protocol_features() == {"SelectQuery": False}
+        assert second.schema_versions == {"#Manager.v1_11_0.Manager"}
+        assert mock.call_count == 1
+
+    def test_unwritable_cache_ignored(self, mocker, cache):
+        response = MagicMock()
+        response.json = dict(SERVICE_ROOT)
+        mocker.patch("{0}.RESTClient._make_request".format(RESTClient.__module__), return_value=response)
+        mocker.patch.object(cache, "put", side_effect=OSError("Read-only file system"))
+        assert self._client(cache).get_service_root() == SERVICE_ROOT
+
+    def test_cached_versions_dispatched_up_front(self, mocker, cache):
+        cache.put("https://localhost:443", SERVICE_ROOT, ["#Manager.v1_11_0.Manager"])
+        mocker.patch.object(base, "_dispatch_table", {})
+
+        redfish = RedfishAPI("localhost", discovery_cache=cache)
+        assert base._dispatch_table[(Manager, "#Manager.v1_11_0.Manager")] is Manager_v1_9_0
+
+        select_version = mocker.spy(Manager, "select_version")
+        manager = Manager.from_json(redfish._client, {
+            "@odata.id": "/redfish/v1/Managers/bmc",
+            "@odata.type": "#Manager.v1_11_0.Manager",
+        })
+        assert isinstance(manager, Manager_v1_9_0)
+        select_version.assert_not_called()
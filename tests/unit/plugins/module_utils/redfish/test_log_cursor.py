@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import pytest
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.log_cursor import LogCursorStore
+
+CURSOR = {"Id": "42", "Created": "2022-05-12T08:54:38+00:00", "Position": 42}
+
+
+class TestLogCursorStore:
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LogCursorStore(str(tmp_path / "cursors"))
+
+    def test_cursor_kept_per_server_and_log(self, store):
+        store.put("bmc:443", "/redfish/v1/Systems/system/LogServices/EventLog", CURSOR)
+        assert store.get("bmc:443", "/redfish/v1/Systems/system/LogServices/EventLog") == CURSOR
+        assert store.get("bmc:443", "/redfish/v1/Managers/bmc/LogServices/Journal") is None
+        assert store.get("other:443", "/redfish/v1/Systems/system/LogServices/EventLog") is None
+
+        store.delete("bmc:443", "/redfish/v1/Systems/system/LogServices/EventLog")
+        assert store.get("bmc:443", "/redfish/v1/Systems/system/LogServices/EventLog") is None
+
+    def test_corrupted_cursor_ignored(self, store):
+        store.put("bmc:443", "/redfish/v1/Systems/system/LogServices/EventLog", CURSOR)
+        for name in os.listdir(store.directory):
+            with open(os.path.join(store.directory, name), "w") as f:
+                f.write("{\"Id\": 42}")
+        assert store.get("bmc:443", "/redfish/v1/Systems/system/LogServices/EventLog") is None
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import BasicAuth, SessionAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.redfish import RedfishAPI
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.token_cache import SessionTokenCache
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.exceptions import (
+    RESTClientNotFoundError,
+    RESTClientRequestError,
+)
+
+
+class TestRedfishAPISession:
+
+    @pytest.fixture
+    def redfish(self, mocker):
+        redfish = RedfishAPI("localhost", auth=BasicAuth("root", "password"))
+        redfish._client._service_root = {}
+        session_response = MagicMock()
+        session_response.json = {
+            "@odata.id": "/redfish/v1/SessionService/Sessions/abc",
+            "@odata.type": "#Session.v1_3_0.Session",
+            "Id": "abc",
+            "UserName": "root",
+        }
+        session_response.headers = {"X-Auth-Token": "token"}
+        mocker.patch.object(redfish._client, "post", return_value=session_response)
+        mocker.patch.object(redfish._client, "delete")
+        return redfish
+
+    def test_login_logout(self, redfish):
+        redfish.login("root", "password")
+        assert isinstance(redfish._client._auth, SessionAuth)
+        assert redfish._client._auth.token == "token"
+
+        redfish.logout()
+        redfish._client.delete.assert_called_once_with("/redfish/v1/SessionService/Sessions/abc")
+
+    def test_cached_session_reused(self, redfish, tmp_path):
+        token_cache = SessionTokenCache(str(tmp_path), ttl=300)
+        redfish.login("root", "password", token_cache=token_cache)
+        redfish.logout()
+        redfish.login("root", "password", token_cache=token_cache)
+        redfish.logout()
+
+        assert redfish._client.post.call_count == 1
+        assert redfish._client._auth.token == "token"
+        redfish._client.delete.assert_not_called()
+
+    @pytest.mark.parametrize("error", [
+        RESTClientNotFoundError("Not found: /redfish/v1/SessionService/Sessions"),
+        RESTClientRequestError("Request finished with error: Method Not Allowed", status_code=405),
+    ])
+    def test_login_without_sessions(self, redfish, error):
+        redfish._client.post.side_effect = error
+        redfish.login("root", "password")
+        assert isinstance(redfish._client._auth, BasicAuth)
+
+    def test_login_error_raised(self, redfish):
+        redfish._client.post.side_effect = RESTClientRequestError("Request finished with error: Internal", status_code=500)
+        with pytest.raises(RESTClientRequestError):
+            redfish.login("root", "password")
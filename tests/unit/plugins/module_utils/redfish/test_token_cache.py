@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import stat
+import pytest
+
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.token_cache import SessionTokenCache
+
+
+class TestSessionTokenCache:
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return SessionTokenCache(str(tmp_path / "sessions"), ttl=300)
+
+    def test_token_reused(self, cache):
+        cache.put("https://bmc:443", "root", "password", "token", "/redfish/v1/SessionService/Sessions/1")
+        assert cache.get("https://bmc:443", "root", "password") == ("token", "/redfish/v1/SessionService/Sessions/1")
+        for name in os.listdir(cache.directory):
+            assert stat.S_IMODE(os.stat(os.path.join(cache.directory, name)).st_mode) == 0o600
+
+    @pytest.mark.parametrize("server, username, password", [
+        ("https://other:443", "root", "password"),
+        ("https://bmc:443", "admin", "password"),
+        ("https://bmc:443", "root", "wrong"),
+    ])
+    def test_token_keyed_by_server_and_credentials(self, cache, server, username, password):
+        cache.put("https://bmc:443", "root", "password", "token", "/redfish/v1/SessionService/Sessions/1")
+        assert cache.get(server, username, password) is None
+
+    def test_expired_token_ignored(self, mocker, cache):
+        cache.put("https://bmc:443", "root", "password", "token", "/redfish/v1/SessionService/Sessions/1")
+        time_mock = mocker.patch("{0}.time.time".format(SessionTokenCache.__module__))
+        time_mock.return_value = os.path.getmtime(cache.directory) + 301
+        assert cache.get("https://bmc:443", "root", "password") is None
+
+    def test_deleted_token(self, cache):
+        cache.put("https://bmc:443", "root", "password", "token", "/redfish/v1/SessionService/Sessions/1")
+        cache.delete("https://bmc:443", "root", "password")
+        assert cache.get("https://bmc:443", "root", "password") is None
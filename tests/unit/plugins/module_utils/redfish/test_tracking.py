@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2021 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+import pytest
+import threading
+
+from ansible.module_utils.six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from ansible.module_utils.six.moves.socketserver import ThreadingMixIn
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.auth import NoAuth
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.client.rest import RESTClient
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.exceptions import RedfishTimeoutError
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.tracking import Backoff, EventListener, wait_until
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class EventStreamHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.wfile.write(b"id: 1\n")
+        self.wfile.flush()
+        while not self.server.stopped.is_set():
+            if self.server.send_event.wait(0.05):
+                self.server.send_event.clear()
+                self.wfile.write(b'data: {"Events": []}\n\n')
+                self.wfile.flush()
+
+
+class TestTracking:
+
+    def test_backoff_grows_and_resets(self):
+        backoff = Backoff(initial=1, factor=2, maximum=5)
+        assert [backoff.next_delay() for _ in range(5)] == [1, 2, 4, 5, 5]
+        backoff.reset()
+        assert backoff.next_delay() == 1
+
+    def test_wait_until_returns_result(self, mocker):
+        sleep = mocker.patch("{0}.time.sleep".format(Backoff.__module__))
+        check = MagicMock(side_effect=[None, False, "image"])
+        assert wait_until(check, 60, Backoff(initial=1, factor=2, maximum=8)) == "image"
+        assert [c[0][0] for c in sleep.call_args_list] == [1, 2]
+
+    def test_wait_until_timeout(self):
+        with pytest.raises(RedfishTimeoutError):
+            wait_until(lambda: None, 0.05, Backoff(initial=0.01))
+
+    def test_event_wakes_up_poller(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), EventStreamHandler)
+        server.stopped = threading.Event()
+        server.send_event = threading.Event()
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        client = RESTClient(
+            hostname="http://127.0.0.1", port=server.server_port, validate_certs=True, timeout=30, auth=NoAuth(),
+        )
+        listener = EventListener(client, "/redfish/v1/EventService/SSE").start()
+        try:
+            deadline = time.time() + 5
+            while not listener.connected and time.time() < deadline:
+                time.sleep(0.01)
+
+            calls = []
+
+            def check():
+                calls.append(time.time())
+                if len(calls) == 1:
+                    server.send_event.set()
+                return len(calls) == 2
+
+            started = time.time()
+            assert wait_until(check, 30, Backoff(initial=10), listener=listener)
+            assert time.time() - started < 5
+
+            # Stream is closed without waiting for the next event
+            listener.close()
+            listener._thread.join(5)
+            assert not listener._thread.is_alive()
+        finally:
+            listener.close()
+            server.stopped.set()
+            server.shutdown()
+            server.server_close()
+
+    def test_listener_failure_falls_back_to_sleep(self, mocker):
+        client = MagicMock()
+        client.open_stream.side_effect = Exception("SSE not supported")
+        listener = EventListener(client, "/redfish/v1/EventService/SSE").start()
+        listener._thread.join()
+        sleep = mocker.patch("{0}.time.sleep".format(Backoff.__module__))
+        assert listener.wait(3) is False
+        sleep.assert_called_once_with(3)
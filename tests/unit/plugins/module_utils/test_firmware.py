@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import pytest
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.yadro.obmc.plugins.module_utils.redfish.api.task.task import Task_v1_4_3
+from ansible_collections.yadro.obmc.plugins.module_utils.firmware import (
+    FirmwareRollout,
+    FirmwareUpdateError,
+    FirmwareUpdater,
+    download_image,
+    plan_batches,
+)
+
+
+@pytest.mark.parametrize("hosts_count, canary_count, batch_percentage, expected", [
+    (10, 0, 100, [10]),
+    (10, 1, 100, [1, 9]),
+    (10, 2, 25, [2, 2, 2, 2, 2]),
+    (5, 0, 30, [2, 2, 1]),
+    (3, 5, 50, [3]),
+    (0, 0, 100, []),
+])
+def test_plan_batches(hosts_count, canary_count, batch_percentage, expected):
+    assert plan_batches(hosts_count, canary_count, batch_percentage) == expected
+
+
+class FakeUpdater:
+    """Fails update of hosts whose index is listed in failing."""
+
+    failing = set()
+    updated = []
+
+    def __init__(self, redfish, upload_timeout, activate_timeout, on_stage=None):
+        self.index = redfish.index
+        self.on_stage = on_stage
+
+    def check_host_powered_off(self):
+        pass
+
+    def update(self, image_path, validate_certs=True):
+        self.on_stage("uploading")
+        if self.index in self.failing:
+            raise FirmwareUpdateError(msg="Update failed", error="Image was not activated", changed=True)
+        self.updated.append(self.index)
+        image = MagicMock()
+        image.get_id.return_value = "image{0}".format(self.index)
+        return image
+
+
+class TestFirmwareRollout:
+
+    def run_rollout(self, hosts_count, failing, **kwargs):
+        FakeUpdater.failing = set(failing)
+        FakeUpdater.updated = []
+        connect = MagicMock(side_effect=lambda index: MagicMock(index=index))
+        rollout = FirmwareRollout(
+            connect, ["bmc{0}".format(i) for i in range(hosts_count)], upload_timeout=1, activate_timeout=1, **kwargs)
+        with patch("ansible_collections.yadro.obmc.plugins.module_utils.firmware.FirmwareUpdater", FakeUpdater):
+            return rollout.run("/tmp/image.bin")
+
+    def test_all_hosts_updated(self):
+        hosts = self.run_rollout(6, failing=[], max_concurrency=3, batch_percentage=50)
+        assert sorted(FakeUpdater.updated) == list(range(6))
+        assert [host["state"] for host in hosts] == ["updated"] * 6
+        assert hosts[4]["image_id"] == "image4"
+        assert hosts[4]["changed"]
+
+    def test_failed_canary_stops_rollout(self):
+        hosts = self.run_rollout(5, failing=[0], canary_count=1, max_fail_percentage=50)
+        assert FakeUpdater.updated == []
+        assert hosts[0]["state"] == "failed"
+        assert hosts[0]["stage"] == "uploading"
+        assert hosts[0]["error"] == "Image was not activated"
+        assert [host["state"] for host in hosts[1:]] == ["skipped"] * 4
+
+    def test_fail_percentage_stops_rollout(self):
+        hosts = self.run_rollout(8, failing=[3], batch_percentage=25, max_fail_percentage=10)
+        assert [host["state"] for host in hosts] == ["updated"] * 3 + ["failed"] + ["skipped"] * 4
+
+    def test_failures_within_threshold(self):
+        hosts = self.run_rollout(8, failing=[3], batch_percentage=25, max_fail_percentage=20, max_concurrency=2)
+        assert [host["state"] for host in hosts].count("updated") == 7
+
+    def test_connection_failure(self):
+        connect = MagicMock(side_effect=Exception("Connection refused"))
+        rollout = FirmwareRollout(connect, ["bmc0"], upload_timeout=1, activate_timeout=1)
+        hosts = rollout.run("/tmp/image.bin")
+        assert hosts[0]["state"] == "failed"
+        assert not hosts[0]["changed"]
+        assert hosts[0]["error"] == "Connection refused"
+
+
+def test_download_error(tmpdir):
+    response = MagicMock()
+    response.read.side_effect = IOError("No space left on device")
+    with patch("ansible_collections.yadro.obmc.plugins.module_utils.firmware.open_remote_image", return_value=response):
+        with pytest.raises(FirmwareUpdateError) as e:
+            download_image("http://images/bmc.bin", True, directory=str(tmpdir))
+    assert e.value.error == "No space left on device"
+    assert os.listdir(str(tmpdir)) == []
+
+
+@pytest.mark.parametrize("task_state", ["Exception", "Killed", "Cancelled"])
+def test_failed_task(mocker, task_state):
+    mocker.patch("ansible_collections.yadro.obmc.plugins.module_utils.redfish.tracking.time.sleep")
+    client = MagicMock()
+    task = Task_v1_4_3(client, "/redfish/v1/TaskService/Tasks/0", {"TaskState": "Running"})
+    # Empty body is read while task is still running
+    client.get.side_effect = [
+        ValueError("Unable to parse json"),
+        MagicMock(json={"TaskState": task_state, "Messages": [{"Message": "Image is corrupted"}]}, headers={}),
+    ]
+    updater = FirmwareUpdater(MagicMock(), upload_timeout=60, activate_timeout=60)
+    with pytest.raises(FirmwareUpdateError) as e:
+        updater._wait_task(task, None)
+    assert e.value.msg == "Firmware update failed: Image is corrupted"
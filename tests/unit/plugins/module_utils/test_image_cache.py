@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import io
+import hashlib
+import pytest
+
+from ansible_collections.yadro.obmc.plugins.module_utils.image_cache import (
+    ImageCache,
+    ImageChecksumError,
+    parse_checksum,
+)
+
+IMAGE = b"firmware" * 1024
+IMAGE_DIGEST = hashlib.sha256(IMAGE).hexdigest()
+
+
+class Response(io.BytesIO):
+
+    def __init__(self, data, headers):
+        super(Response, self).__init__(data)
+        self.headers = headers
+
+    def info(self):
+        return self.headers
+
+
+class Source:
+    """Serves image of a URL, head returns headers of the image currently published."""
+
+    def __init__(self, data=IMAGE, etag='"1"'):
+        self.data = data
+        self.etag = etag
+        self.fetches = 0
+
+    def get_headers(self):
+        return {"ETag": self.etag, "Content-Length": str(len(self.data))} if self.etag else {}
+
+    def __call__(self):
+        self.fetches += 1
+        return Response(self.data, self.get_headers())
+
+    def head(self):
+        return self.get_headers()
+
+
+def test_parse_checksum():
+    assert parse_checksum("sha256:" + IMAGE_DIGEST.upper()) == IMAGE_DIGEST
+    assert parse_checksum(IMAGE_DIGEST) == IMAGE_DIGEST
+    with pytest.raises(ValueError):
+        parse_checksum("md5:" + IMAGE_DIGEST)
+    with pytest.raises(ValueError):
+        parse_checksum("abc")
+
+
+class TestImageCache:
+
+    def test_image_fetched_once(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+        source = Source()
+        path = cache.get("http://images/bmc.bin", source, head=source.head)
+        assert cache.get("http://images/bmc.bin", source, head=source.head) == path
+        assert source.fetches == 1
+        assert os.path.basename(path) == IMAGE_DIGEST
+        with open(path, "rb") as f:
+            assert f.read() == IMAGE
+
+    def test_checksum_lookup(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+        source = Source()
+        path = cache.get("http://images/bmc.bin", source)
+        # Same image at another URL is found by checksum
+        assert cache.get("http://mirror/bmc.bin", source, checksum="sha256:" + IMAGE_DIGEST) == path
+        assert source.fetches == 1
+
+    def test_checksum_mismatch(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+        with pytest.raises(ImageChecksumError):
+            cache.get("http://images/bmc.bin", Source(b"corrupted"), checksum=IMAGE_DIGEST)
+        assert os.listdir(os.path.join(str(tmpdir), "objects")) == []
+        # Mismatched download is not cached for the URL
+        source = Source()
+        cache.get("http://images/bmc.bin", source, checksum=IMAGE_DIGEST)
+        assert source.fetches == 1
+
+    def test_eviction(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=len(IMAGE) + 10)
+        first = cache.get("http://images/first.bin", Source())
+        os.utime(first, (0, 0))
+        second = cache.get("http://images/second.bin", Source(b"x" * 100))
+        assert os.path.exists(second)
+        assert not os.path.exists(first)
+
+        source = Source()
+        cache.get("http://images/first.bin", source, head=source.head)
+        assert source.fetches == 1
+
+    def test_republished_image_fetched(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+        source = Source()
+        path = cache.get("http://images/bmc.bin", source, head=source.head)
+
+        source.data, source.etag = b"new firmware", '"2"'
+        new_path = cache.get("http://images/bmc.bin", source, head=source.head)
+        assert new_path != path
+        assert source.fetches == 2
+        with open(new_path, "rb") as f:
+            assert f.read() == b"new firmware"
+
+    def test_image_without_validators_fetched(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+        source = Source(etag=None)
+        cache.get("http://images/bmc.bin", source, head=source.head)
+        cache.get("http://images/bmc.bin", source, head=source.head)
+        assert source.fetches == 2
+
+    def test_leased_image_not_evicted(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=len(IMAGE) + 10)
+        with cache.lease("http://images/first.bin", Source()) as first:
+            os.utime(first, (0, 0))
+            second = cache.get("http://images/second.bin", Source(b"x" * 100))
+            assert os.path.exists(first)
+            assert os.path.exists(second)
+
+    def test_fetch_error(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+
+        def fetch():
+            raise IOError("Connection reset")
+
+        with pytest.raises(IOError):
+            cache.get("http://images/bmc.bin", fetch)
+        assert sorted(os.listdir(str(tmpdir))) == [".lock", "locks", "objects", "urls"]
+
+    def test_other_image_fetched_during_download(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+        other = Source(b"other firmware")
+
+        def fetch():
+            # Cache isn't locked while the image is downloaded, so other image can be fetched meanwhile.
+            cache.get("http://images/other.bin", other)
+            return Source()()
+
+        path = cache.get("http://images/bmc.bin", fetch)
+        assert other.fetches == 1
+        with open(path, "rb") as f:
+            assert f.read() == IMAGE
+
+    def test_stale_partial_files_removed(self, tmpdir):
+        cache = ImageCache(str(tmpdir), max_size=1024 * 1024)
+        tmpdir.join("interrupted.part").write("firmw")
+        cache.get("http://images/bmc.bin", Source())
+        assert not tmpdir.join("interrupted.part").exists()
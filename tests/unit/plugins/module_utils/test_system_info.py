@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# YADRO OpenBmc Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.yadro.obmc.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.yadro.obmc.plugins.module_utils.system_info import (
+    SystemInfoError,
+    gather_system_info,
+    get_system_info,
+)
+
+
+def test_get_system_info_without_rackmount_chassis():
+    redfish = MagicMock()
+    redfish.get_chassis_collection.return_value = []
+    with pytest.raises(SystemInfoError):
+        get_system_info(redfish)
+
+
+def test_gather_system_info():
+    def connect(index):
+        if index == 1:
+            raise Exception("Connection refused")
+        return MagicMock(index=index)
+
+    with patch(
+        "ansible_collections.yadro.obmc.plugins.module_utils.system_info.get_system_info",
+        side_effect=lambda redfish: {"Index": redfish.index},
+    ):
+        hosts = gather_system_info(connect, ["bmc0", "bmc1", "bmc2"], max_workers=2)
+
+    assert [host["hostname"] for host in hosts] == ["bmc0", "bmc1", "bmc2"]
+    assert hosts[0]["system_info"] == {"Index": 0}
+    assert hosts[0]["error"] is None
+    assert hosts[1]["system_info"] is None
+    assert hosts[1]["error"] == "Connection refused"
+    assert hosts[2]["system_info"] == {"Index": 2}
+    assert all(host["elapsed"] >= 0 for host in hosts)